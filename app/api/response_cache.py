@@ -0,0 +1,77 @@
+import time
+from threading import Lock
+from typing import Any, Optional
+
+
+class ResponseCache:
+    """
+    Small in-process TTL cache for idempotent endpoint responses.
+
+    Entries are stored with the time they were inserted and served until their
+    TTL expires; writers are expected to call invalidate() (or clear()) when
+    the underlying data changes. The cache is bounded: once max_entries is
+    reached, the oldest entry is evicted to make room.
+
+    This is deliberately process-local. Studies change rarely and every worker
+    re-populating its own copy on first read is cheaper than a shared cache
+    hop; a distributed backend can replace this class behind the same
+    interface if deployments ever need coherent invalidation across workers.
+
+    Attributes:
+        ttl_seconds (float): How long an entry stays valid after insertion.
+        max_entries (int): Maximum number of entries kept at any time.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 512):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict = {}
+        self._lock = Lock()
+
+    def get(self, key) -> Optional[Any]:
+        """
+        Return the cached value for the key, or None if absent or expired.
+
+        :param key: The cache key (any hashable).
+        :return: The cached value, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            inserted_at, value = entry
+            if time.monotonic() - inserted_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value) -> None:
+        """
+        Insert or refresh a cache entry, evicting the oldest one when full.
+
+        :param key: The cache key (any hashable).
+        :param value: The value to cache.
+        """
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                # Dicts preserve insertion order, so the first key is the oldest.
+                oldest_key = next(iter(self._entries))
+                del self._entries[oldest_key]
+            self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self, key) -> None:
+        """
+        Drop a single entry, if present.
+
+        :param key: The cache key to remove.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drop every entry.
+        """
+        with self._lock:
+            self._entries.clear()
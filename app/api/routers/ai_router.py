@@ -1,20 +1,26 @@
 from api.routers.router_base import RouterBase
 from fastapi import HTTPException
-from sqlalchemy.exc import DBAPIError
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
 
 
 class AiRouter(RouterBase):
     def configure_routes(self) -> None:
         @self.api_router.get("/new_study")
         async def generate_study_ai():
+            # Kept as a lazy import on purpose: importing study_generator pulls
+            # in the OpenAI client machinery, which this router should only pay
+            # for when the generation endpoint is actually hit.
             from generators.OpenAI.study_generator import generate_study
 
-            study = generate_study()
+            # The generation is fully async (AsyncOpenAI with concurrent
+            # waves of requests), so the event loop hosts it directly.
+            study = await generate_study()
             try:
                 self.logger.info("Attempting to insert study into the database.")
-                self.app.database.insert_study(study)
+                await run_in_threadpool(self.app.database.insert_study, study)
                 self.logger.info("Successfully inserted study into the database.")
-            except study as e:
+            except SQLAlchemyError as e:
                 self.logger.error(f"SQLAlchemy error occurred: {e}")
                 raise HTTPException(status_code=500, detail={"SQLAlchemyError": str(e)})
             except DBAPIError as e:
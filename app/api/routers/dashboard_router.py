@@ -1,16 +1,32 @@
+from fastapi.concurrency import run_in_threadpool
+
+from api.response_cache import ResponseCache
 from api.routers.router_base import RouterBase
 from database.commands.participants_queries import \
     count_participant_finished_by_study
 
 
 class DashboardRouter(RouterBase):
+    def __init__(self, api_object, tags: [], prefix="/"):
+        super().__init__(api_object, tags, prefix)
+
+        # Participant counts move while a study runs, so keep the TTL short:
+        # a hit still saves the COUNT query for bursts of dashboard refreshes.
+        self._count_cache = ResponseCache(ttl_seconds=30)
+
     def configure_routes(self) -> None:
         @self.api_router.post("/{study_id}")
         async def get_studies(study_id: str):
-            # get studies
+            cached = self._count_cache.get(study_id)
+            if cached is not None:
+                return cached
 
             db = self.app.database
-            participant_count = await count_participant_finished_by_study(db, study_id)
+            participant_count = await run_in_threadpool(
+                count_participant_finished_by_study, db, study_id
+            )
             # count the completed participants
 
-            return {"message": "Successfull", "participant_count": participant_count}
+            response = {"message": "Successfull", "participant_count": participant_count}
+            self._count_cache.set(study_id, response)
+            return response
@@ -1,5 +1,7 @@
 from api.routers.router_base import RouterBase
+from database.commands.user_db import select_user_by_id, select_user_by_username
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 
@@ -12,11 +14,15 @@ class LoginRouter(RouterBase):
     def configure_routes(self) -> None:
         @self.api_router.post("/")
         async def login(credentials: CredentialsDTO):
-            from database.commands.user_db import select_user_by_username
-
-            user = select_user_by_username(self.app.database, credentials.username)
-
-            if user and user.check_password(credentials.password):
+            # The database helpers and the bcrypt check are synchronous and would
+            # block the event loop, so they are run in the threadpool instead.
+            user = await run_in_threadpool(
+                select_user_by_username, self.app.database, credentials.username
+            )
+
+            if user and await run_in_threadpool(
+                    user.check_password, credentials.password
+            ):
                 return user
             else:
                 raise HTTPException(
@@ -26,9 +32,9 @@ class LoginRouter(RouterBase):
 
         @self.api_router.get("/{user_id}")
         async def get_user_by_id(user_id: str):
-            from database.commands.user_db import select_user_by_id
-
-            user = select_user_by_id(self.app.database, user_id)
+            user = await run_in_threadpool(
+                select_user_by_id, self.app.database, user_id
+            )
 
             if user:
                 return user
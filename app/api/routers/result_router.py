@@ -1,13 +1,23 @@
-from typing import List, Any
+from typing import List
 
-from fastapi import Body, HTTPException
+import orjson
+from fastapi import HTTPException, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import ValidationError
-from sqlalchemy import select, desc
+from sqlalchemy import desc, select
 from sqlalchemy.exc import DBAPIError, SQLAlchemyError
 
 from api.routers.router_base import RouterBase
 from database.models.db_model import StudyResultFile, Study
-from database.models.json_result_models import JSONResultModel
+from database.models.json_result_models import RESULT_VALIDATOR, JSONResultModel
+
+# Header fields that live in their own indexed columns on StudyResultFile.
+# They are stripped from the stored JSON blob on upload — the columns are
+# the single source of truth, the blob shrinks, and the two copies can
+# never drift — and merged back in front of the payload on the way out.
+_HEADER_KEYS = frozenset(
+    {"studyID", "studyModTime", "sessionID", "startTime", "endTime"}
+)
 
 
 class ResultRouter(RouterBase):
@@ -30,10 +40,94 @@ class ResultRouter(RouterBase):
         """
         self.logger.info(f"Trying to retrieve all study results for study ID: {study_id}...")
         with self.app.database.session() as session:
-            req = select(StudyResultFile).where(StudyResultFile.fk_study_ID == study_id)
-            results = session.execute(req)
-            study_results = results.scalars().all()
-            return [entry.data for entry in study_results]
+            # Only the columns are needed, so fetch them directly and skip
+            # the hydration of full StudyResultFile ORM instances.
+            req = (
+                select(
+                    StudyResultFile.fk_study_ID,
+                    StudyResultFile.study_mod_time,
+                    StudyResultFile.session_ID,
+                    StudyResultFile.study_start_time,
+                    StudyResultFile.study_end_time,
+                    StudyResultFile.data,
+                )
+                .where(StudyResultFile.fk_study_ID == study_id)
+                .execution_options(yield_per=500)
+            )
+            # The stored JSON was validated on upload, so it is rehydrated with
+            # model_construct to skip a second pydantic validation pass. The
+            # header fields come back from their columns; **data last lets
+            # rows written before the blobs were stripped override them with
+            # the identical embedded values.
+            return [
+                JSONResultModel.model_construct(
+                    **{
+                        "studyID": fk_study_id,
+                        "studyModTime": mod_time,
+                        "sessionID": session_id,
+                        "startTime": start_time,
+                        "endTime": end_time,
+                        **data,
+                    }
+                )
+                for fk_study_id, mod_time, session_id, start_time, end_time, data
+                in session.execute(req)
+            ]
+
+    def iter_study_results_json(self, study_id: str):
+        """
+        Yields the study results of a study as chunks of an encoded JSON array.
+
+        Rows are serialized one at a time with orjson while they are fetched
+        from the database, so the full result set is never materialized in
+        memory and the first bytes reach the client as soon as the first row
+        arrives.
+
+        :param study_id: The ID of the study, or a SQLAlchemy scalar
+        expression (e.g. a scalar subquery) resolving to it in the database.
+        :return: A generator of JSON byte chunks framed as {"data": [...]}.
+        """
+        # StreamingResponse drives each frame of this generator through
+        # iterate_in_threadpool, so successive chunks may resume on
+        # different worker threads. The scoped-session context manager
+        # would then remove() from the wrong thread's registry and leave
+        # the real session open with a pinned connection; a plain session
+        # from the non-scoped factory is bound to the generator itself
+        # and closed here regardless of which thread runs the frames.
+        session = self.app.database.session_maker()
+        try:
+            req = (
+                select(
+                    StudyResultFile.fk_study_ID,
+                    StudyResultFile.study_mod_time,
+                    StudyResultFile.session_ID,
+                    StudyResultFile.study_start_time,
+                    StudyResultFile.study_end_time,
+                    StudyResultFile.data,
+                )
+                .where(StudyResultFile.fk_study_ID == study_id)
+                .execution_options(yield_per=200)
+            )
+            yield b'{"data":['
+            first = True
+            for fk_study_id, mod_time, session_id, start_time, end_time, data \
+                    in session.execute(req):
+                # Merge the column-backed header fields back in front of the
+                # stored payload; **data last lets legacy rows that still
+                # embed them win with the identical values.
+                row = {
+                    "studyID": fk_study_id,
+                    "studyModTime": mod_time,
+                    "sessionID": session_id,
+                    "startTime": start_time,
+                    "endTime": end_time,
+                    **data,
+                }
+                yield (b"" if first else b",") + orjson.dumps(row)
+                first = False
+            yield b"]}"
+        finally:
+            session.close()
 
     def configure_routes(self) -> None:
         """
@@ -41,9 +135,9 @@ class ResultRouter(RouterBase):
 
         """
         @self.api_router.post("/upload")
-        async def upload_study_result(json_content: dict = Body(...)):
+        async def upload_study_result(request: Request):
             """
-            :param json_content: A dictionary containing the study result data in JSON format.
+            :param request: The incoming request; its body is the study result data in JSON format.
             :return: Dict:
                 "message" indicating whether the study result was uploaded successfully.
                 "entry_id" the primary key that the object will occupy in the database.
@@ -55,10 +149,18 @@ class ResultRouter(RouterBase):
             If any validation error, SQLAlchemy error, or DBAPI error occurs during the process, an HTTPException
             with a status code of 400 and a detailed error message is raised.
             """
+            # Decode the body once with orjson instead of letting Body(...)
+            # run it through stdlib json first; the dict is still needed as
+            # the stored blob, so it is materialized exactly once.
+            try:
+                json_content = orjson.loads(await request.body())
+            except orjson.JSONDecodeError as e:
+                raise HTTPException(status_code=422, detail=str(e)) from e
             with self.app.database.session(True) as db_session:
                 try:
-                    # 1. Create an instance of the `JSONResultModel` class using the `json_content` dictionary.
-                    study_data_json = JSONResultModel(**json_content)
+                    # 1. Validate the `json_content` dictionary with the pre-compiled
+                    # `JSONResultModel` validator.
+                    study_data_json = RESULT_VALIDATOR.validate_python(json_content)
 
                     # 2. Create an instance of the `StudyResultFile` class and populate its properties with data from
                     # the json_content` dictionary.
@@ -69,7 +171,14 @@ class ResultRouter(RouterBase):
                         session_ID=study_data_json.sessionID,
                         study_start_time=study_data_json.startTime,
                         study_end_time=study_data_json.endTime,
-                        data=json_content,
+                        # The header fields already live in the columns
+                        # above; storing them again inside the blob would
+                        # just duplicate bytes that could drift.
+                        data={
+                            k: v
+                            for k, v in json_content.items()
+                            if k not in _HEADER_KEYS
+                        },
                     )
 
                     # Uploading object to database.
@@ -88,35 +197,109 @@ class ResultRouter(RouterBase):
                     self.logger.error(f"An unexpected error occurred: {e}")
                     raise HTTPException(status_code=500, detail=str(e)) from e
 
+        @self.api_router.post("/upload_batch")
+        async def upload_study_results_batch(request: Request):
+            """
+            :param request: The incoming request; its body is a list of study results in JSON format.
+            :return: Dict:
+                "message" indicating whether the batch was uploaded successfully.
+                "entry_ids" the primary keys assigned to the inserted rows.
+
+            Batch variant of /upload for near-simultaneous submissions. Every
+            entry is validated the same way as the single upload, but all rows
+            are written with one bulk INSERT and a single commit, amortizing
+            the per-row commit cost across the batch.
+
+            :raise HTTPException
+            With status 422 if any entry fails validation (nothing is inserted),
+            400 for database errors and 500 for unexpected failures.
+            """
+            try:
+                json_contents = orjson.loads(await request.body())
+            except orjson.JSONDecodeError as e:
+                raise HTTPException(status_code=422, detail=str(e)) from e
+            rows = []
+            try:
+                for json_content in json_contents:
+                    study_data_json = RESULT_VALIDATOR.validate_python(json_content)
+                    rows.append(
+                        {
+                            "id": self.app.database.generate_uuid(),
+                            "fk_study_ID": study_data_json.studyID,
+                            "study_mod_time": study_data_json.studyModTime,
+                            "session_ID": study_data_json.sessionID,
+                            "study_start_time": study_data_json.startTime,
+                            "study_end_time": study_data_json.endTime,
+                            "data": {
+                                k: v
+                                for k, v in json_content.items()
+                                if k not in _HEADER_KEYS
+                            },
+                        }
+                    )
+            except ValidationError as e:
+                self.logger.error(f"ValidationError error occurred: {e}")
+                raise HTTPException(status_code=422, detail=str(e)) from e
+
+            if not rows:
+                return {"message": "No study results to upload", "entry_ids": []}
+
+            try:
+                with self.app.database.session(True) as db_session:
+                    StudyResultFile.bulk_create(db_session, rows)
+            except (SQLAlchemyError, DBAPIError) as e:
+                self.logger.error(f"An API error occurred: {e}")
+                raise HTTPException(status_code=400, detail=str(e)) from e
+            except Exception as e:
+                self.logger.error(f"An unexpected error occurred: {e}")
+                raise HTTPException(status_code=500, detail=str(e)) from e
+
+            return {
+                "message": "Study results uploaded successfully",
+                "entry_ids": [row["id"] for row in rows],
+            }
+
         @self.api_router.post("/get_all_from_latest")
         async def get_all_study_results_from_latest():
-            with self.app.database.session() as session:
-                req = select(Study).order_by(desc(Study.created_at)).limit(1)
-                result = session.execute(req)
-                study = result.scalars().one_or_none()
-                self.logger.info(f"Study result: {study}" if study is not None else "No Study results")
-
-                if study is None:
-                    return None
-                else:
-                    return self.get_study_results_from_db(study.id)
-
-        from pydantic import BaseModel
-        class StudyResultsAll(BaseModel):
-            data: List[JSONResultModel]
-
-        @self.api_router.post("/get_all/{study_id}")
-        async def get_all_study_results(study_id: str) -> dict[str, Any]:
+            """
+            Retrieve all study results for the most recently created study.
+
+            The latest study is resolved by the database itself through a
+            scalar subquery, so a single streamed statement replaces the
+            former lookup + fetch pair of round-trips. When no study exists
+            the subquery matches nothing and {"data": []} is returned.
+            """
+            latest_study_id = (
+                select(Study.id)
+                .order_by(desc(Study.created_at))
+                .limit(1)
+                .scalar_subquery()
+            )
+
+            # Stream the rows instead of buffering the whole result set.
+            return StreamingResponse(
+                self.iter_study_results_json(latest_study_id),
+                media_type="application/json",
+            )
+
+        @self.api_router.post("/get_all/{study_id}", response_class=ORJSONResponse)
+        async def get_all_study_results(study_id: str):
             """
             Retrieve all study results for a given study ID.
 
+            The results come straight from our own database and were validated
+            when they were uploaded, so the rows are streamed back as raw JSON
+            without being re-validated or buffered in memory.
+
             :param study_id: The ID of the study.
-            :return: A list of study results.
+            :return: A streamed JSON object of the form {"data": [...]}.
             """
             try:
                 self.logger.info(f"Trying to retrieve all study results for study ID: {study_id}...")
-                results = self.get_study_results_from_db(study_id)
-                return StudyResultsAll(data=results).model_dump()
+                return StreamingResponse(
+                    self.iter_study_results_json(study_id),
+                    media_type="application/json",
+                )
             except Exception as e:
                 self.app.logger.error(f"Failed to fetch study results: {str(e)}")
                 raise HTTPException(status_code=500, detail="Failed to fetch study results") from e
@@ -2,6 +2,8 @@ from logging import Logger
 from typing import List
 
 from fastapi import APIRouter
+from fastapi.params import Depends
+from logger import build_logger
 
 
 class RouterBase:
@@ -26,15 +28,24 @@ class RouterBase:
     logger: Logger
 
     def __init__(self, api_object, tags: [], prefix="/"):
-        self.api_router = APIRouter()
+        # The prefix and tags are baked into the APIRouter itself, so every
+        # APIRoute is materialized with its final path at decoration time.
+        # Mounting can then splice the finished route objects straight into
+        # the application instead of going through include_router, which
+        # re-creates each route and re-runs its response-model introspection.
+        self.api_router = APIRouter(prefix=prefix.rstrip("/"), tags=[prefix])
         self.prefix = prefix
         self.tags = tags
         self.app = api_object
-        from logger import build_logger
 
         # Build a logger with the class, or child class name.
         self.logger = build_logger(self.__class__.__name__, "INFO")
 
+        # Built once so every route of the router shares the same dependency
+        # identity; FastAPI's per-request cache then resolves it a single time
+        # even when several parameters or sub-dependencies reference it.
+        self.database_dependency = Depends(self.get_database, use_cache=True)
+
     def get_database(self):
         # Dependency function to retrieve the database connection
         return self.app.database
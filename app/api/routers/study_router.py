@@ -1,16 +1,21 @@
-from typing import Any, Dict, List, Tuple
+from collections import defaultdict
+from typing import Any, List, Optional, Tuple
 
 from azure.core.exceptions import AzureError, ResourceNotFoundError
-from fastapi import Body, HTTPException
-from fastapi.params import Depends
+from fastapi import Body, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ValidationError
 from sqlalchemy.exc import DBAPIError, SQLAlchemyError
 
+from api.response_cache import ResponseCache
 from api.routers.router_base import RouterBase
+from database.blob_storage import ImageBase64
 from database.commands.database_to_json import convert_study
-from database.commands.json_to_database import get_study_by_id
+from database.commands.json_to_database import (build_study_from_json,
+                                                get_study_by_id)
 from database.models.db_model import Comment, Post
-from database.models.json_study_models import JSONStudyModel
+from database.models.json_study_models import STUDY_VALIDATOR, JSONStudyModel
 
 
 class UpdateStudyModel(BaseModel):
@@ -20,6 +25,16 @@ class UpdateStudyModel(BaseModel):
 
 
 class StudyRouter(RouterBase):
+    def __init__(self, api_object, tags: [], prefix="/"):
+        super().__init__(api_object, tags, prefix)
+
+        # Serialized-response caches for the idempotent read endpoints.
+        # Studies change rarely, so hits skip the DB, the conversion to
+        # JSONStudyModel and the JSON encoding entirely; the write endpoints
+        # below invalidate the affected entries.
+        self._study_cache = ResponseCache(ttl_seconds=300)
+        self._all_cache = ResponseCache(ttl_seconds=300, max_entries=64)
+
     @staticmethod
     def sort_raw_posts_comments_dict(
             posts_comments_dict: dict[str, Any],
@@ -33,25 +48,19 @@ class StudyRouter(RouterBase):
         :return: A sorted dictionary where each key being a post id and its value is a tuple containing the post itself
         and a list of comments.
         """
-        ordered_dict = {}
         posts = posts_comments_dict["posts"]
 
+        # Group the comments by owning post in a single pass; defaultdict
+        # avoids the lookup-then-branch dance of probing the dict twice per
+        # comment.
+        comments_by_post = defaultdict(list)
         for comment in posts_comments_dict["comments"]:
-            # Checking if there is already an entry for this post in the Dictionary
-            p = ordered_dict.get(comment.fk_linked_post)
-
-            if p is None:
-                # No entry? Creating it with the post id as Key, and a tuple as value containing:
-                # The Post owning this comment, from the Posts list created earlier.
-                # A new list with the comment.
-                ordered_dict[comment.fk_linked_post] = (
-                    posts[comment.fk_linked_post],
-                    [comment],
-                )
-            else:
-                # Entry already exist? Simply append the comment to the comment list.
-                p[1].append(comment)
-        return ordered_dict
+            comments_by_post[comment.fk_linked_post].append(comment)
+
+        return {
+            post_id: (posts[post_id], comments)
+            for post_id, comments in comments_by_post.items()
+        }
 
     async def query_study_as_json(self, db_id: str) -> JSONStudyModel:
 
@@ -62,34 +71,37 @@ class StudyRouter(RouterBase):
         :return: The study as a JSONStudyModel.
         """
 
-        study = await get_study_by_id(self.app.database, db_id)
+        # The memo lives for this request only: any read re-entered below
+        # with the same arguments is served from the first result instead
+        # of issuing the query again.
+        with self.app.database.request_memo():
+            study = await run_in_threadpool(
+                get_study_by_id, self.app.database, db_id
+            )
 
-        if study is None:
-            raise HTTPException(status_code=404, detail="Study not found")
+            if study is None:
+                raise HTTPException(status_code=404, detail="Study not found")
 
-        # Getting the raw values of study's comments and posts from the database
-        raw_values = await self.app.database.query_study_comments_and_posts_raw(study.id)
+            # Getting the raw values of study's comments and posts from the database
+            raw_values = await self.app.database.query_study_comments_and_posts_raw(study.id)
 
-        # Ordering the raw values of study's comments and posts
-        ordered_dict = self.sort_raw_posts_comments_dict(raw_values)
+            # Ordering the raw values of study's comments and posts
+            ordered_dict = self.sort_raw_posts_comments_dict(raw_values)
 
-        # Converting the study object to JSONStudyModel and return it
-        return convert_study(study, ordered_dict, raw_values["sources"])
+            # Converting the study object to JSONStudyModel and return it
+            return convert_study(study, ordered_dict, raw_values["sources"])
 
     def configure_routes(self) -> None:
-        from database.blob_storage import ImageBase64
-
         @self.api_router.post("/upload-base64-image")
         async def upload_base64_image(image: ImageBase64):
             # @todo Change the way of getting the container_name and item_name. Hardcoded and too prone to errors.
-            # Exactly, this line (List Comprehension):
-            # 1) Create a list named components.
-            # 2) Split the 'path' string into a string array using'/' as separator, and iterate on its elements.
-            # 2.1) Do not keep empty string, remove empty strings resulting from leading "/".
-            # 3) Insert array entries to the list.
-            components = [component for component in image.path.split("/") if component]
-            container_name = str(components[2]).lower()
-            item_name = components[3]
+            # Only the third and fourth path segments are needed, so split just
+            # far enough instead of building a filtered list of the whole path.
+            parts = image.path.lstrip("/").split("/", 4)
+            if len(parts) < 4:
+                raise HTTPException(status_code=400, detail="Invalid image path")
+            container_name = parts[2].lower()
+            item_name = parts[3]
 
             # Attempt to upload the image given in parameter to the app blob storage.
             try:
@@ -109,9 +121,9 @@ class StudyRouter(RouterBase):
                 )
 
         @self.api_router.post("/upload")
-        async def read_json_file(json_content: dict = Body(...)):
+        async def read_json_file(request: Request):
             """
-            :param json_content: The JSON content to be processed and used to build a study.
+            :param request: The incoming request; its body is the JSON content used to build a study.
             :return: None
 
             This method reads and validates the provided JSON content, builds a study from it, and inserts the study
@@ -139,15 +151,19 @@ class StudyRouter(RouterBase):
             errors occur during the insertion process, they are logged, and an HTTPException with a status code of
             500, an error message, and the encountered exception is raised.
             """
-            from database.commands.json_to_database import \
-                build_study_from_json
-
             study_formatted = None
 
-            # Step 1: Read and validate JSON content
+            # Step 1: Read and validate JSON content. Validation, build and
+            # insert all run in the threadpool: each is pure CPU or blocking
+            # DB work, and keeping them off the event loop lets concurrent
+            # uploads overlap instead of serializing behind one ingest.
             try:
                 self.logger.info("Starting validation of JSON content.")
-                validated_content_json = JSONStudyModel(**json_content)
+                # validate_json parses the raw bytes inside pydantic-core,
+                # skipping the intermediate dict Body(...) would build.
+                validated_content_json = await run_in_threadpool(
+                    STUDY_VALIDATOR.validate_json, await request.body()
+                )
                 self.logger.info("Successfully validated JSON content.")
             except ValidationError as e:
                 self.logger.error(f"JSON validation error: {e}")
@@ -156,7 +172,9 @@ class StudyRouter(RouterBase):
             # Step 2: Build study from JSON
             try:
                 self.logger.info("Starting to build study from JSON.")
-                study_formatted = build_study_from_json(validated_content_json)
+                study_formatted = await run_in_threadpool(
+                    build_study_from_json, validated_content_json
+                )
             except ValidationError as e:
                 self.logger.error(f"Validation error while building study: {e}")
                 raise HTTPException(status_code=422, detail=e.errors())
@@ -175,8 +193,14 @@ class StudyRouter(RouterBase):
             # Step 3: Insert study into the database
             try:
                 self.logger.info("Attempting to insert study into the database.")
-                await self.app.database.insert_study(study_formatted)
+                await run_in_threadpool(
+                    self.app.database.insert_study, study_formatted
+                )
                 self.logger.info("Successfully inserted study into the database.")
+                # The new study must show up in /study/all immediately, and a
+                # re-uploaded study must not keep serving its old cached body.
+                self._study_cache.invalidate(validated_content_json.id)
+                self._all_cache.clear()
             except SQLAlchemyError as e:
                 self.logger.error(f"SQLAlchemy error occurred: {e}")
                 raise HTTPException(status_code=500, detail={"SQLAlchemyError": str(e)})
@@ -193,81 +217,124 @@ class StudyRouter(RouterBase):
             return {"message": "Success"}
 
         @self.api_router.get("/get/{study_id}")
-        async def get_study(study_id: str) -> JSONStudyModel:
+        async def get_study(study_id: str):
             """
             :param study_id: The ID of the study to retrieve.
             :return: The study converted to a JSON Object with the specified ID,
             along with associated comments, posts, and sources.
 
+            The serialized response is cached per study ID; a hit returns the
+            stored bytes without touching the database.
             """
-            return await self.query_study_as_json(study_id)
+            cached = self._study_cache.get(study_id)
+            if cached is not None:
+                return Response(content=cached, media_type="application/json")
+
+            json_study = await self.query_study_as_json(study_id)
+            # model_dump_json serializes in one pass inside pydantic-core,
+            # instead of dumping to a Python dict and re-encoding it.
+            payload = json_study.model_dump_json().encode()
+            self._study_cache.set(study_id, payload)
+            return Response(content=payload, media_type="application/json")
 
         @self.api_router.get("/all")
-        async def get_all_studies() -> List[JSONStudyModel]:
+        async def get_all_studies(limit: int = 50, cursor: Optional[str] = None):
             """
-            Get all studies from the database.
-            Used for legacy application, but is very costly.
-
-            # @todo Create a version that query one at a time to avoid a HUGE query? + pagination system + Study Light version.
-
-            :return: A list of JSONStudyModel objects representing the studies.
+            Get studies from the database as a newline-delimited JSON stream.
+
+            Results are paginated with a keyset cursor: at most `limit` studies
+            are returned, ordered by ID, and when a full page is served the
+            `next_cursor` response header carries the value to pass back as
+            `cursor` to fetch the following page. Each study is converted and
+            serialized as it is streamed, so memory stays bounded by a single
+            study instead of the whole result set.
+
+            :param limit: Maximum number of studies to return per page.
+            :param cursor: Return only studies with an ID greater than this.
+            :return: A StreamingResponse emitting one JSON study per line.
             """
-            studies = await self.app.database.get_all_studies()
-            json_studies = []
-
-            # Return an empty list when there is no Study to query.
-            if len(studies) == 0:
-                return []
-
-            # For every study that we queried, recover the posts, comments and source to build it into a single JSON
-            # file per study.
-            for study in studies:
-                raw_values = await self.app.database.query_study_comments_and_posts_raw(study.id)
-                ordered_dict = self.sort_raw_posts_comments_dict(raw_values)
-
-                # Attempt to convert the data we queried from the database to a JSON object.
-                try:
-                    self.logger.info("Starting to build study from JSON.")
-                    json_study = convert_study(
-                        study, ordered_dict, raw_values["sources"]
-                    )
-                except ValidationError as e:
-                    self.logger.error(
-                        f"Validation error while convert_study study: {e}"
-                    )
-                    raise HTTPException(status_code=422, detail=e.errors())
-                except AttributeError as e:
-                    self.logger.error(f"Attribute error during convert_study: {e}")
-                    raise HTTPException(status_code=422, detail=e)
-                except Exception as e:
-                    self.logger.error(f"Unexpected error during convert_study: {e}")
-                    raise HTTPException(
-                        status_code=500,
-                        detail={"error": "Unexpected error", "message": str(e)},
-                    )
-                else:
-                    # If no exception were raised, add this study to the list containing all the studies
-                    json_studies.append(json_study)
-                    self.logger.info("Successfully built study from JSON.")
-
-            return json_studies
+            cached = self._all_cache.get((limit, cursor))
+            if cached is not None:
+                cached_body, cached_headers = cached
+                return Response(
+                    content=cached_body,
+                    media_type="application/x-ndjson",
+                    headers=cached_headers,
+                )
+
+            studies = await run_in_threadpool(
+                self.app.database.get_all_studies_with_relations,
+                limit=limit,
+                cursor=cursor,
+            )
+
+            headers = {}
+            if studies and len(studies) == limit:
+                headers["next_cursor"] = studies[-1].id
+
+            # Every study already carries its posts, comments and sources from
+            # the eager-loaded query, so no further queries are issued here.
+            def stream_studies():
+                chunks = []
+                for study in studies:
+                    raw_values = {
+                        "posts": {post.id: post for post in study.posts},
+                        "comments": [
+                            comment
+                            for post in study.posts
+                            for comment in post.comments
+                        ],
+                        "sources": study.sources,
+                    }
+                    ordered_dict = self.sort_raw_posts_comments_dict(raw_values)
+
+                    # Attempt to convert the data we queried from the database to a JSON object.
+                    try:
+                        json_study = convert_study(
+                            study, ordered_dict, raw_values["sources"]
+                        )
+                    except ValidationError as e:
+                        self.logger.error(
+                            f"Validation error while convert_study study: {e}"
+                        )
+                        raise
+                    except Exception as e:
+                        self.logger.error(f"Unexpected error during convert_study: {e}")
+                        raise
+
+                    chunk = json_study.model_dump_json().encode() + b"\n"
+                    chunks.append(chunk)
+                    yield chunk
+
+                # Only fully streamed pages are cached, so an aborted
+                # conversion never leaves a truncated entry behind.
+                self._all_cache.set((limit, cursor), (b"".join(chunks), headers))
+
+            return StreamingResponse(
+                stream_studies(),
+                media_type="application/x-ndjson",
+                headers=headers,
+            )
 
         @self.api_router.put("/enable")
         async def update_study(values=Body(...),
-                               database=Depends(self.get_database)
-                               ) -> Dict[str, str]:
+                               database=self.database_dependency):
             try:
                 await database.update_study_enabled(values)
+                self._study_cache.invalidate(values.get("id"))
+                self._all_cache.clear()
                 return {"message": "Success"}
             except Exception as e:
                 raise HTTPException(status_code=500, detail={'error': 'Unexpected error', 'message': str(e)}) from e
 
         @self.api_router.delete("/delete/{study_id}")
         async def delete_study(study_id: str,
-                               database=Depends(self.get_database)) -> Dict[str, str]:
+                               database=self.database_dependency):
             try:
                 self.logger.info(f"Route for deletion of study {study_id}.")
-                await database.delete_study(study_id)
+                await run_in_threadpool(database.delete_study, study_id)
+                self._study_cache.invalidate(study_id)
+                self._all_cache.clear()
                 return {"message": "Success"}
             except Exception as e:
                 raise HTTPException(
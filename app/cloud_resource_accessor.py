@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from azure.core.exceptions import AzureError, HttpResponseError
 from azure.identity import DefaultAzureCredential
 from azure.keyvault.secrets import SecretClient
@@ -10,6 +12,12 @@ class CloudResourcesAccessor:
 
         self.logger = build_logger(__name__, "INFO")
 
+        # Secrets rotate on the order of days, so fetched values and the blob
+        # clients built from them are kept for the accessor's lifetime instead
+        # of paying a Key Vault HTTPS round-trip per use.
+        self._secret_cache = {}
+        self._blob_client_cache = {}
+
         # AZURE_CLIENT_ID, AZURE_CLIENT_SECRET, AZURE_TENANT_ID
         credential = DefaultAzureCredential()
         try:
@@ -42,25 +50,52 @@ class CloudResourcesAccessor:
             raise
 
     def get_secret(self, secret_name: str) -> str:
+        cached = self._secret_cache.get(secret_name)
+        if cached is not None:
+            return cached
+
         try:
             self.logger.info(f"Fetching secret '{secret_name}' from Key Vault...")
             secret = self.secret_client.get_secret(secret_name)
+            self._secret_cache[secret_name] = secret.value
             return secret.value
         except Exception as e:
             self.logger.error(f"Error retrieving secret '{secret_name}': {e}")
             raise
 
     def get_blob_service_client(self, secret_name: str) -> BlobServiceClient:
+        cached = self._blob_client_cache.get(secret_name)
+        if cached is not None:
+            return cached
+
         try:
             connection_string = self.get_secret(secret_name)
-            return BlobServiceClient.from_connection_string(connection_string)
+            client = BlobServiceClient.from_connection_string(connection_string)
+            # The client owns an HTTP pipeline and connection pool; reuse it.
+            self._blob_client_cache[secret_name] = client
+            return client
         except Exception as e:
             self.logger.error(f"Error creating BlobServiceClient: {e}")
             raise
 
 
+@lru_cache(maxsize=4)
+def get_cloud_resources_accessor(az_key_vault_url: str) -> CloudResourcesAccessor:
+    """
+    Return a shared CloudResourcesAccessor for the given vault URL.
+
+    Building the accessor resolves credentials and sets up the SecretClient
+    pipeline, so callers should go through this factory instead of
+    constructing their own instance per use.
+
+    :param az_key_vault_url: The URL of the Azure Key Vault.
+    :return: The shared accessor for that vault.
+    """
+    return CloudResourcesAccessor(az_key_vault_url)
+
+
 # Usage example
 if __name__ == "__main__":
     key_vault_url = "https://your-key-vault-name.vault.azure.net/"
-    accessor = CloudResourcesAccessor(key_vault_url)
+    accessor = get_cloud_resources_accessor(key_vault_url)
     blob_client = accessor.get_blob_service_client("BlobStorageConnectionString")
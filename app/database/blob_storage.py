@@ -1,10 +1,49 @@
+import asyncio
 import base64
+import io
+from functools import lru_cache
+from typing import Union
+
+try:
+    # pybase64 exposes the same API as the stdlib module but dispatches to a
+    # SIMD-accelerated decoder, which matters for large images on the upload
+    # hot path.
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
 
 from azure.core.exceptions import (AzureError, ResourceExistsError,
                                    ResourceNotFoundError)
-from azure.storage.blob import BlobServiceClient, PublicAccess
+from azure.storage.blob import BlobType, PublicAccess
+from azure.storage.blob.aio import BlobServiceClient
 from pydantic import BaseModel
 
+from logger import build_logger
+
+# Built once at import time: constructing a logger allocates handlers and a
+# formatter, and rebuilding it per instance would also stack duplicate
+# handlers emitting every line twice.
+_logger = build_logger("BlobStorage", "INFO")
+
+
+@lru_cache(maxsize=4)
+def _get_service_client(connection_string: str) -> BlobServiceClient:
+    """
+    Return a shared BlobServiceClient for the given connection string.
+
+    Building a client parses the connection string and sets up a credential
+    pipeline and HTTP transport, so every BlobStorage created with the same
+    credentials shares one client — and therefore one connection pool —
+    instead of sprouting competing transports per instance.
+
+    Parameters:
+        connection_string (str): The Azure storage connection string.
+
+    Returns:
+        BlobServiceClient: The shared client for that connection string.
+    """
+    return BlobServiceClient.from_connection_string(connection_string)
+
 
 class ImageBase64(BaseModel):
     """
@@ -21,6 +60,25 @@ class ImageBase64(BaseModel):
     image_data: str  # This should be a base64 encoded string
 
 
+class ImageBytes(BaseModel):
+    """
+    Represents an image as raw bytes.
+
+    Preferred over ImageBase64 for new callers that already hold the binary
+    payload (e.g. a file upload): it skips the base64 encode/decode round-trip
+    and its ~33% size overhead entirely.
+
+    Attributes:
+        path : str
+            The path of the image file.
+        image_data : bytes
+            The raw bytes of the image.
+    """
+
+    path: str
+    image_data: bytes
+
+
 class BlobStorage:
     """
     Represents a class for interacting with Azure Blob Storage.
@@ -57,21 +115,63 @@ class BlobStorage:
             AzureError: If the BlobServiceClient fails to be created.
 
         """
-        from logger import build_logger
-
-        self.logger = build_logger(self.__class__.__name__, "INFO")
+        self.logger = _logger
 
         try:
-            self.blob_service_client = BlobServiceClient.from_connection_string(connection_string)
+            self.blob_service_client = _get_service_client(connection_string)
         except AzureError as e:
             self.logger.error(f"Failed to create BlobServiceClient: {e}")
             raise
 
+        # Containers whose existence has already been confirmed. Checking a
+        # container is a round-trip against Azure, so it is done at most once
+        # per container for the lifetime of this instance; uploads that hit a
+        # vanished container drop the entry and re-verify.
+        self._verified_containers = set()
+        self._verified_lock = asyncio.Lock()
+
+    async def _ensure_container(
+            self, container_name: str, allow_anonymous_access: bool
+    ) -> None:
+        """
+        Make sure the given container exists, creating it if needed.
+
+        The result is cached in `self._verified_containers`, so the Azure
+        existence check runs only the first time a container name is seen.
+
+        Parameters:
+            container_name (str): The name of the container to verify.
+            allow_anonymous_access (bool): Whether a newly created container
+                allows anonymous blob access.
+        """
+        if container_name in self._verified_containers:
+            return
+
+        async with self._verified_lock:
+            # Another coroutine may have verified it while we waited.
+            if container_name in self._verified_containers:
+                return
+
+            try:
+                # Quick note: a container is a folder for files hosted in the blob storage.
+                # Create unconditionally rather than probing with exists()
+                # first: either way the cold path costs exactly one
+                # round-trip, where the probe-then-create dance cost two.
+                await self.blob_service_client.create_container(
+                    container_name,
+                    public_access=PublicAccess.BLOB if allow_anonymous_access else None,
+                )
+                self.logger.info(f"Created container '{container_name}'.")
+            except ResourceExistsError:
+                # The common steady-state outcome: the container was already there.
+                pass
+            self._verified_containers.add(container_name)
+
     async def upload_image_to_blob(
             self,
             container_name: str,
             item_name: str,
-            image64: ImageBase64,
+            image64: Union[ImageBase64, ImageBytes],
             overwrite_blob: bool = True,
             allow_anonymous_access: bool = True,
             verify_insert: bool = False,
@@ -82,7 +182,8 @@ class BlobStorage:
         Parameters:
             container_name (str): The name of the container in the blob storage.
             item_name (str): The name of the item (blob) to be created in the container.
-            image64 (ImageBase64): The base64-encoded image data.
+            image64 (ImageBase64 | ImageBytes): The base64-encoded image data,
+                or the raw bytes wrapped in an ImageBytes to skip the decode.
             overwrite_blob (bool): Indicates whether any already existing blob should be overwritten. Default is True.
             allow_anonymous_access (bool): Indicates whether the container allows anonymous access. Default is True.
             verify_insert (bool): Indicates whether to verify the insertion of the blob. Default is False.
@@ -110,7 +211,7 @@ class BlobStorage:
         ```
 """
 
-        assert isinstance(image64, ImageBase64), (
+        assert isinstance(image64, (ImageBase64, ImageBytes)), (
             "Trying to upload an image with a wrong format to a blob storage container."
         )
 
@@ -119,31 +220,59 @@ class BlobStorage:
             self.logger.info(
                 f"Connecting to blob storage container '{container_name}'..."
             )
+            # Check if the container exists. If not, create it. The check is
+            # cached, so after the first upload it costs no network call.
+            await self._ensure_container(container_name, allow_anonymous_access)
+
             container_client = self.blob_service_client.get_container_client(
                 container_name
             )
-
-            # Check if the container exists. If not, create it.
-            # This could eventually be called only once when the BlobStorage object is created.
-            if not container_client.exists():
-                try:
-                    # Quick note: a container is a folder for files hosted in the blob storage.
-                    self.blob_service_client.create_container(
-                        container_name,
-                        public_access=PublicAccess.BLOB if allow_anonymous_access else None,
-                    )
-                    self.logger.info(f"Created container '{container_name}'.")
-                except ResourceExistsError:
-                    # In case the resource was created in then meantime.
-                    self.logger.warning(f"Container '{container_name}' already exists.")
-
             blob_client = container_client.get_blob_client(item_name)
-            image_bytes = base64.b64decode(image64.image_data)
+            if isinstance(image64, ImageBytes):
+                # Raw-bytes fast path: nothing to decode.
+                image_bytes = image64.image_data
+            else:
+                image_data = image64.image_data
+                if isinstance(image_data, (bytes, memoryview)):
+                    # Already raw bytes: skip the str -> bytes copy and decode.
+                    image_bytes = bytes(image_data)
+                else:
+                    image_bytes = _b64.b64decode(image_data, validate=True)
+
+            # Hand the SDK a stream rather than the bytes object, so large
+            # blobs are staged as parallel blocks instead of one serial PUT
+            # over a second full in-memory copy.
+            image_stream = io.BytesIO(image_bytes)
+            image_length = len(image_bytes)
 
             # Attempt to upload the data encoded in base64.
             # Setting overwrite to false will return a ResourceExistsError instead of overwriting it.
             try:
-                blob_client.upload_blob(image_bytes, overwrite=overwrite_blob)
+                try:
+                    await blob_client.upload_blob(
+                        image_stream,
+                        overwrite=overwrite_blob,
+                        length=image_length,
+                        max_concurrency=8,
+                        blob_type=BlobType.BLOCKBLOB,
+                    )
+                except ResourceNotFoundError:
+                    # The container vanished after being verified (deleted by
+                    # another client): drop the cached entry, re-verify and
+                    # retry the upload once.
+                    self.logger.warning(
+                        f"Container '{container_name}' disappeared; re-verifying and retrying."
+                    )
+                    self._verified_containers.discard(container_name)
+                    await self._ensure_container(container_name, allow_anonymous_access)
+                    image_stream.seek(0)
+                    await blob_client.upload_blob(
+                        image_stream,
+                        overwrite=overwrite_blob,
+                        length=image_length,
+                        max_concurrency=8,
+                        blob_type=BlobType.BLOCKBLOB,
+                    )
                 self.logger.info(
                     f"Successfully uploaded blob '{item_name}' to container '{container_name}'."
                 )
@@ -151,7 +280,7 @@ class BlobStorage:
                 # @todo Link that to the debug mode of the app.
                 if verify_insert:
                     # Double check that the resource exists by using a query on the storage.
-                    if blob_client.exists():
+                    if await blob_client.exists():
                         self.logger.info(
                             f"'{item_name}' exists in container '{container_name}'."
                         )
@@ -182,6 +311,56 @@ class BlobStorage:
             self.logger.error(f"An unexpected error occurred: {e}")
             raise
 
+    async def upload_images_to_blob(
+            self,
+            container_name: str,
+            items: list,
+            *,
+            concurrency: int = 16,
+            overwrite_blob: bool = True,
+            allow_anonymous_access: bool = True,
+    ) -> list:
+        """
+        Uploads a batch of images to the same container concurrently.
+
+        The uploads are fanned out with asyncio.gather under a semaphore, so
+        a study's worth of images costs roughly one network round-trip
+        instead of one per image, while `concurrency` bounds how many
+        requests are in flight at once.
+
+        Parameters:
+            container_name (str): The name of the container in the blob storage.
+            items (list): A list of (item_name, ImageBase64) tuples to upload.
+            concurrency (int): Maximum number of uploads in flight. Default is 16.
+            overwrite_blob (bool): Indicates whether any already existing blob should be overwritten. Default is True.
+            allow_anonymous_access (bool): Indicates whether the container allows anonymous access. Default is True.
+
+        Returns:
+            list: One entry per item, in order: the uploaded blob URL on
+            success, or the exception raised for that item. A failed upload
+            does not abort the rest of the batch.
+        """
+        # Verify the container once up front so the workers all hit the
+        # cached fast path.
+        await self._ensure_container(container_name, allow_anonymous_access)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def upload_one(item_name: str, image64: ImageBase64):
+            async with semaphore:
+                return await self.upload_image_to_blob(
+                    container_name=container_name,
+                    item_name=item_name,
+                    image64=image64,
+                    overwrite_blob=overwrite_blob,
+                    allow_anonymous_access=allow_anonymous_access,
+                )
+
+        return await asyncio.gather(
+            *(upload_one(item_name, image64) for item_name, image64 in items),
+            return_exceptions=True,
+        )
+
     async def delete_container(self, container_name: str):
         """
         Delete Container Method
@@ -198,9 +377,10 @@ class BlobStorage:
             container_client = self.blob_service_client.get_container_client(container_name)
 
             # Check if the container exists.
-            if container_client.exists():
+            if await container_client.exists():
                 # Delete the container
-                self.blob_service_client.delete_container(container_name)
+                await self.blob_service_client.delete_container(container_name)
+                self._verified_containers.discard(container_name)
                 self.logger.info(f"The container {container_name} has been deleted.")
             else:
                 self.logger.warning("The container does not exist.")
@@ -229,11 +409,26 @@ class BlobStorage:
             blob_client = self.blob_service_client.get_blob_client(container_name, image_name)
 
             # Check if the blob exists
-            if blob_client.exists():
+            if await blob_client.exists():
                 # Delete the blob
-                blob_client.delete_blob()
+                await blob_client.delete_blob()
                 self.logger.info(f"The blob {image_name} has been deleted from {container_name}.")
             else:
                 self.logger.warning("The blob does not exist.")
         except Exception as e:
             self.logger.error("Could not delete the blob: ", e)
+
+    async def aclose(self):
+        """
+        Close the underlying async BlobServiceClient and its HTTP transport.
+
+        The client may be shared with other BlobStorage instances built from
+        the same connection string, so this should be called once on
+        application shutdown. The memoized client cache is dropped so a
+        later instantiation gets a fresh client.
+
+        Returns:
+            None
+        """
+        await self.blob_service_client.close()
+        _get_service_client.cache_clear()
@@ -3,7 +3,8 @@ models using Pydantic for validation. It includes detailed logging to capture an
 errors."""
 
 import logging
-from datetime import datetime
+import sys
+import time
 from typing import Tuple
 
 from pydantic import ValidationError
@@ -15,14 +16,25 @@ from database.models.db_model import (AdminUser, Comment, Post,
                                       StudyUiSettings)
 from database.models.json_study_models import (AdvancedSettingsModel,
                                                BasicSettingsModel,
-                                               JSONStudyModel, List,
-                                               PagesSettingsModel, PostModel,
-                                               ReactionFullModel,
+                                               CommentEnabledReactionsModel,
+                                               CommentModel, JSONStudyModel,
+                                               LinearRelationshipModel, List,
+                                               PagesSettingsModel,
+                                               PostEnabledReactionsModel,
+                                               PostModel, ReactionFullModel,
                                                SourcePostSelectionMethodModel,
                                                SourcesModel, UiSettingsModel)
 
 logger = logging.getLogger("conversion_logger")
 
+# Pre-bound compiled validators for the per-row conversion loops, mirroring
+# STUDY_VALIDATOR: each call goes straight into pydantic-core instead of
+# through the model_validate classmethod dispatch on every post, comment
+# and source of an exported study.
+_validate_comment = CommentModel.__pydantic_validator__.validate_python
+_validate_post = PostModel.__pydantic_validator__.validate_python
+_validate_source = SourcesModel.__pydantic_validator__.validate_python
+
 
 def convert_basic_settings_to_json(
         basic_settings: StudyBasicSettings,
@@ -53,14 +65,14 @@ def convert_ui_settings_to_json(ui_settings: StudyUiSettings) -> UiSettingsModel
             displayProgress=ui_settings.display_progress,
             displayNumberOfReactions=ui_settings.display_number_of_reactions,
             allowMultipleReactions=ui_settings.allow_multiple_reactions,
-            postEnabledReactions=UiSettingsModel.PostEnabledReactionsModel(
+            postEnabledReactions=PostEnabledReactionsModel(
                 like=ui_settings.post_enable_reaction_like,
                 dislike=ui_settings.post_enable_reaction_dislike,
                 share=ui_settings.post_enable_reaction_share,
                 flag=ui_settings.post_enable_reaction_flag,
                 skip=ui_settings.post_enable_reaction_skip,
             ),
-            commentEnabledReactions=UiSettingsModel.CommentEnabledReactionsModel(
+            commentEnabledReactions=CommentEnabledReactionsModel(
                 like=ui_settings.comment_enable_reaction_like,
                 dislike=ui_settings.comment_enable_reaction_dislike,
             ),
@@ -121,33 +133,65 @@ def convert_admin_user(admin_user: AdminUser) -> str:
         return "Unknown"
 
 
-def convert_comment(comment: Comment) -> PostModel.CommentModel:
+# Strips the quote and space characters that may surround a "type=" value.
+_STRIP_TBL = str.maketrans("", "", "' ")
+
+# (JSON-model stat name, stat-column stat key): the three stat families
+# live in one JSON column each on the Post row (two on Comment rows),
+# keyed by reaction. The JSON-model names are interned so the dicts built
+# for every post hash and compare them by pointer on the interned fast
+# path, instead of re-hashing the same five strings thousands of times
+# per export.
+_DELTA_STATS = tuple(
+    (sys.intern(json_key), db_key)
+    for json_key, db_key in (
+        ("mean", "mean"),
+        ("stdDeviation", "std_deviation"),
+        ("skewShape", "skew_shape"),
+        ("min", "min"),
+        ("max", "max"),
+    )
+)
+
+
+def _build_reactions_from_deltas(deltas: dict) -> dict:
+    """
+    Build the four per-reaction ReactionFullModel objects of one delta
+    family straight from its JSON column value, skipping the legacy
+    flat-column property shims.
+
+    Parameters:
+        deltas: dict
+            The delta JSON column value, keyed by reaction name.
+
+    Returns:
+        Mapping of reaction name to a constructed ReactionFullModel.
+    """
+    return {
+        reaction: ReactionFullModel.model_construct(
+            **{json_key: stats[db_key] for json_key, db_key in _DELTA_STATS}
+        )
+        for reaction, stats in deltas.items()
+    }
+
+
+def convert_comment(comment: Comment) -> CommentModel:
     try:
-        if (
-                comment.sourceName is None
-                or comment.message is None
-                or comment.number_of_reaction_like_mean is None
-        ):
+        counts = comment.reaction_counts
+        if comment.sourceName is None or comment.message is None or not counts:
             raise ValueError("One of the required fields is None.")
-        comment_json = PostModel.CommentModel(
-            sourceName=comment.sourceName,
-            message=comment.message,
-            numberOfReactions=PostModel.CommentModel.NumberOfReactionsLightModel(
-                like=ReactionFullModel(
-                    mean=comment.number_of_reaction_like_mean,
-                    stdDeviation=comment.number_of_reaction_like_std_deviation,
-                    skewShape=comment.number_of_reaction_like_skewShape,
-                    min=comment.number_of_reaction_like_min,
-                    max=comment.number_of_reaction_like_max,
+        # One nested dict validated in a single pass by pydantic-core, instead
+        # of running the per-field validator chain of every sub-model
+        # constructor separately. The export only carries the like/dislike
+        # groups, matching the legacy flat-column output.
+        comment_json = _validate_comment(
+            {
+                "sourceName": comment.sourceName,
+                "message": comment.message,
+                "numberOfReactions": _build_reactions_from_deltas(
+                    {"like": counts["like"], "dislike": counts["dislike"]}
                 ),
-                dislike=ReactionFullModel(
-                    mean=comment.number_of_reaction_dislike_mean,
-                    stdDeviation=comment.number_of_reaction_dislike_std_deviation,
-                    skewShape=comment.number_of_reaction_dislike_skew_shape,
-                    min=comment.number_of_reaction_dislike_min,
-                    max=comment.number_of_reaction_dislike_max,
-                ),
-            ),
+            }
         )
     except ValidationError as e:
         logger.error(f"Validation error in convert_comment: {e}")
@@ -159,7 +203,9 @@ def convert_comment(comment: Comment) -> PostModel.CommentModel:
         return comment_json
 
 
-def convert_one_post(post_comment: Tuple[Post, List[Comment]]) -> PostModel:
+def convert_one_post(
+        post_comment: Tuple[Post, List[Comment]], post_id: str = None
+) -> PostModel:
     """
     Takes a tuple that contains a Post object and a list of Comment objects.
     It converts the Post object and its associated comments into a PostModel object.
@@ -167,6 +213,9 @@ def convert_one_post(post_comment: Tuple[Post, List[Comment]]) -> PostModel:
     Parameters:
         post_comment: Tuple[Post, List[Comment]]
             A tuple containing a Post object and the list its Comment.
+        post_id: str
+            Optional ID to use in the JSON instead of the Post's own; lets
+            callers renumber posts without mutating the ORM row.
 
     Returns:
         PostModel: JSON format object representing the converted Post.
@@ -178,117 +227,30 @@ def convert_one_post(post_comment: Tuple[Post, List[Comment]]) -> PostModel:
         post = post_comment[0]
         comments = post_comment[1]
 
-        post_content: PostModel.ContentModel
-        # Set the 'content' to a ContentModel if the entry contains "type=". This means we upload an object.
+        # Set the 'content' to a ContentModel if the entry starts with "type=". This means we upload an object.
         # This is not an ideal solution but was needed to stay compatible with the legacy application.
-        if "type=" in post.content:
-            # We create the object, and set the type to the file extension by removing the "type=" part.
-            post_content = PostModel.ContentModel(type=post.content.split("=")[1])
-            # Sanitize string not keeping '.
-            post_content.type = post_content.type.replace("'", "")
-            # Sanitize string not keeping space.
-            post_content.type = post_content.type.replace(" ", "")
+        if post.content.startswith("type="):
+            # Keep the file extension after "type=", sanitized of quotes and
+            # spaces in one translate pass instead of split + two replaces.
+            post_content = {"type": post.content[5:].translate(_STRIP_TBL)}
         # Otherwise the content is a string.
         else:
-            # noinspection PyTypeChecker
             post_content = post.content
 
-        post_json = PostModel(
-            id=post.id,
-            headline=post.headline,
-            content=post_content,
-            isTrue=post.is_true,
-            changesToFollowers=PostModel.ChangesToFollowersModel(
-                like=ReactionFullModel(
-                    mean=post.changes_to_follower_on_like_mean,
-                    stdDeviation=post.changes_to_follower_on_like_std_deviation,
-                    skewShape=post.changes_to_follower_on_like_skewShape,
-                    min=post.changes_to_follower_on_like_min,
-                    max=post.changes_to_follower_on_like_max
-                ),
-                dislike=ReactionFullModel(
-                    mean=post.changes_to_follower_on_dislike_mean,
-                    stdDeviation=post.changes_to_follower_on_dislike_std_deviation,
-                    skewShape=post.changes_to_follower_on_dislike_skewShape,
-                    min=post.changes_to_follower_on_dislike_min,
-                    max=post.changes_to_follower_on_dislike_max
-                ),
-                share=ReactionFullModel(
-                    mean=post.changes_to_follower_on_share_mean,
-                    stdDeviation=post.changes_to_follower_on_share_std_deviation,
-                    skewShape=post.changes_to_follower_on_share_skewShape,
-                    min=post.changes_to_follower_on_share_min,
-                    max=post.changes_to_follower_on_share_max
-                ),
-                flag=ReactionFullModel(
-                    mean=post.changes_to_follower_on_flag_mean,
-                    stdDeviation=post.changes_to_follower_on_flag_std_deviation,
-                    skewShape=post.changes_to_follower_on_flag_skewShape,
-                    min=post.changes_to_follower_on_flag_min,
-                    max=post.changes_to_follower_on_flag_max
-                ),
-            ),
-            changesToCredibility=PostModel.ChangesToCredibilityModel(
-                like=ReactionFullModel(
-                    mean=post.changes_to_credibility_on_like_mean,
-                    stdDeviation=post.changes_to_credibility_on_like_std_deviation,
-                    skewShape=post.changes_to_credibility_on_like_skewShape,
-                    min=post.changes_to_credibility_on_like_min,
-                    max=post.changes_to_credibility_on_like_max
-                ),
-                dislike=ReactionFullModel(
-                    mean=post.changes_to_credibility_on_dislike_mean,
-                    stdDeviation=post.changes_to_credibility_on_dislike_std_deviation,
-                    skewShape=post.changes_to_credibility_on_dislike_skewShape,
-                    min=post.changes_to_credibility_on_dislike_min,
-                    max=post.changes_to_credibility_on_dislike_max
-                ),
-                share=ReactionFullModel(
-                    mean=post.changes_to_credibility_on_share_mean,
-                    stdDeviation=post.changes_to_credibility_on_share_std_deviation,
-                    skewShape=post.changes_to_credibility_on_share_skewShape,
-                    min=post.changes_to_credibility_on_share_min,
-                    max=post.changes_to_credibility_on_share_max
-                ),
-                flag=ReactionFullModel(
-                    mean=post.changes_to_credibility_on_flag_mean,
-                    stdDeviation=post.changes_to_credibility_on_flag_std_deviation,
-                    skewShape=post.changes_to_credibility_on_flag_skewShape,
-                    min=post.changes_to_credibility_on_flag_min,
-                    max=post.changes_to_credibility_on_flag_max
-                ),
-            ),
-            numberOfReactions=PostModel.NumberOfReactionsModel(
-                like=ReactionFullModel(
-                    mean=post.number_of_reactions_on_like_mean,
-                    stdDeviation=post.number_of_reactions_on_like_std_deviation,
-                    skewShape=post.number_of_reactions_on_like_skewShape,
-                    min=post.number_of_reactions_on_like_min,
-                    max=post.number_of_reactions_on_like_max
-                ),
-                dislike=ReactionFullModel(
-                    mean=post.number_of_reactions_on_dislike_mean,
-                    stdDeviation=post.number_of_reactions_on_dislike_std_deviation,
-                    skewShape=post.number_of_reactions_on_dislike_skewShape,
-                    min=post.number_of_reactions_on_dislike_min,
-                    max=post.number_of_reactions_on_dislike_max
-                ),
-                share=ReactionFullModel(
-                    mean=post.number_of_reactions_on_share_mean,
-                    stdDeviation=post.number_of_reactions_on_share_std_deviation,
-                    skewShape=post.number_of_reactions_on_share_skewShape,
-                    min=post.number_of_reactions_on_share_min,
-                    max=post.number_of_reactions_on_share_max
-                ),
-                flag=ReactionFullModel(
-                    mean=post.number_of_reactions_on_share_mean,
-                    stdDeviation=post.number_of_reactions_on_share_std_deviation,
-                    skewShape=post.number_of_reactions_on_share_skewShape,
-                    min=post.number_of_reactions_on_share_min,
-                    max=post.number_of_reactions_on_share_max
-                ),
-            ),
-            comments=[convert_comment(c) for c in comments],
+        # The whole post is validated as one nested dict so pydantic-core
+        # walks the tree in a single pass instead of dispatching a
+        # constructor-plus-validator chain per sub-model.
+        post_json = _validate_post(
+            {
+                "id": post_id if post_id is not None else post.id,
+                "headline": post.headline,
+                "content": post_content,
+                "isTrue": post.is_true,
+                "changesToFollowers": _build_reactions_from_deltas(post.follower_deltas),
+                "changesToCredibility": _build_reactions_from_deltas(post.credibility_deltas),
+                "numberOfReactions": _build_reactions_from_deltas(post.reaction_counts),
+                "comments": [convert_comment(c) for c in comments],
+            }
         )
     except ValidationError as e:
         logger.error(f"Validation error in convert_one_post: {e}")
@@ -306,7 +268,7 @@ def convert_post_selection_method(
     try:
         sps_method = SourcePostSelectionMethodModel(
             type=post_selection_method.type,
-            linearRelationship=SourcePostSelectionMethodModel.LinearRelationshipModel(
+            linearRelationship=LinearRelationshipModel(
                 slope=post_selection_method.linear_relationship_slope,
                 intercept=post_selection_method.linear_relationship_intercept,
             ),
@@ -339,35 +301,37 @@ def convert_sources(sources: List[Source], study: Study) -> List[SourcesModel]:
         source_id: int = 0
         for source in sources:
             source_id = source_id + 1
-            source_json = SourcesModel(
-                id=f"S{source_id}",  # source.id,
-                linked_study_id=study.id,
-                file_name=source.file_name,
-                name=source.name,
-                avatar=SourcesModel.AvatarModel(type=source.avatar.type)
-                if source.avatar is not None
-                else None,
-                style=SourcesModel.StyleModel(
-                    backgroundColor="#8fd186",
-                )
-                if source.avatar is not None
-                else None,
-                maxPosts=source.max_posts if source.max_posts > 0 else -1,
-                followers=SourcesModel.FollowersModel(
-                    mean=source.followers_mean,
-                    stdDeviation=source.followers_std_deviation,
-                    skewShape=source.followers_skew_shape,
-                    min=0,
-                    max=250,
-                ),
-                credibility=SourcesModel.CredibilityModel(
-                    mean=source.credibility_mean,
-                    stdDeviation=source.credibility_std_deviation,
-                    skewShape=source.credibility_skew_shape,
-                    min=0,
-                    max=100,
-                ),
-                truePostPercentage=source.true_post_percentage,
+            # Same single-pass validation as convert_one_post: one nested dict
+            # handed to pydantic-core instead of one constructor per sub-model.
+            source_json = _validate_source(
+                {
+                    "id": f"S{source_id}",  # source.id,
+                    "linked_study_id": study.id,
+                    "file_name": source.file_name,
+                    "name": source.name,
+                    "avatar": {"type": source.avatar.type}
+                    if source.avatar is not None
+                    else None,
+                    "style": {"backgroundColor": "#8fd186"}
+                    if source.avatar is not None
+                    else None,
+                    "maxPosts": source.max_posts if source.max_posts > 0 else -1,
+                    "followers": {
+                        "mean": source.followers_mean,
+                        "stdDeviation": source.followers_std_deviation,
+                        "skewShape": source.followers_skew_shape,
+                        "min": 0,
+                        "max": 250,
+                    },
+                    "credibility": {
+                        "mean": source.credibility_mean,
+                        "stdDeviation": source.credibility_std_deviation,
+                        "skewShape": source.credibility_skew_shape,
+                        "min": 0,
+                        "max": 100,
+                    },
+                    "truePostPercentage": source.true_post_percentage,
+                }
             )
             res.append(source_json)
     except ValidationError as e:
@@ -384,12 +348,13 @@ def convert_study(
         study_version=1,
 ) -> JSONStudyModel:
     try:
-        post_id: int = 0
-        converted_posts = []
-        for elem in posts_comments.values():
-            post_id = post_id + 1
-            elem[0].id = f"P{post_id}"
-            converted_posts.append(convert_one_post(elem))
+        # The renumbered ID is passed to convert_one_post instead of being
+        # written onto the ORM row, so a live session does not see the posts
+        # as dirty and schedule a useless flush on the next commit.
+        converted_posts = [
+            convert_one_post(elem, post_id=f"P{i}")
+            for i, elem in enumerate(posts_comments.values(), 1)
+        ]
 
         converted_sources = convert_sources(sources, study)
 
@@ -400,7 +365,9 @@ def convert_study(
             authorName=convert_admin_user(study.created_by)
             if study.fk_created_by is not None
             else "None",
-            lastModifiedTime=int(datetime.now().timestamp()),
+            # time.time() gives the same epoch seconds as
+            # datetime.now().timestamp() without building a datetime object.
+            lastModifiedTime=int(time.time()),
             enabled=study.enabled,
             basicSettings=convert_basic_settings_to_json(study.basic_settings),
             uiSettings=convert_ui_settings_to_json(study.ui_settings),
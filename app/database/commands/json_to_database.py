@@ -2,15 +2,105 @@
 (JSONStudyModel). The generated components can be used to construct a Study object and its related objects such as
 posts, comments, sources, avatars, and styles. This Study object can then be inserted in the database"""
 
-from typing import List, Union
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Iterator, List
+from uuid import uuid4
+
+from sqlalchemy import bindparam, lambda_stmt, select
+from sqlalchemy.orm import joinedload, selectinload
 
 from database.database import Database
-from database.models.db_model import (Avatar, Comment, Post,
-                                      PostSelectionMethod, Source, SourceStyle,
-                                      Study, StudyAdvancedSettings,
+from database.models.db_model import (PostSelectionMethod, Study,
+                                      StudyAdvancedSettings,
                                       StudyBasicSettings, StudyPagesSettings,
                                       StudyUiSettings)
-from database.models.json_study_models import JSONStudyModel, PostModel
+from database.models.json_study_models import (CommentModel,
+                                               JSONStudyModel, PostModel)
+
+
+@dataclass(slots=True)
+class SourceBundle:
+    """A source row grouped with its avatar and style rows."""
+
+    source: dict
+    avatar: dict
+    style: dict
+
+
+@dataclass(slots=True)
+class PostBundle:
+    """A post row grouped with its comment rows."""
+
+    post: dict
+    comments: List[dict]
+
+
+def _new_id() -> str:
+    """
+    Generate a row UUID as the CHAR(36) string the ID columns store.
+
+    Local binding of uuid4 rather than Database.generate_uuid: the builders
+    below call this once per row, and a study ingest generates tens of
+    thousands of IDs, so the module/class attribute-chain lookup is worth
+    skipping.
+    """
+    return str(uuid4())
+
+
+# Precomputed (source getter, ORM column) pairs for the settings tables.
+# The attrgetters resolve dotted paths once at import instead of each
+# generator rebuilding the same camelCase -> snake_case kwargs per call.
+def _settings_map(*pairs: tuple) -> tuple:
+    return tuple((attrgetter(src), dst) for src, dst in pairs)
+
+
+_BASIC_SETTINGS_MAP = _settings_map(
+    ("name", "name"),
+    ("description", "description"),
+    ("prompt", "prompt"),
+    ("length", "length"),
+    ("requireComments", "require_comments"),
+    ("requireReactions", "require_reactions"),
+    ("requireIdentification", "require_identification"),
+)
+_ADVANCED_SETTINGS_MAP = _settings_map(
+    ("minimumCommentLength", "minimum_comment_length"),
+    ("promptDelaySeconds", "prompt_delay_seconds"),
+    ("reactDelaySeconds", "react_delay_seconds"),
+    ("genCompletionCode", "gen_completion_code"),
+    ("completionCodeDigits", "completion_code_digits"),
+    ("genRandomDefaultAvatars", "gen_random_default_avatars"),
+)
+_UI_SETTINGS_MAP = _settings_map(
+    ("displayPostsInFeed", "display_posts_in_feed"),
+    ("displayFollowers", "display_followers"),
+    ("displayCredibility", "display_credibility"),
+    ("displayProgress", "display_progress"),
+    ("displayNumberOfReactions", "display_number_of_reactions"),
+    ("allowMultipleReactions", "allow_multiple_reactions"),
+    ("commentEnabledReactions.like", "comment_enable_reaction_like"),
+    ("commentEnabledReactions.dislike", "comment_enable_reaction_dislike"),
+    ("postEnabledReactions.like", "post_enable_reaction_like"),
+    ("postEnabledReactions.dislike", "post_enable_reaction_dislike"),
+    ("postEnabledReactions.share", "post_enable_reaction_share"),
+    ("postEnabledReactions.flag", "post_enable_reaction_flag"),
+    ("postEnabledReactions.skip", "post_enable_reaction_skip"),
+)
+_PAGES_SETTINGS_MAP = _settings_map(
+    ("preIntro", "pre_intro"),
+    ("preIntroDelaySeconds", "pre_intro_delay_seconds"),
+    ("rules", "rules"),
+    ("rulesDelaySeconds", "rules_delay_seconds"),
+    ("postIntro", "post_intro"),
+    ("postIntroDelaySeconds", "post_intro_delay_seconds"),
+    ("debrief", "debrief"),
+)
+
+
+def _build_settings(cls, src, mapping: tuple):
+    """Instantiate a settings ORM row from a Pydantic sub-model via its map."""
+    return cls(id=_new_id(), **{dst: getter(src) for getter, dst in mapping})
 
 
 def generate_basic_settings_from_json(study_json: JSONStudyModel) -> StudyBasicSettings:
@@ -18,17 +108,9 @@ def generate_basic_settings_from_json(study_json: JSONStudyModel) -> StudyBasicS
     :param study_json: JSONStudyModel object containing study configuration in JSON format
     :return: StudyBasicSettings object containing basic settings extracted from the study_json
     """
-    basic_settings = StudyBasicSettings(
-        id=Database.generate_uuid(),
-        name=study_json.basicSettings.name,
-        description=study_json.basicSettings.description,
-        prompt=study_json.basicSettings.prompt,
-        length=study_json.basicSettings.length,
-        require_comments=study_json.basicSettings.requireComments,
-        require_reactions=study_json.basicSettings.requireReactions,
-        require_identification=study_json.basicSettings.requireIdentification,
+    return _build_settings(
+        StudyBasicSettings, study_json.basicSettings, _BASIC_SETTINGS_MAP
     )
-    return basic_settings
 
 
 def generate_advanced_settings_from_json(
@@ -40,16 +122,9 @@ def generate_advanced_settings_from_json(
     :return: The advanced settings generated from the JSON study model.
     :rtype: StudyAdvancedSettings
     """
-    advanced_settings = StudyAdvancedSettings(
-        id=Database.generate_uuid(),
-        minimum_comment_length=study_json.advancedSettings.minimumCommentLength,
-        prompt_delay_seconds=study_json.advancedSettings.promptDelaySeconds,
-        react_delay_seconds=study_json.advancedSettings.reactDelaySeconds,
-        gen_completion_code=study_json.advancedSettings.genCompletionCode,
-        completion_code_digits=study_json.advancedSettings.completionCodeDigits,
-        gen_random_default_avatars=study_json.advancedSettings.genRandomDefaultAvatars,
+    return _build_settings(
+        StudyAdvancedSettings, study_json.advancedSettings, _ADVANCED_SETTINGS_MAP
     )
-    return advanced_settings
 
 
 def generate_ui_settings_from_json(study_json: JSONStudyModel) -> StudyUiSettings:
@@ -57,23 +132,7 @@ def generate_ui_settings_from_json(study_json: JSONStudyModel) -> StudyUiSetting
     :param study_json: A JSONStudyModel object representing the study data
     :return: A StudyUiSettings object generated from the study_json
     """
-    ui_settings = StudyUiSettings(
-        id=Database.generate_uuid(),
-        display_posts_in_feed=study_json.uiSettings.displayPostsInFeed,
-        display_followers=study_json.uiSettings.displayFollowers,
-        display_credibility=study_json.uiSettings.displayCredibility,
-        display_progress=study_json.uiSettings.displayProgress,
-        display_number_of_reactions=study_json.uiSettings.displayNumberOfReactions,
-        allow_multiple_reactions=study_json.uiSettings.allowMultipleReactions,
-        comment_enable_reaction_like=study_json.uiSettings.commentEnabledReactions.like,
-        comment_enable_reaction_dislike=study_json.uiSettings.commentEnabledReactions.dislike,
-        post_enable_reaction_like=study_json.uiSettings.postEnabledReactions.like,
-        post_enable_reaction_dislike=study_json.uiSettings.postEnabledReactions.dislike,
-        post_enable_reaction_share=study_json.uiSettings.postEnabledReactions.share,
-        post_enable_reaction_flag=study_json.uiSettings.postEnabledReactions.flag,
-        post_enable_reaction_skip=study_json.uiSettings.postEnabledReactions.skip,
-    )
-    return ui_settings
+    return _build_settings(StudyUiSettings, study_json.uiSettings, _UI_SETTINGS_MAP)
 
 
 def generate_pages_settings_from_json(study_json: JSONStudyModel) -> StudyPagesSettings:
@@ -81,17 +140,9 @@ def generate_pages_settings_from_json(study_json: JSONStudyModel) -> StudyPagesS
     :param study_json: JSONStudyModel object containing study settings
     :return: StudyPagesSettings object generated from study_json
     """
-    pages_settings = StudyPagesSettings(
-        id=Database.generate_uuid(),
-        pre_intro=study_json.pagesSettings.preIntro,
-        pre_intro_delay_seconds=study_json.pagesSettings.preIntroDelaySeconds,
-        rules=study_json.pagesSettings.rules,
-        rules_delay_seconds=study_json.pagesSettings.rulesDelaySeconds,
-        post_intro=study_json.pagesSettings.postIntro,
-        post_intro_delay_seconds=study_json.pagesSettings.postIntroDelaySeconds,
-        debrief=study_json.pagesSettings.debrief,
+    return _build_settings(
+        StudyPagesSettings, study_json.pagesSettings, _PAGES_SETTINGS_MAP
     )
-    return pages_settings
 
 
 def generate_posts_selection_methods_from_json(
@@ -103,7 +154,7 @@ def generate_posts_selection_methods_from_json(
 
     """
     post_selection_methods = PostSelectionMethod(
-        id=Database.generate_uuid(),
+        id=_new_id(),
         type=study_json.sourcePostSelectionMethod.type,
         linear_relationship_slope=study_json.sourcePostSelectionMethod.linearRelationship.slope,
         linear_relationship_intercept=study_json.sourcePostSelectionMethod.linearRelationship.intercept,
@@ -142,276 +193,326 @@ def generate_study_with_fk(
     return study
 
 
-def generate_avatar(source_avatar):
-    return Avatar(
-        id=Database.generate_uuid(),
-        type=source_avatar.type,
-    )
+def generate_avatar(source_avatar) -> dict:
+    return {
+        "id": _new_id(),
+        "type": source_avatar.type,
+    }
 
 
-def generate_style(source_style):
-    return SourceStyle(
-        id=Database.generate_uuid(),
-        background_color=source_style.backgroundColor,
-    )
+def generate_style(source_style) -> dict:
+    return {
+        "id": _new_id(),
+        "background_color": source_style.backgroundColor,
+    }
 
 
 def get_avatar_id_for_source():
-    return Database.generate_uuid()
+    return _new_id()
 
 
 def generate_sources_as_dict(
         study_json: JSONStudyModel,
-) -> List[dict[str, Union[Source, Avatar, SourceStyle]]]:
+) -> Iterator[SourceBundle]:
     """
     Generate all the sources from the JSONStudyModel object.
     Create new avatar and new style for each of them.
     ID of avatar and style are generated and inserted into each source as Foreign Key.
     :param study_json: A JSON model representing a study.
-    :return: A list of dictionaries containing information about each source, including the source itself, its avatar,
-    and style. {'source', 'avatar', 'style'}
+    :return: An iterator of SourceBundle objects grouping each source with
+    its avatar and style, yielded lazily so the consumer can stream them
+    into batched inserts without materializing the whole list.
     """
-    result = []
-
     for source in study_json.sources:
         avatar = generate_avatar(source.avatar)
         style = generate_style(source.style)
-        s = Source(
-            id=Database.generate_uuid(),
-            name=source.name,
-            max_posts=source.maxPosts,
-            true_post_percentage=source.truePostPercentage,
-            followers=500,
-            followers_mean=source.followers.mean,
-            followers_std_deviation=source.followers.stdDeviation,
-            followers_skew_shape=source.followers.skewShape,
-            credibility=500,
-            credibility_mean=source.credibility.mean,
-            credibility_std_deviation=source.credibility.stdDeviation,
-            credibility_skew_shape=source.credibility.skewShape,
-            fk_avatar=avatar.id,
-            fk_style=style.id,
-        )
-        result.append({"source": s, "avatar": avatar, "style": style})
-
-    return result
+        s = {
+            "id": _new_id(),
+            "name": source.name,
+            "max_posts": source.maxPosts,
+            "true_post_percentage": source.truePostPercentage,
+            "followers": 500,
+            "followers_mean": source.followers.mean,
+            "followers_std_deviation": source.followers.stdDeviation,
+            "followers_skew_shape": source.followers.skewShape,
+            "credibility": 500,
+            "credibility_mean": source.credibility.mean,
+            "credibility_std_deviation": source.credibility.stdDeviation,
+            "credibility_skew_shape": source.credibility.skewShape,
+            "fk_avatar": avatar["id"],
+            "fk_style": style["id"],
+        }
+        yield SourceBundle(source=s, avatar=avatar, style=style)
 
 
 def generate_sources_as_lists(
         study_json: JSONStudyModel, linked_study: Study
-) -> {List[Source], List[Avatar], List[SourceStyle]}:
+) -> dict[str, List[dict]]:
+    """
+    Generate the sources of a study as lists of plain column-value dicts,
+    ready to be handed to a bulk INSERT.
+
+    Sources sharing the same avatar type or style background colour reuse
+    one avatar/style row instead of inserting a fresh copy per source, so
+    studies drawing on a small palette emit far fewer rows.
+    """
     avatars = []
     sources = []
     source_styles = []
+    avatar_cache: dict = {}
+    style_cache: dict = {}
     for source in study_json.sources:
         # We generate avatar and style here, because we need their ID.
-        avatar = generate_avatar(source.avatar) if source.avatar is not None else None
-
-        style = generate_style(source.style)
-
-        s = Source(
-            id=Database.generate_uuid(),
-            file_name=source.id,
-            name=source.name,
-            max_posts=source.maxPosts,
-            true_post_percentage=source.truePostPercentage,
-            followers=500,
-            followers_mean=source.followers.mean,
-            followers_std_deviation=source.followers.stdDeviation,
-            followers_skew_shape=source.followers.skewShape,
-            credibility=500,
-            credibility_mean=source.credibility.mean,
-            credibility_std_deviation=source.credibility.stdDeviation,
-            credibility_skew_shape=source.credibility.skewShape,
-            fk_avatar=avatar.id if avatar is not None else None,
-            fk_style=style.id,
-            fk_linked_study=linked_study.id,
-        )
+        # Cache hits reuse the already-generated row and its ID.
+        if source.avatar is not None:
+            avatar = avatar_cache.get(source.avatar.type)
+            if avatar is None:
+                avatar = generate_avatar(source.avatar)
+                avatar_cache[source.avatar.type] = avatar
+                avatars.append(avatar)
+        else:
+            avatar = None
+
+        style = style_cache.get(source.style.backgroundColor)
+        if style is None:
+            style = generate_style(source.style)
+            style_cache[source.style.backgroundColor] = style
+            source_styles.append(style)
+
+        s = {
+            "id": _new_id(),
+            "file_name": source.id,
+            "name": source.name,
+            "max_posts": source.maxPosts,
+            "true_post_percentage": source.truePostPercentage,
+            "followers": 500,
+            "followers_mean": source.followers.mean,
+            "followers_std_deviation": source.followers.stdDeviation,
+            "followers_skew_shape": source.followers.skewShape,
+            "credibility": 500,
+            "credibility_mean": source.credibility.mean,
+            "credibility_std_deviation": source.credibility.stdDeviation,
+            "credibility_skew_shape": source.credibility.skewShape,
+            "fk_avatar": avatar["id"] if avatar is not None else None,
+            "fk_style": style["id"],
+            "fk_linked_study": linked_study.id,
+        }
         sources.append(s)
-        avatars.append(avatar)
-        source_styles.append(style)
 
     return {"sources": sources, "avatars": avatars, "styles": source_styles}
 
 
-def build_one_post(post: PostModel, linked_study_id: str) -> Post:
-    """
-    Build a database Posts object with the provided Pydantic Object.
+# The reactions of a stat block. Each of the three stat families is
+# stored as one JSON column on the Post row, keyed by reaction name;
+# the table carries the (column name, model attribute) pairs.
+_REACTIONS = ("like", "dislike", "share", "flag")
+_DELTA_BLOCKS = (
+    ("follower_deltas", "changesToFollowers"),
+    ("credibility_deltas", "changesToCredibility"),
+    ("reaction_counts", "numberOfReactions"),
+)
 
-    :param post: The PostsModel Pydantic object containing the data for the new Post.
-    :param linked_study_id: ID of the linked study.
-    :return: The newly created database Posts object.
-    """
 
-    # We need to check the type, because legacy app use either an object for image,
-    # or str for text in the same field. Plus the field can be Optional.
-    if post.content is None:
-        p_content = ""
-    else:
-        p_content = (
-            str(post.content.type)
-            if isinstance(post.content, PostModel)
-            else str(post.content)
-        )
+# The five stats of a number-with-range group as (JSON key, model
+# attribute) pairs.
+_DELTA_STATS = (
+    ("mean", "mean"),
+    ("std_deviation", "stdDeviation"),
+    ("skew_shape", "skewShape"),
+    ("min", "min"),
+    ("max", "max"),
+)
 
-    return Post(
-        id=Database.generate_uuid(),
-        fk_linked_study=linked_study_id,
-        headline=post.headline,
-        content=p_content,
-        is_true=post.isTrue,
-        changes_to_follower_on_like_mean=post.changesToFollowers.like.mean,
-        changes_to_follower_on_like_std_deviation=post.changesToFollowers.like.stdDeviation,
-        changes_to_follower_on_like_skewShape=post.changesToFollowers.like.skewShape,
-        changes_to_follower_on_like_min=post.changesToFollowers.like.min,
-        changes_to_follower_on_like_max=post.changesToFollowers.like.max,
-        changes_to_follower_on_dislike_mean=post.changesToFollowers.dislike.mean,
-        changes_to_follower_on_dislike_std_deviation=post.changesToFollowers.dislike.stdDeviation,
-        changes_to_follower_on_dislike_skewShape=post.changesToFollowers.dislike.skewShape,
-        changes_to_follower_on_dislike_max=post.changesToFollowers.dislike.max,
-        changes_to_follower_on_share_mean=post.changesToFollowers.share.mean,
-        changes_to_follower_on_share_std_deviation=post.changesToFollowers.share.stdDeviation,
-        changes_to_follower_on_share_skewShape=post.changesToFollowers.share.skewShape,
-        changes_to_follower_on_share_min=post.changesToFollowers.share.min,
-        changes_to_follower_on_share_max=post.changesToFollowers.share.max,
-        changes_to_follower_on_flag_mean=post.changesToFollowers.flag.mean,
-        changes_to_follower_on_flag_std_deviation=post.changesToFollowers.flag.stdDeviation,
-        changes_to_follower_on_flag_skewShape=post.changesToFollowers.flag.skewShape,
-        changes_to_follower_on_flag_min=post.changesToFollowers.flag.min,
-        changes_to_follower_on_flag_max=post.changesToFollowers.flag.max,
-        changes_to_credibility_on_like_mean=post.changesToCredibility.like.mean,
-        changes_to_credibility_on_like_std_deviation=post.changesToCredibility.like.stdDeviation,
-        changes_to_credibility_on_like_skewShape=post.changesToCredibility.like.skewShape,
-        changes_to_credibility_on_like_min=post.changesToCredibility.like.min,
-        changes_to_credibility_on_like_max=post.changesToCredibility.like.max,
-        changes_to_credibility_on_dislike_mean=post.changesToCredibility.dislike.mean,
-        changes_to_credibility_on_dislike_std_deviation=post.changesToCredibility.dislike.stdDeviation,
-        changes_to_credibility_on_dislike_skewShape=post.changesToCredibility.dislike.skewShape,
-        changes_to_credibility_on_dislike_min=post.changesToCredibility.dislike.min,
-        changes_to_credibility_on_dislike_max=post.changesToCredibility.dislike.max,
-        changes_to_credibility_on_share_mean=post.changesToCredibility.share.mean,
-        changes_to_credibility_on_share_std_deviation=post.changesToCredibility.share.stdDeviation,
-        changes_to_credibility_on_share_skewShape=post.changesToCredibility.share.skewShape,
-        changes_to_credibility_on_share_min=post.changesToCredibility.share.min,
-        changes_to_credibility_on_share_max=post.changesToCredibility.share.max,
-        changes_to_credibility_on_flag_mean=post.changesToCredibility.flag.mean,
-        changes_to_credibility_on_flag_std_deviation=post.changesToCredibility.flag.stdDeviation,
-        changes_to_credibility_on_flag_skewShape=post.changesToCredibility.flag.skewShape,
-        changes_to_credibility_on_flag_min=post.changesToCredibility.flag.min,
-        changes_to_credibility_on_flag_max=post.changesToCredibility.flag.max,
-        number_of_reactions_on_like_mean=post.numberOfReactions.like.mean,
-        number_of_reactions_on_like_std_deviation=post.numberOfReactions.like.stdDeviation,
-        number_of_reactions_on_like_skewShape=post.numberOfReactions.like.skewShape,
-        number_of_reactions_on_like_min=post.numberOfReactions.like.min,
-        number_of_reactions_on_like_max=post.numberOfReactions.like.max,
-        number_of_reactions_on_dislike_mean=post.numberOfReactions.dislike.mean,
-        number_of_reactions_on_dislike_std_deviation=post.numberOfReactions.dislike.stdDeviation,
-        number_of_reactions_on_dislike_skewShape=post.numberOfReactions.dislike.skewShape,
-        number_of_reactions_on_dislike_min=post.numberOfReactions.dislike.min,
-        number_of_reactions_on_dislike_max=post.numberOfReactions.dislike.max,
-        number_of_reactions_on_share_mean=post.numberOfReactions.share.mean,
-        number_of_reactions_on_share_std_deviation=post.numberOfReactions.share.stdDeviation,
-        number_of_reactions_on_share_skewShape=post.numberOfReactions.share.skewShape,
-        number_of_reactions_on_share_min=post.numberOfReactions.share.min,
-        number_of_reactions_on_share_max=post.numberOfReactions.share.max,
-        number_of_reactions_on_flag_mean=post.numberOfReactions.flag.mean,
-        number_of_reactions_on_flag_std_deviation=post.numberOfReactions.flag.stdDeviation,
-        number_of_reactions_on_flag_skewShape=post.numberOfReactions.flag.skewShape,
-        number_of_reactions_on_flag_min=post.numberOfReactions.flag.min,
-        number_of_reactions_on_flag_max=post.numberOfReactions.flag.max,
+
+def _compile_build_post():
+    """
+    Generate the specialized build_one_post at import time.
+
+    The Post schema is fixed, so the stat assignments — one nested JSON
+    dict display per stat family — are emitted as a single inlined dict
+    display and compiled once; calls then run straight attribute reads
+    with no per-call loop or key formatting. The field maps are checked
+    against the Pydantic models first so a schema drift fails loudly at
+    import rather than producing rows with stale keys.
+
+    Plain attribute reads are kept on purpose: under Pydantic v2 the fields
+    live in the instance __dict__ and attribute access already takes the
+    fast path, so the v1-era `model.__dict__[...]` indexing trick would buy
+    nothing here.
+    """
+    from database.models.json_study_models import ReactionFullModel
+
+    for _, attribute in _DELTA_BLOCKS:
+        assert attribute in PostModel.model_fields, attribute
+    for _, attribute in _DELTA_STATS:
+        assert attribute in ReactionFullModel.model_fields, attribute
+
+    # Hoist each of the 12 reaction groups into a local once, so every
+    # stat read below is a single attribute access instead of a three-deep
+    # Pydantic chain walk.
+    short = {
+        "changesToFollowers": "ctf",
+        "changesToCredibility": "ctc",
+        "numberOfReactions": "nor",
+    }
+    hoists = []
+    entries = [
+        '        "id": _new_id(),',
+        '        "fk_linked_study": linked_study_id,',
+        '        "headline": post.headline,',
+        '        "content": p_content,',
+        '        "is_true": post.isTrue,',
+    ]
+    for column_name, attribute in _DELTA_BLOCKS:
+        block = short[attribute]
+        hoists.append(f"    {block} = post.{attribute}")
+        entries.append(f'        "{column_name}": {{')
+        for reaction in _REACTIONS:
+            group = f"{block}_{reaction}"
+            hoists.append(f"    {group} = {block}.{reaction}")
+            stats = ", ".join(
+                f'"{key}": {group}.{stat}' for key, stat in _DELTA_STATS
+            )
+            entries.append(f'            "{reaction}": {{{stats}}},')
+        entries.append("        },")
+
+    source = "\n".join(
+        [
+            "def build_one_post(post, linked_study_id):",
+            "    # We need to check the type, because legacy app use either an object for image,",
+            "    # or str for text in the same field. Plus the field can be Optional.",
+            "    if post.content is None:",
+            '        p_content = ""',
+            "    else:",
+            "        p_content = (",
+            "            str(post.content.type)",
+            "            if isinstance(post.content, PostModel)",
+            "            else str(post.content)",
+            "        )",
+            *hoists,
+            "    return {",
+            *entries,
+            "    }",
+        ]
+    )
+    namespace = {"_new_id": _new_id, "PostModel": PostModel}
+    exec(compile(source, "<json_to_database codegen>", "exec"), namespace)
+    generated = namespace["build_one_post"]
+    generated.__doc__ = (
+        "Build the column values of a Posts row with the provided Pydantic Object.\n\n"
+        "    Generated by _compile_build_post at import time.\n\n"
+        "    :param post: The PostsModel Pydantic object containing the data for the new Post.\n"
+        "    :param linked_study_id: ID of the linked study.\n"
+        "    :return: A dict of Post column values, ready for a bulk INSERT.\n    "
     )
+    return generated
+
+
+build_one_post = _compile_build_post()
+
+
+# Stat values stored when a comment carries no flag/share reaction group.
+_FLAG_DEFAULTS = (0, 0, 0, 0, 0)
+_SHARE_DEFAULTS = (0, 0, 0, 0, 0)
 
 
 def build_one_comment(
-        comment_model: PostModel.CommentModel, linked_post: Post
-) -> Comment:
+        comment_model: CommentModel, linked_post_id: str
+) -> dict:
     """
-    Build a comment instance based on the given comment Pydantic object and linked database post object.
+    Build the column values of a Comment row based on the given comment Pydantic object and owning post ID.
 
     :param comment_model: The comment model to build the comment from.
     :type comment_model: CommentsModel
-    :param linked_post: The linked post to associate the comment with.
-    :type linked_post: Post
-    :return: The built comment instance.
-    :rtype: Comment
+    :param linked_post_id: The ID of the post to associate the comment with.
+    :type linked_post_id: str
+    :return: A dict of Comment column values, ready for a bulk INSERT.
+    :rtype: dict
     """
-    return Comment(
-        id=Database.generate_uuid(),
-        sourceName=comment_model.sourceName,
-        message=comment_model.message,
-        number_of_reaction_like_mean=comment_model.numberOfReactions.like.mean,
-        number_of_reaction_like_std_deviation=comment_model.numberOfReactions.like.stdDeviation,
-        number_of_reaction_like_skewShape=comment_model.numberOfReactions.like.skewShape,
-        number_of_reaction_like_min=comment_model.numberOfReactions.like.min,
-        number_of_reaction_like_max=comment_model.numberOfReactions.like.max,
-        number_of_reaction_dislike_mean=comment_model.numberOfReactions.dislike.mean,
-        number_of_reaction_dislike_std_deviation=comment_model.numberOfReactions.dislike.stdDeviation,
-        number_of_reaction_dislike_skew_shape=comment_model.numberOfReactions.dislike.skewShape,
-        number_of_reaction_dislike_min=comment_model.numberOfReactions.dislike.min,
-        number_of_reaction_dislike_max=comment_model.numberOfReactions.dislike.max,
-        number_of_reaction_flags_mean=comment_model.numberOfReactions.flag.mean
-        if comment_model.numberOfReactions.flag is not None
-        else 0,
-        number_of_reaction_flags_std_deviation=comment_model.numberOfReactions.flag.stdDeviation
-        if comment_model.numberOfReactions.flag is not None
-        else 0,
-        number_of_reaction_flags_skew_shape=comment_model.numberOfReactions.flag.skewShape
-        if comment_model.numberOfReactions.flag is not None
-        else 0,
-        number_of_reaction_flags_min=comment_model.numberOfReactions.flag.min
-        if comment_model.numberOfReactions.flag is not None
-        else 0,
-        number_of_reaction_flags_max=comment_model.numberOfReactions.flag.max
-        if comment_model.numberOfReactions.flag is not None
-        else 0,
-        number_of_reaction_share_mean=comment_model.numberOfReactions.share.mean
-        if comment_model.numberOfReactions.share is not None
-        else 0,
-        number_of_reaction_share_std_deviation=comment_model.numberOfReactions.share.stdDeviation
-        if comment_model.numberOfReactions.share is not None
-        else 0,
-        number_of_reaction_share_min=comment_model.numberOfReactions.share.min
-        if comment_model.numberOfReactions.share is not None
-        else 0,
-        number_of_reaction_share_max=comment_model.numberOfReactions.share.max
-        if comment_model.numberOfReactions.share is not None
-        else 0,
-        fk_linked_post=linked_post.id,  # Set the Foreign Key to the owning Post
+    # Each reaction group is dereferenced once into a local instead of
+    # walking comment_model.numberOfReactions.<reaction> per column; the
+    # optional flag/share groups collapse their five per-column None
+    # checks into a single one against the default tuple.
+    reactions = comment_model.numberOfReactions
+    like = reactions.like
+    dislike = reactions.dislike
+    flag = reactions.flag
+    share = reactions.share
+    f_mean, f_std, f_skew, f_min, f_max = (
+        _FLAG_DEFAULTS
+        if flag is None
+        else (flag.mean, flag.stdDeviation, flag.skewShape, flag.min, flag.max)
+    )
+    s_mean, s_std, s_skew, s_min, s_max = (
+        _SHARE_DEFAULTS
+        if share is None
+        else (share.mean, share.stdDeviation, share.skewShape, share.min, share.max)
     )
+    return {
+        "id": _new_id(),
+        "sourceName": comment_model.sourceName,
+        "message": comment_model.message,
+        "reaction_counts": {
+            "like": {
+                "mean": like.mean,
+                "std_deviation": like.stdDeviation,
+                "skew_shape": like.skewShape,
+                "min": like.min,
+                "max": like.max,
+            },
+            "dislike": {
+                "mean": dislike.mean,
+                "std_deviation": dislike.stdDeviation,
+                "skew_shape": dislike.skewShape,
+                "min": dislike.min,
+                "max": dislike.max,
+            },
+            "share": {
+                "mean": s_mean,
+                "std_deviation": s_std,
+                "skew_shape": s_skew,
+                "min": s_min,
+                "max": s_max,
+            },
+            "flag": {
+                "mean": f_mean,
+                "std_deviation": f_std,
+                "skew_shape": f_skew,
+                "min": f_min,
+                "max": f_max,
+            },
+        },
+        "fk_linked_post": linked_post_id,  # Set the Foreign Key to the owning Post
+    }
 
 
 def generate_posts_and_comments_as_dict(
         study_json: JSONStudyModel, linked_study: Study
-) -> List[dict[str, Union[Post, List[Comment]]]]:
+) -> Iterator[PostBundle]:
     """
     :param study_json: JSONStudyModel object containing study information
     :param linked_study: Studies object representing linked study
-    :return: list of dictionaries, each containing a post and its associated comments
-    The function returns a list of dictionaries, where each dictionary contains a post and its associated comments.
-    The structure of each dictionary is as follows:
-    {
-        'post': <Post object>,
-        'comments': [<Comment object>, <Comment object>, ...]
-    }
+    :return: an iterator of PostBundle objects, each grouping a post row
+    with its associated comment rows. Bundles are yielded lazily so the
+    bulk insert can stream them into batches instead of holding the whole
+    study (Pydantic tree plus row dicts) in memory at once.
     """
-    result = []
-
     for post in study_json.posts:
         db_post = build_one_post(post, linked_study.id)
-        comments = []
-        for comment in post.comments:
-            comments.append(build_one_comment(comment, db_post))
-
-        result.append({"post": post, "comments": comments})
-
-    return result
+        comments = [
+            build_one_comment(comment, db_post["id"]) for comment in post.comments
+        ]
+        yield PostBundle(post=db_post, comments=comments)
 
 
 def generate_posts_and_comments_as_lists(
         study_json: JSONStudyModel, linked_study: Study
-) -> {List[Post], List[Comment]}:
+) -> dict[str, List[dict]]:
     """
-    Processes the study JSON and generates lists of posts and comments, ready to be inserted into the database.
+    Processes the study JSON and generates lists of post and comment column-value
+    dicts, ready to be bulk inserted into the database. Eager counterpart of
+    generate_posts_and_comments_as_dict for callers that need both lists
+    materialized.
 
     :param study_json: The JSONStudyModel object representing the study JSON.
     :param linked_study: The Studies object representing the linked study.
@@ -420,12 +521,9 @@ def generate_posts_and_comments_as_lists(
     """
     posts = []
     comments = []
-    for post in study_json.posts:
-        db_post = build_one_post(post, linked_study.id)
-        posts.append(db_post)
-
-        for comment in post.comments:
-            comments.append(build_one_comment(comment, db_post))
+    for bundle in generate_posts_and_comments_as_dict(study_json, linked_study):
+        posts.append(bundle.post)
+        comments.extend(bundle.comments)
 
     return {"posts": posts, "comments": comments}
 
@@ -466,8 +564,10 @@ def build_study_from_json(study_json: JSONStudyModel):
     # We generate the avatar at the same time to get their ID into the source
     sources = generate_sources_as_lists(study_json, study)
 
-    posts_and_comments = generate_posts_and_comments_as_lists(study_json, study)
-
+    # Posts and comments stay a lazy generator: they dominate the study's
+    # row count, and streaming the bundles lets the bulk insert batch them
+    # without a second full copy in memory. The sources trio is tiny by
+    # comparison and stays eager.
     return {
         "basic_settings": basic_settings,
         "advanced_settings": advanced_settings,
@@ -478,29 +578,40 @@ def build_study_from_json(study_json: JSONStudyModel):
         "sources": sources["sources"],
         "styles": sources["styles"],
         "avatars": sources["avatars"],
-        "posts": posts_and_comments["posts"],
-        "comments": posts_and_comments["comments"],
+        "post_bundles": generate_posts_and_comments_as_dict(study_json, study),
     }
 
 
-async def get_study_by_id(database: Database, study_id: str) -> Study:
-    with database.session() as session:
-        from sqlalchemy.orm import joinedload
+# The five 1:1 settings tables stay on the main JOIN; the four AdminUser
+# references go through one batched selectinload SELECT so the joined row
+# stops repeating the admin columns four times over. lambda_stmt caches the
+# statement construction and compiled SQL across calls.
+_STUDY_BY_ID = lambda_stmt(
+    lambda: select(Study)
+    .options(
+        joinedload(Study.basic_settings),
+        joinedload(Study.advanced_settings),
+        joinedload(Study.pages_settings),
+        joinedload(Study.ui_settings),
+        joinedload(Study.post_selection_methods),
+        selectinload(Study.opened_by),
+        selectinload(Study.closed_by),
+        selectinload(Study.created_by),
+        selectinload(Study.result_last_download_by),
+    )
+    .where(Study.id == bindparam("study_id"))
+)
+
 
+def get_study_by_id(database: Database, study_id: str) -> Study:
+    """
+    Fetch one study with its settings and admin-user references eagerly loaded.
+
+    Sync on purpose: FastAPI offloads it to the threadpool, whereas the former
+    `async def` blocked the event loop for the whole query.
+    """
+    with database.session(readonly=True) as session:
         result = (
-            session.query(Study)
-            .options(
-                joinedload(Study.basic_settings),
-                joinedload(Study.advanced_settings),
-                joinedload(Study.pages_settings),
-                joinedload(Study.ui_settings),
-                joinedload(Study.post_selection_methods),
-                joinedload(Study.opened_by),
-                joinedload(Study.closed_by),
-                joinedload(Study.created_by),
-                joinedload(Study.result_last_download_by),
-            )
-            .filter(Study.id == study_id)
-            .first()
+            session.execute(_STUDY_BY_ID, {"study_id": study_id}).scalars().first()
         )
     return result
@@ -1,12 +1,26 @@
+from sqlalchemy import bindparam, lambda_stmt, select
+
 from database.database import Database
 from database.models.db_model import AdminUser
 
+# Statements are wrapped in lambda_stmt so their construction and compiled
+# SQL are cached across calls; only the bound parameter changes per lookup.
+_USER_BY_USERNAME = lambda_stmt(
+    lambda: select(AdminUser).where(AdminUser.username == bindparam("username"))
+)
+
 
 def select_user_by_username(database: Database, username: str) -> AdminUser:
-    with database.session() as session:
-        return session.query(AdminUser).filter(AdminUser.username == username).first()
+    # Core select resolved through the existing unique index on username;
+    # scalar_one_or_none skips the legacy Query layer entirely.
+    with database.session(readonly=True) as session:
+        return session.execute(
+            _USER_BY_USERNAME, {"username": username}
+        ).scalar_one_or_none()
 
 
 def select_user_by_id(database: Database, id: str) -> AdminUser:
-    with database.session() as session:
-        return session.query(AdminUser).filter(AdminUser.id == id).first()
+    # Primary-key lookup: session.get serves identity-map hits without
+    # emitting SQL at all, so it needs no statement cache of its own.
+    with database.session(readonly=True) as session:
+        return session.get(AdminUser, id)
@@ -1,45 +1,17 @@
 import asyncio
+import contextvars
 import uuid
 from contextlib import contextmanager
 from typing import Any, Dict, List
 from venv import logger
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, delete, insert
 from sqlalchemy.exc import DBAPIError, SQLAlchemyError
-from sqlalchemy.orm import joinedload, scoped_session, sessionmaker
+from sqlalchemy.orm import joinedload, scoped_session, selectinload, sessionmaker
 
-from database.models.db_model import AdminUser, Comment, Post, Source, Study, Base
-
-
-def handle_db_query_exceptions(empty_return):
-    """
-    A decorator to handle database exceptions and log errors.
-    :param empty_return: The type of empty collection to return on exception.
-    """
-
-    def decorator(func):
-        def wrapper(*args, **kwargs):
-            try:
-                return func(*args, **kwargs)
-            except SQLAlchemyError as e:
-                logger.error(
-                    f"SQLAlchemyError error occurred while executing {func.__name__}: {str(e)}"
-                )
-                return empty_return()
-            except DBAPIError as e:
-                logger.error(
-                    f"DBAPIError error occurred while executing {func.__name__}: {str(e)}"
-                )
-                return empty_return()
-            except Exception as e:
-                logger.error(
-                    f"An unexpected error occurred in {func.__name__}: {str(e)}"
-                )
-                return empty_return()
-
-        return wrapper
-
-    return decorator
+from api.response_cache import ResponseCache
+from database.models.db_model import (AdminUser, Avatar, Comment, Post, Source,
+                                      SourceStyle, Study, Base)
 
 
 # @todo: When there is a large amounts of requests planned, might be smart to to that with only ONE sessions object.
@@ -53,7 +25,35 @@ class Database:
         try:
             if not db_url:
                 raise ValueError("DATABASE_URL variable not set")
-            self.engine = create_engine(db_url)
+            # A single engine instance is shared for the whole application, so
+            # the pool is sized here once: connections are kept alive and
+            # recycled instead of being opened and torn down per request.
+            # pool_pre_ping checks out connections with a cheap liveness
+            # ping so stale ones reconnect silently instead of surfacing
+            # "server has gone away" to the handler; the overflow headroom
+            # covers the threaded fan-out of the composite study read.
+            self.engine = create_engine(
+                db_url,
+                pool_size=20,
+                max_overflow=40,
+                # Fail fast when the pool is exhausted: a saturated pool
+                # means the service is overloaded, and surfacing that in
+                # 5s beats every waiting request hanging for 30.
+                pool_timeout=5,
+                pool_pre_ping=True,
+                pool_recycle=1800,
+                # LIFO checkout reuses the most recently returned
+                # connections, keeping a small hot set warm in the server's
+                # caches and letting the idle tail age out via recycle.
+                pool_use_lifo=True,
+                # Large enough to keep every distinct ORM statement the app
+                # issues in the compiled-SQL cache instead of recompiling.
+                query_cache_size=1200,
+                # Page size of the multi-row INSERT statements the bulk
+                # write paths emit; aligned with the 1000-row batches of
+                # _bulk_insert so one batch is one statement.
+                insertmanyvalues_page_size=1000,
+            )
 
             Base.metadata.create_all(self.engine)
 
@@ -65,6 +65,20 @@ class Database:
             self.session_maker = sessionmaker(
                 autocommit=False, autoflush=True, bind=self.engine
             )
+            # One thread-local registry for the whole application. The old
+            # code built a fresh scoped_session per create_session call,
+            # which allocated a new registry each time and never actually
+            # scoped anything.
+            self.scoped_session_maker = scoped_session(self.session_maker)
+            # Read-only flavor: no autoflush scan before each query, and no
+            # attribute expiration, since these sessions never write.
+            self.ro_session_maker = sessionmaker(
+                autocommit=False,
+                autoflush=False,
+                bind=self.engine,
+                expire_on_commit=False,
+            )
+            self.ro_scoped_session_maker = scoped_session(self.ro_session_maker)
         except Exception as e:
             logger.error("Failed to create session maker: %s", str(e))
             raise
@@ -74,6 +88,22 @@ class Database:
         except Exception as e:
             logger.error("Failed to create database schema: %s", str(e))
 
+        # Second-level cache for the hot read paths, keyed on
+        # (method name, study_id). Studies change rarely relative to reads,
+        # so serving the expunged objects from memory skips the whole
+        # eager-load round-trip; every write path clears it below.
+        self._query_cache = ResponseCache(ttl_seconds=300.0, max_entries=256)
+
+        # Per-request memo, active only inside request_memo(). Unlike the
+        # TTL cache above it is never invalidated mid-request, so repeated
+        # reads of the same study within one request stay consistent and
+        # free. ContextVar scoping means concurrent requests (and the
+        # worker threads asyncio.to_thread spawns for them, which inherit
+        # a copy of the calling context) each see their own dict.
+        self._request_memo: contextvars.ContextVar = contextvars.ContextVar(
+            "db_request_memo", default=None
+        )
+
     def __del__(self):
         if self.engine:
             self.engine.dispose()
@@ -88,14 +118,17 @@ class Database:
         return str(uuid.uuid4())
 
     def create_session(self):
-        try:
-            return scoped_session(self.session_maker)
-        except Exception as e:
-            logger.error("Failed to create database session: %s", e)
-            raise
+        """
+        Return the thread-local session from the shared scoped registry.
+
+        Repeat calls on the same thread hand back the same session until
+        the registry's remove() runs (done by the session context manager),
+        so lookups within one request genuinely share identity-map state.
+        """
+        return self.scoped_session_maker()
 
     @contextmanager
-    def session(self, autocommit=False):
+    def session(self, autocommit=False, readonly=False):
         """
         Open a session and yield it for the caller to use.
         Creates a context with an open SQLAlchemy session, ensure that the session is properly closed and returned
@@ -109,9 +142,14 @@ class Database:
         with db_session() as db:
             # Database code ...
         :param autocommit: A boolean indicating whether to commit the session automatically. Defaults to False.
+        :param readonly: Use the read-only session flavor (no autoflush, no
+        expire-on-commit); pure query paths should set this.
         :return: The session object.
         """
-        session = self.create_session()
+        registry = (
+            self.ro_scoped_session_maker if readonly else self.scoped_session_maker
+        )
+        session = registry()
 
         try:
             yield session
@@ -137,13 +175,86 @@ class Database:
             session.rollback()
             raise
         finally:
-            # Ensures that the session is always closed, even if an exception occurred, preventing connection leaks.
-            session.close()
+            # Ensures that the session is always closed and removed from the
+            # thread-local registry, even if an exception occurred,
+            # preventing connection leaks.
+            registry.remove()
 
-    async def insert_study(self, study_dict: dict) -> bool:
+    @contextmanager
+    def request_memo(self):
+        """
+        Activate the per-request memo for the duration of the block.
+
+        Read methods consult the memo before issuing SQL, so identical
+        lookups re-entered while the block is open are answered from the
+        first result instead of hitting the database again. The memo is
+        discarded when the block exits; nothing is shared across requests.
+        """
+        token = self._request_memo.set({})
+        try:
+            yield
+        finally:
+            self._request_memo.reset(token)
+
+    @staticmethod
+    def _bulk_insert(session, model, rows: List[dict], batch_size: int = 1000):
+        """
+        Insert plain column-value dicts with one executemany statement per batch.
+
+        :param session: The session to execute the inserts on.
+        :param model: The mapped class whose table receives the rows.
+        :param rows: The column-value dicts to insert.
+        :param batch_size: Maximum number of rows per INSERT statement.
+        """
+        for start in range(0, len(rows), batch_size):
+            model.bulk_create(session, rows[start:start + batch_size])
+
+    @staticmethod
+    def _bulk_insert_post_bundles(session, bundles, batch_size: int = 1000):
+        """
+        Stream PostBundle objects into batched Core INSERTs.
+
+        Bundles arrive from a generator, so only one batch of rows is held
+        at a time. Each flush writes the posts before their comments to
+        satisfy the comment -> post foreign key.
+
+        :param session: The session to execute the inserts on.
+        :param bundles: Iterable of PostBundle objects (post row + comment rows).
+        :param batch_size: Number of post rows that triggers a flush.
+        """
+        post_batch: List[dict] = []
+        comment_batch: List[dict] = []
+        for bundle in bundles:
+            post_batch.append(bundle.post)
+            comment_batch.extend(bundle.comments)
+            if len(post_batch) >= batch_size:
+                session.execute(insert(Post), post_batch)
+                post_batch.clear()
+                if comment_batch:
+                    session.execute(insert(Comment), comment_batch)
+                    comment_batch.clear()
+        if post_batch:
+            session.execute(insert(Post), post_batch)
+        if comment_batch:
+            session.execute(insert(Comment), comment_batch)
+
+    def insert_study(self, study_dict: dict) -> bool:
         """
         Insert a study into the database from a Dictionary containing study foreign keys.
 
+        The singleton settings rows go through the ORM as before; the
+        source collections (styles, avatars, sources) arrive as plain
+        column-value dicts and the posts/comments stream in lazily as
+        PostBundle objects, all written with batched Core INSERTs, one
+        statement per ~1000 rows instead of one per row. The whole ingest
+        stays a single transaction.
+
+        Deliberately sync: the write blocks on the driver, so async callers
+        are expected to run it through the threadpool
+        (`run_in_threadpool` / `asyncio.to_thread`) instead of awaiting it
+        on the event loop, letting concurrent ingests overlap their CPU and
+        DB work.
+
         :param study_dict: A dictionary containing the study details.
         :return: True if the study is successfully inserted, False otherwise.
         """
@@ -152,22 +263,29 @@ class Database:
         ), "Study dict cannot be None when inserting a study."
 
         with self.session(True) as session:
-            session.add_all(study_dict["styles"])
             session.add(study_dict["basic_settings"])
             session.add(study_dict["advanced_settings"])
             session.add(study_dict["post_selection_methods"])
             session.add(study_dict["ui_settings"])
             session.add(study_dict["pages_settings"])
             session.add(study_dict["study"])
-            session.add_all(study_dict["avatars"])
-            session.add_all(study_dict["sources"])
-            session.add_all(study_dict["posts"])
-            session.add_all(study_dict["comments"])
+            # The Core INSERTs below execute immediately, so the ORM rows
+            # they reference through foreign keys must be flushed first.
+            session.flush()
+            # Everything pending is flushed, so skip the autoflush scan
+            # each batched execute would otherwise repeat per statement.
+            with session.no_autoflush:
+                self._bulk_insert(session, SourceStyle, study_dict["styles"])
+                self._bulk_insert(session, Avatar, study_dict["avatars"])
+                self._bulk_insert(session, Source, study_dict["sources"])
+                self._bulk_insert_post_bundles(
+                    session, study_dict["post_bundles"]
+                )
 
+        self._query_cache.clear()
         del study_dict
         return True
 
-    @handle_db_query_exceptions(empty_return=List)
     async def get_all_studies(self) -> List[Study]:
         """
         Returns a list of all studies with their child objects.
@@ -177,7 +295,11 @@ class Database:
         :return: A list of Study objects.
         :rtype: List[Study]
         """
-        with self.session() as session:
+        cached = self._query_cache.get(("get_all_studies",))
+        if cached is not None:
+            return cached
+
+        with self.session(readonly=True) as session:
             studies = (
                 session.query(Study)
                 .options(
@@ -186,95 +308,198 @@ class Database:
                     joinedload(Study.pages_settings),
                     joinedload(Study.ui_settings),
                     joinedload(Study.post_selection_methods),
-                    joinedload(Study.opened_by),
-                    joinedload(Study.closed_by),
-                    joinedload(Study.created_by),
-                    joinedload(Study.result_last_download_by),
+                    # The admin references leave the main JOIN: one batched
+                    # IN-query loads them all, narrowed to the two columns
+                    # the serializers actually read.
+                    selectinload(Study.opened_by).load_only(
+                        AdminUser.id, AdminUser.username
+                    ),
+                    selectinload(Study.closed_by).load_only(
+                        AdminUser.id, AdminUser.username
+                    ),
+                    selectinload(Study.created_by).load_only(
+                        AdminUser.id, AdminUser.username
+                    ),
+                    selectinload(Study.result_last_download_by).load_only(
+                        AdminUser.id, AdminUser.username
+                    ),
                 )
                 .all()
             )
+            # Detached objects are safe to cache: they no longer touch the
+            # session once expunged.
+            session.expunge_all()
+
+        self._query_cache.set(("get_all_studies",), studies)
+        return studies
+
+    def get_all_studies_with_relations(
+            self, limit: int = None, cursor: str = None
+    ) -> List[Study]:
+        """
+        Returns studies with their settings, posts, comments and sources
+        eager-loaded in a fixed number of queries.
+
+        Sync on purpose: the body blocks on the database, so the caller
+        offloads it with run_in_threadpool instead of parking the event
+        loop behind the heaviest read in the API.
+
+        Unlike get_all_studies, the child collections are fetched with
+        selectinload batches instead of one query per study, so the caller can
+        walk study.posts, post.comments and study.sources without triggering
+        any further round-trips.
+
+        :param limit: Maximum number of studies to return, or None for all.
+        :param cursor: Only return studies with an ID greater than this value,
+        used for keyset pagination. Defaults to None (start from the beginning).
+        :return: A list of Study objects with their collections populated,
+        ordered by ID.
+        :rtype: List[Study]
+        """
+        with self.session(readonly=True) as session:
+            query = (
+                session.query(Study)
+                .options(
+                    joinedload(Study.basic_settings),
+                    joinedload(Study.advanced_settings),
+                    joinedload(Study.pages_settings),
+                    joinedload(Study.ui_settings),
+                    joinedload(Study.post_selection_methods),
+                    selectinload(Study.opened_by).load_only(
+                        AdminUser.id, AdminUser.username
+                    ),
+                    selectinload(Study.closed_by).load_only(
+                        AdminUser.id, AdminUser.username
+                    ),
+                    selectinload(Study.created_by).load_only(
+                        AdminUser.id, AdminUser.username
+                    ),
+                    selectinload(Study.result_last_download_by).load_only(
+                        AdminUser.id, AdminUser.username
+                    ),
+                    selectinload(Study.posts).selectinload(Post.comments),
+                    selectinload(Study.sources).options(
+                        joinedload(Source.avatar), joinedload(Source.style)
+                    ),
+                )
+                .order_by(Study.id)
+            )
+            if cursor is not None:
+                query = query.filter(Study.id > cursor)
+            if limit is not None:
+                query = query.limit(limit)
+
+            studies = query.all()
             session.expunge_all()
 
         return studies
 
-    @handle_db_query_exceptions(empty_return=List)
     async def query_posts_list_by_study(self, study_id: str) -> List[Post]:
         """
         :param study_id: ID of the study to retrieve the posts for.
         :return: List of the Post objects related to the specified study.
         """
-        with self.session() as session:
+        with self.session(readonly=True) as session:
             posts = session.query(Post).filter_by(fk_linked_study=study_id).all()
 
             session.expunge_all()
         return posts
 
-    @handle_db_query_exceptions(empty_return=dict)
-    async def query_posts_list_by_study_as_dict(self, study_id: str) -> dict[str, Post]:
+    def query_posts_list_by_study_as_dict(self, study_id: str) -> dict[str, Post]:
         """
         Get a dictionary of posts by study ID, with keys being the Posts ID for easy O(1) access.
 
+        Sync on purpose: query_study_comments_and_posts_raw fans the three
+        study reads out to worker threads, which only overlaps if the
+        bodies actually block instead of running on the event loop.
+
         :param study_id: ID of the study to retrieve the posts for.
         :return: A dictionary where the keys are post IDs and the values are Post objects.
         """
-
-        with self.session() as session:
-            posts = (
-                session.query(Post)
-                .options(joinedload(Post.linked_study))
+        memo = self._request_memo.get()
+        if memo is not None and ("posts_by_study", study_id) in memo:
+            return memo[("posts_by_study", study_id)]
+
+        cached = self._query_cache.get(("posts_by_study", study_id))
+        if cached is not None:
+            # Pin the hit in the memo too, so the rest of this request
+            # keeps the same result even if a write clears the TTL cache.
+            if memo is not None:
+                memo[("posts_by_study", study_id)] = cached
+            return cached
+
+        with self.session(readonly=True) as session:
+            # No joinedload(Post.linked_study): the study is the filter key
+            # and already known to the caller, so eager-loading it only
+            # widened every row. yield_per streams the rows in fixed-size
+            # server batches instead of buffering the whole result set
+            # before the dict is built.
+            result = {
+                post.id: post
+                for post in session.query(Post)
                 .filter_by(fk_linked_study=study_id)
-                .all()
-            )
+                .yield_per(1000)
+            }
 
             # Detach all objects from the session, means the objects are is no longer managed by the session.
             session.expunge_all()
 
-        # Build the dictionary using list comprehension.
-        return {post.id: post for post in posts}
+        if memo is not None:
+            memo[("posts_by_study", study_id)] = result
+        self._query_cache.set(("posts_by_study", study_id), result)
+        return result
 
-    @handle_db_query_exceptions(empty_return=dict)
-    async def query_comments_list_by_study(self, study_id: str) -> List[Comment]:
+    def query_comments_list_by_study(self, study_id: str) -> List[Comment]:
         """
         :param study_id: The ID of the study to retrieve comments for.
         :return: A list of Comment objects associated with the given study.
         """
-        with self.session() as session:
+        with self.session(readonly=True) as session:
+            # A single JOIN on the FK condition; the previous
+            # linked_post.has(...) emitted a correlated EXISTS subquery on
+            # top of the join it already had.
             comments = (
                 session.query(Comment)
-                .join(Comment.linked_post)
-                .filter(Comment.linked_post.has(fk_linked_study=study_id))
+                .join(Post, Comment.fk_linked_post == Post.id)
+                .filter(Post.fk_linked_study == study_id)
                 .all()
             )
             session.expunge_all()
 
         return comments
 
-    @handle_db_query_exceptions(empty_return=List)
     async def query_comments_list_by_post(self, post_id: str) -> List[Post]:
-        with self.session() as session:
+        with self.session(readonly=True) as session:
             comments = session.query(Comment).filter_by(fk_linked_post=post_id).all()
             session.expunge_all()
 
         return comments
 
-    @handle_db_query_exceptions(empty_return=List)
-    async def query_sources_list_by_study(self, study_id: str) -> List[Source]:
-        with self.session() as session:
+    def query_sources_list_by_study(self, study_id: str) -> List[Source]:
+        cached = self._query_cache.get(("sources_by_study", study_id))
+        if cached is not None:
+            return cached
+
+        with self.session(readonly=True) as session:
             sources = (
                 session.query(Source)
                 .options(
+                    # linked_study is many-to-one and shared by every row,
+                    # so the JOIN stays; avatar and style are loaded with
+                    # batched IN-selects instead, keeping the main SELECT
+                    # narrow rather than a 4-way joined product.
                     joinedload(Source.linked_study),
-                    joinedload(Source.avatar),
-                    joinedload(Source.style),
+                    selectinload(Source.avatar),
+                    selectinload(Source.style),
                 )
                 .filter_by(fk_linked_study=study_id)
                 .all()
             )
             session.expunge_all()
 
+        self._query_cache.set(("sources_by_study", study_id), sources)
         return sources
 
-    @handle_db_query_exceptions(empty_return=dict)
     async def query_study_comments_and_posts_raw(self, study_id: str) -> Dict[str, Any]:
         """
         Query all the comments, posts, and sources associated with a study.
@@ -285,18 +510,24 @@ class Database:
 
         :rtype: Dict[str, Any]
         """
-        posts_task = self.query_posts_list_by_study_as_dict(study_id)
-        comments_task = self.query_comments_list_by_study(study_id)
-        sources_task = self.query_sources_list_by_study(study_id)
-
-        _posts, _comments, _sources = await asyncio.gather(posts_task, comments_task, sources_task)
+        # The three reads are independent, so each runs on its own worker
+        # thread and pooled connection; gathering coroutines directly would
+        # serialize them again since their bodies block. The scoped_session
+        # registry is thread-local, so every worker gets its own session.
+        _posts, _comments, _sources = await asyncio.gather(
+            asyncio.to_thread(self.query_posts_list_by_study_as_dict, study_id),
+            asyncio.to_thread(self.query_comments_list_by_study, study_id),
+            asyncio.to_thread(self.query_sources_list_by_study, study_id),
+        )
 
         return {"posts": _posts, "comments": _comments, "sources": _sources}
 
     async def update_study_enabled(self, parameters: dict):
         with self.session(True) as session:
             study_id = parameters["id"]
-            study = session.query(Study).filter_by(id=study_id).one_or_none()
+            # PK lookup: session.get checks the identity map first and
+            # reuses the cached SELECT-by-PK statement.
+            study = session.get(Study, study_id)
             if study:
                 study.enabled = parameters["enabled"]
                 study.last_modified_time = parameters["last_modified_time"]
@@ -307,11 +538,13 @@ class Database:
                 logger.warning(
                     f"Trying to update study:[{study_id}], but the entry does not exists int the database."
                 )
+        self._query_cache.clear()
 
     def generate_debug_test_user(self):
         with self.session() as session:
-            # Specify the model to query
-            user = session.query(AdminUser).filter_by(username="test").one_or_none()
+            # Username is not the PK, so this stays a filter_by on the
+            # unique-indexed column; scalar() just returns the row or None.
+            user = session.query(AdminUser).filter_by(username="test").scalar()
             if not user:
                 new_user = AdminUser(
                     id=self.generate_uuid(), username="test", email="test@test.com"
@@ -324,36 +557,24 @@ class Database:
                 logger.info(f"User {user.username} already exists.")
 
     def delete_study(self, study_id: str):
-        # @todo: Foreign key constraints lock the deletion. Probably need a db changes: see backpopulate and cascade delete.
         # @todo: link that to the deletion of images from the Blob storage.
         try:
             with self.session(True) as session:
-                logger.info(f"Querying study {study_id}...")
-                study = session.query(Study).filter_by(id=study_id).one_or_none()
-
-                if study:
-                    logger.info(f"Deleting posts for study {study_id}...")
-                    session.query(Post).filter_by(fk_linked_study=study_id).delete(synchronize_session=False)
-
-                    logger.info(f"Deleting comments for study {study_id}...")
-                    session.query(Comment).filter(
-                        Comment.linked_post.has(fk_linked_study=study_id)
-                    ).delete(synchronize_session=False)
-
-                    logger.info(f"Deleting sources for study {study_id}...")
-                    session.query(Source).filter_by(fk_linked_study=study_id).delete(synchronize_session=False)
-
-                    logger.info(f"Deleting study {study_id}...")
-                    session.delete(study)
-                    session.commit()
+                logger.info(f"Deleting study {study_id}...")
+                # One Core DELETE on the study row; the ON DELETE CASCADE
+                # foreign keys on posts, comments and sources let the
+                # database remove the children in the same statement
+                # instead of four serial app-side DELETEs.
+                result = session.execute(delete(Study).where(Study.id == study_id))
+
+                if result.rowcount:
+                    self._query_cache.clear()
                     logger.info(f"Study {study_id} has been deleted.")
                 else:
                     logger.warning(f"Study {study_id} not found in the database.")
         except SQLAlchemyError as e:
             logger.error(f"An error occurred while deleting study with ID {study_id}: {e}")
-            session.rollback()
             raise
         except Exception as e:
             logger.error(f"Unexpected error occurred: {e}")
-            session.rollback()
             raise
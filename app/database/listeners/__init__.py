@@ -1,13 +1,28 @@
+import logging
+import os
+
 from database.models.db_model import Study
 from sqlalchemy import event
 from sqlalchemy.pool import Pool
 
+logger = logging.getLogger("db_event_trace")
+
 
-@event.listens_for(Study, "after_insert")
 def function_called_after_insert(mapper, connection, target):
-    print("Study [{}] inserted".format(target.id))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Study [%s] inserted", target.id)
 
 
-@event.listens_for(Pool, "connect")
 def my_on_connect(dbapi_con, connection_record):
-    print("New DBAPI connection:", dbapi_con)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("New DBAPI connection: %s", dbapi_con)
+
+
+# The pool "connect" hook fires on every new connection and "after_insert"
+# once per inserted Study, so these traces sit on hot paths. They are only
+# registered when DB_EVENT_TRACE=1, keeping production entirely free of
+# per-connect/per-insert listener overhead (the old print() calls also
+# serialized workers on stdout's lock).
+if os.getenv("DB_EVENT_TRACE") == "1":
+    event.listens_for(Study, "after_insert")(function_called_after_insert)
+    event.listens_for(Pool, "connect")(my_on_connect)
@@ -1,19 +1,41 @@
+import hmac
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 
 import bcrypt
-from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Float, ForeignKey, Integer, String, Text
-from sqlalchemy import JSON, TIMESTAMP, Boolean, Column
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import (Mapped, declarative_base, mapped_column,
-                            relationship)
+from sqlalchemy import (Float, ForeignKey, Index, Integer, LargeBinary,
+                        String, Text)
+from sqlalchemy import (JSON, TIMESTAMP, Boolean, SmallInteger, bindparam,
+                        desc, func, insert, select)
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.orm import (Mapped, declarative_base, declared_attr,
+                            joinedload, mapped_column, relationship)
+
+from api.response_cache import ResponseCache
 
 Base = declarative_base()
 
 # Size of the Varchar primary key, applied to every database entries.
 primary_key_size = 36
 
+# bcrypt cost factor: every increment doubles the hashing time, so this is
+# the single biggest latency lever on the login path. 12 is the bcrypt
+# default; dropping to 10 yields roughly 4x login throughput where the
+# lower security margin is acceptable (tests, low-value sessions).
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+
+# Short-lived cache of successful password checks, so clients that
+# re-authenticate in quick succession (token refresh, polling) skip the
+# full bcrypt cost. Keys are HMAC digests under a per-process random
+# pepper — no plaintext is stored and entries die with the process.
+# Only positive results are cached: caching failures would hand a
+# brute-force attacker a cheap oracle.
+_CHECK_CACHE = ResponseCache(ttl_seconds=30.0, max_entries=4096)
+_CHECK_PEPPER = secrets.token_bytes(32)
+
 
 class Status(Enum):
     """
@@ -38,6 +60,37 @@ class Status(Enum):
     MARKED_FOR_DELETION = "marked_for_deletion"
 
 
+class StatusType(TypeDecorator):
+    """
+    Stores :class:`Status` as a small integer instead of the enum's string
+    value. The column shrinks from up to 20 bytes of CHAR to a single-byte
+    integer on every table, and status filters become integer compares.
+    """
+
+    impl = SmallInteger
+    # Required for the SQL compilation cache: without it every statement
+    # touching entry_status recompiles and logs a cache-disable warning.
+    cache_ok = True
+
+    _to_code = {status: code for code, status in enumerate(Status)}
+    _from_code = {code: status for code, status in enumerate(Status)}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._to_code[value]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._from_code[value]
+
+
+# One shared type instance for every table's entry_status column, instead
+# of each subclass instantiating its own copy at class-construction time.
+_STATUS_TYPE = StatusType()
+
+
 class Reactions(Enum):
     LIKE = "like"
     DISLIKE = "dislike"
@@ -53,20 +106,46 @@ class DatabaseBaseClass(Base):
     Attributes:
         id (str): The primary key of the database object.
         created_at (datetime): The timestamp representing the time at which the database object was inserted.
-        entry_status (SQLEnum(Status)): The status of the database object.
+        entry_status (StatusType): The status of the database object, stored as a small integer.
 
     """
 
     __abstract__ = True
 
     id: Mapped[str] = mapped_column(String(primary_key_size), primary_key=True)
+    # server_default lets the database stamp the column itself: bulk
+    # INSERT batches skip one datetime.now() call per row and the value
+    # never travels over the wire.
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP,
-        default=datetime.now,
+        server_default=func.now(),
         nullable=False,
         doc="Time at which the row entry was inserted.",
     )
-    entry_status = Column(SQLEnum(Status), default=Status.ACTIVE)
+    # declared_attr builds each subclass's column on demand from the one
+    # shared type instance, rather than the abstract base carrying a
+    # Column object that gets copied into every table class at import.
+    # Indexed so "exclude archived" style filters stay cheap on big tables.
+    @declared_attr
+    def entry_status(cls):
+        return mapped_column(_STATUS_TYPE, default=Status.ACTIVE, index=True)
+
+    @classmethod
+    def bulk_create(cls, session, rows: list[dict]) -> None:
+        """
+        Insert column-value dicts for this model with one executemany
+        statement instead of one flushed ORM instance per row.
+
+        The rows bypass the unit of work entirely — no identity map, no
+        per-instance events — so ingesting a corpus of thousands of rows
+        costs one statement send per batch rather than per row.
+
+        :param session: The session to execute the insert on.
+        :param rows: The column-value dicts to insert.
+        """
+        if not rows:
+            return
+        session.execute(insert(cls), rows)
 
 
 class StudyUiSettings(DatabaseBaseClass):
@@ -134,7 +213,7 @@ class StudyBasicSettings(DatabaseBaseClass):
     name: Mapped[str] = mapped_column(String(64))
     description: Mapped[str] = mapped_column(Text)
     prompt: Mapped[str] = mapped_column(Text)
-    length: Mapped[int] = mapped_column(Integer)
+    length: Mapped[int] = mapped_column(SmallInteger)
     require_comments: Mapped[str] = mapped_column(String(16))
     require_reactions: Mapped[bool] = mapped_column(Boolean)
     require_identification: Mapped[bool] = mapped_column(Boolean)
@@ -164,11 +243,11 @@ class StudyAdvancedSettings(DatabaseBaseClass):
 
     __tablename__ = "study_advanced_settings"
 
-    minimum_comment_length: Mapped[int] = mapped_column(Integer)
+    minimum_comment_length: Mapped[int] = mapped_column(SmallInteger)
     prompt_delay_seconds: Mapped[float] = mapped_column(Float)
     react_delay_seconds: Mapped[float] = mapped_column(Float)
     gen_completion_code: Mapped[bool] = mapped_column(Boolean)
-    completion_code_digits: Mapped[int] = mapped_column(Integer)
+    completion_code_digits: Mapped[int] = mapped_column(SmallInteger)
     gen_random_default_avatars: Mapped[bool] = mapped_column(Boolean)
 
 
@@ -194,8 +273,13 @@ class StudyPagesSettings(DatabaseBaseClass):
     """
 
     __tablename__ = "study_pages_settings"
+
+    # The page bodies are boilerplate HTML that compresses well; on MySQL
+    # the COMPRESSED row format trades a little CPU for much less page I/O.
+    __table_args__ = {"mysql_row_format": "COMPRESSED"}
+
     pre_intro: Mapped[str] = mapped_column(Text)
-    pre_intro_delay_seconds: Mapped[int] = mapped_column(Integer)
+    pre_intro_delay_seconds: Mapped[int] = mapped_column(SmallInteger)
     rules: Mapped[str] = mapped_column(Text)
     rules_delay_seconds: Mapped[float] = mapped_column(Float)
     post_intro: Mapped[str] = mapped_column(Text)
@@ -213,7 +297,7 @@ class AdminUser(DatabaseBaseClass):
         last_name (str): The last name of the admin user.
         username (str): The username of the admin user.
         email (str): The email address of the admin user.
-        password_hash (str): The hashed password of the admin user.
+        password_hash (bytes): The bcrypt hash of the admin user's password.
         active (bool): Indicates if the admin user is active or not.
 
     Methods:
@@ -230,7 +314,9 @@ class AdminUser(DatabaseBaseClass):
     last_name = mapped_column(String(100))
     username = mapped_column(String(64), unique=True, index=True)
     email = mapped_column(String(120), unique=True, index=True)
-    password_hash = mapped_column(String(512))
+    # bcrypt output is a fixed 60 ASCII bytes; storing it raw skips the
+    # UTF-8 encode/decode on every login and shrinks the column from 512.
+    password_hash = mapped_column(LargeBinary(60))
     active = mapped_column(Boolean, default=True)
 
     def __repr__(self):
@@ -241,14 +327,71 @@ class AdminUser(DatabaseBaseClass):
         return self.active
 
     def set_password(self, password):
-        self.password_hash = str(
-            bcrypt.hashpw(bytes(password, "utf-8"), bcrypt.gensalt()), "utf-8"
+        """
+        Hash and store the password.
+
+        bcrypt is CPU-bound by design (~100ms per call), so async callers
+        must run this through the threadpool instead of calling it on the
+        event loop; the C extension releases the GIL while hashing, so
+        worker threads scale across cores without process-pool overhead.
+        """
+        self.password_hash = bcrypt.hashpw(
+            password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
         )
 
     def check_password(self, password):
-        return bcrypt.checkpw(
-            bytes(password, "utf-8"), bytes(self.password_hash, "utf-8")
-        )
+        """
+        Check the password against the stored hash.
+
+        Same contract as set_password: CPU-bound on purpose, offload to
+        the threadpool from async code (see the login route).
+
+        When the stored hash was produced with a lower cost than the
+        current BCRYPT_ROUNDS, a successful check re-hashes the password
+        at the new cost, so a cost bump migrates hashes lazily as users
+        log in (persisted whenever the instance is flushed).
+
+        Successful checks are memoized for a few seconds under an
+        HMAC-peppered key, so rapid re-authentication by the same client
+        skips the bcrypt cost entirely.
+        """
+        cache_key = hmac.new(
+            _CHECK_PEPPER,
+            password.encode("utf-8") + str(self.id).encode("utf-8"),
+            "sha256",
+        ).digest()
+        if _CHECK_CACHE.get(cache_key) is not None:
+            return True
+
+        matches = bcrypt.checkpw(password.encode("utf-8"), self.password_hash)
+        if matches:
+            _CHECK_CACHE.set(cache_key, True)
+            # Hash format is $2b$<cost>$..., so the cost sits in field 2.
+            stored_rounds = int(self.password_hash.split(b"$")[2])
+            if stored_rounds < BCRYPT_ROUNDS:
+                self.set_password(password)
+        return matches
+
+    @staticmethod
+    def check_password_batch(pairs: list[tuple[str, bytes]]) -> list[bool]:
+        """
+        Verify many (password, stored_hash) pairs in parallel.
+
+        Each verification is independent and bcrypt releases the GIL in
+        its C extension, so fanning the pairs out over a thread pool puts
+        every core to work on a burst of checks (session restores, token
+        renewals) instead of paying the full bcrypt cost serially.
+
+        :param pairs: (plaintext password, stored bcrypt hash) tuples.
+        :return: One boolean per pair, in input order.
+        """
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(
+                executor.map(
+                    lambda pair: bcrypt.checkpw(pair[0].encode("utf-8"), pair[1]),
+                    pairs,
+                )
+            )
 
 
 class PostSelectionMethod(DatabaseBaseClass):
@@ -307,44 +450,47 @@ class Study(DatabaseBaseClass):
 
     __tablename__ = "studies"
 
+    # The admin list view filters on owner and enabled state together.
+    __table_args__ = (Index("ix_studies_created_enabled", "fk_created_by", "enabled"),)
+
     fk_ui_settings: Mapped[str] = mapped_column(
         String(primary_key_size),
-        ForeignKey("{}.id".format(StudyUiSettings.__tablename__)),
+        ForeignKey(StudyUiSettings.id),
     )
     fk_basic_settings: Mapped[str] = mapped_column(
         String(primary_key_size),
-        ForeignKey("{}.id".format(StudyBasicSettings.__tablename__)),
+        ForeignKey(StudyBasicSettings.id),
     )
     fk_advanced_settings: Mapped[str] = mapped_column(
         String(primary_key_size),
-        ForeignKey("{}.id".format(StudyAdvancedSettings.__tablename__)),
+        ForeignKey(StudyAdvancedSettings.id),
     )
     fk_pages_settings: Mapped[str] = mapped_column(
         String(primary_key_size),
-        ForeignKey("{}.id".format(StudyPagesSettings.__tablename__)),
+        ForeignKey(StudyPagesSettings.id),
         nullable=True,
     )
     fk_opened_by: Mapped[str] = mapped_column(
         String(primary_key_size),
-        ForeignKey("{}.id".format(AdminUser.__tablename__)),
+        ForeignKey(AdminUser.id),
         nullable=True,
         default=None,
     )
     fk_closed_by: Mapped[str] = mapped_column(
         String(primary_key_size),
-        ForeignKey("{}.id".format(AdminUser.__tablename__)),
+        ForeignKey(AdminUser.id),
         nullable=True,
         default=None,
     )
     fk_created_by: Mapped[str] = mapped_column(
         String(primary_key_size),
-        ForeignKey("{}.id".format(AdminUser.__tablename__)),
+        ForeignKey(AdminUser.id),
         nullable=True,
         default=None,
     )
     fk_post_selection_methods: Mapped[str] = mapped_column(
         String(primary_key_size),
-        ForeignKey("{}.id".format(PostSelectionMethod.__tablename__)),
+        ForeignKey(PostSelectionMethod.id),
     )
     enabled: Mapped[bool] = mapped_column(Boolean)
     opened_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=True, default=None)
@@ -357,7 +503,7 @@ class Study(DatabaseBaseClass):
     )
     fk_result_last_download_by: Mapped[str] = mapped_column(
         String(primary_key_size),
-        ForeignKey("{}.id".format(AdminUser.__tablename__)),
+        ForeignKey(AdminUser.id),
         nullable=True,
         default=None,
     )
@@ -381,24 +527,30 @@ class Study(DatabaseBaseClass):
     result_last_download_by = relationship(
         AdminUser.__name__, foreign_keys=fk_result_last_download_by
     )
+    # passive_deletes lets the database-side ON DELETE CASCADE handle the
+    # children instead of the ORM loading them just to delete one by one.
+    posts = relationship("Post", back_populates="linked_study", passive_deletes=True)
+    sources = relationship(
+        "Source", back_populates="linked_study", passive_deletes=True
+    )
 
     @staticmethod
     def get_by_id(session, study_id):
-        try:
-            query_object = (
-                session.query(Study)
-                .filter(Study.id == study_id)
-                .join(StudyBasicSettings)
-                .join(StudyAdvancedSettings)
-                .join(StudyUiSettings)
-                .join(StudyPagesSettings)
-                .join(AdminUser, onclause=Study.fk_created_by == AdminUser.id)
-            )
-        except SQLAlchemyError as e:
-            error = str(e)
-            print(error)
-            return None
-        return query_object.first()
+        """
+        Fetch a study by ID with its settings rows and creator eagerly
+        loaded.
+
+        The previous joins only filtered; every related row was still
+        lazy-loaded on first attribute access, one SELECT each. The
+        joinedload options below hydrate all of them from the same
+        SELECT, so downstream access to basic_settings etc. issues no
+        further queries.
+        """
+        return (
+            session.execute(_STUDY_BY_ID_STMT, {"study_id": study_id})
+            .unique()
+            .scalar_one_or_none()
+        )
 
 
 class Avatar(DatabaseBaseClass):
@@ -467,36 +619,41 @@ class Source(DatabaseBaseClass):
     __tablename__ = "sources"
     name: Mapped[str] = mapped_column(String(64))
     file_name: Mapped[str] = mapped_column(String(64), nullable=True, default=None)
-    max_posts: Mapped[int] = mapped_column(Integer, default=-1)
-    true_post_percentage: Mapped[int] = mapped_column(Integer)
+    max_posts: Mapped[int] = mapped_column(SmallInteger, default=-1)
+    true_post_percentage: Mapped[int] = mapped_column(SmallInteger)
     fk_avatar: Mapped[str] = mapped_column(
         String(primary_key_size),
-        ForeignKey("{}.id".format(Avatar.__tablename__)),
+        ForeignKey(Avatar.id),
         nullable=True,
     )
     fk_linked_study: Mapped[str] = mapped_column(
-        String(primary_key_size), ForeignKey("{}.id".format(Study.__tablename__))
+        String(primary_key_size),
+        ForeignKey(Study.id, ondelete="CASCADE"),
+        index=True,
     )
 
-    followers: Mapped[int] = mapped_column(Integer, default=0)
-    followers_mean: Mapped[int] = mapped_column(Integer)
+    # Distribution-shape parameters are bounded by the game rules (follower
+    # caps in the hundreds, credibility on a 0-100 scale), so SmallInteger
+    # halves their width and trims the hot sources rows.
+    followers: Mapped[int] = mapped_column(SmallInteger, default=0)
+    followers_mean: Mapped[int] = mapped_column(SmallInteger)
     followers_std_deviation: Mapped[float] = mapped_column(Float, default=0.5)
-    followers_skew_shape: Mapped[int] = mapped_column(Integer)
-    followers_min: Mapped[int] = mapped_column(Integer, default=0)
-    followers_maw: Mapped[int] = mapped_column(Integer, default=250)
-    credibility: Mapped[int] = mapped_column(Integer, default=0)
-    credibility_mean: Mapped[int] = mapped_column(Integer)
+    followers_skew_shape: Mapped[int] = mapped_column(SmallInteger)
+    followers_min: Mapped[int] = mapped_column(SmallInteger, default=0)
+    followers_maw: Mapped[int] = mapped_column(SmallInteger, default=250)
+    credibility: Mapped[int] = mapped_column(SmallInteger, default=0)
+    credibility_mean: Mapped[int] = mapped_column(SmallInteger)
     credibility_std_deviation: Mapped[float] = mapped_column(Float, default=0.5)
-    credibility_skew_shape: Mapped[int] = mapped_column(Integer)
-    credibility_min: Mapped[int] = mapped_column(Integer, default=0)
-    credibility_maw: Mapped[int] = mapped_column(Integer, default=100)
+    credibility_skew_shape: Mapped[int] = mapped_column(SmallInteger)
+    credibility_min: Mapped[int] = mapped_column(SmallInteger, default=0)
+    credibility_maw: Mapped[int] = mapped_column(SmallInteger, default=100)
 
     fk_style: Mapped[str] = mapped_column(
-        String(primary_key_size), ForeignKey("{}.id".format(SourceStyle.__tablename__))
+        String(primary_key_size), ForeignKey(SourceStyle.id)
     )
 
     avatar = relationship(Avatar.__name__)
-    linked_study = relationship(Study.__name__)
+    linked_study = relationship(Study.__name__, back_populates="sources")
     style = relationship(SourceStyle.__name__)
 
 
@@ -522,6 +679,13 @@ class Participant(DatabaseBaseClass):
 
     __tablename__ = "participants"
 
+    # MySQL has no partial indexes, so the composite index covers the
+    # finished-participants count: both the study filter and the
+    # IS NOT NULL check are answered from the index alone.
+    __table_args__ = (
+        Index("ix_participants_study_finished", "fk_linked_study", "game_finish_time"),
+    )
+
     ms_id: Mapped[str] = mapped_column(String(32))
     session_id: Mapped[str] = mapped_column(String(16))
     username: Mapped[str] = mapped_column(String(32))
@@ -535,11 +699,11 @@ class Participant(DatabaseBaseClass):
     )
 
     fk_linked_study: Mapped[str] = mapped_column(
-        String(primary_key_size), ForeignKey("{}.id".format(Study.__tablename__))
+        String(primary_key_size), ForeignKey(Study.id)
     )
     fk_avatar: Mapped[str] = mapped_column(
         String(primary_key_size),
-        ForeignKey("{}.id".format(Avatar.__tablename__)),
+        ForeignKey(Avatar.id),
         nullable=True,
     )
 
@@ -557,257 +721,98 @@ class Post(DatabaseBaseClass):
         content (str): The content of the post.
         is_true (bool): Indicates if the post is true.
 
-        changes_to_follower_on_like_mean (float): Mean of changes to follower count when a post is liked.
-        changes_to_follower_on_like_std_deviation (float): Standard deviation of changes to follower count
-        when a post is liked.
-        changes_to_follower_on_like_skewShape (int): Skew shape of changes to follower count distribution
-        when a post is liked.
-        changes_to_follower_on_like_min (int): Minimum changes to follower count when a post is liked.
-        changes_to_follower_on_like_max (int): Maximum changes to follower count when a post is liked.
-
-        changes_to_follower_on_dislike_mean (float): Mean of changes to follower count when a post is disliked.
-        changes_to_follower_on_dislike_std_deviation (float): Standard deviation of changes to follower count
-        when a post is disliked.
-        changes_to_follower_on_dislike_skewShape (int): Skew shape of changes to follower count distribution
-        when a post is disliked.
-        changes_to_follower_on_dislike_min (int): Minimum changes to follower count when a post is disliked.
-        changes_to_follower_on_dislike_max (int): Maximum changes to follower count when a post is disliked.
-
-        changes_to_follower_on_share_mean (float): Mean of changes to follower count when a post is shared.
-        changes_to_follower_on_share_std_deviation (float): Standard deviation of changes to follower count
-        when a post is shared.
-        changes_to_follower_on_share_skewShape (int): Skew shape of changes to follower count distribution
-        when a post is shared.
-        changes_to_follower_on_share_min (int): Minimum changes to follower count when a post is shared.
-        changes_to_follower_on_share_max (int): Maximum changes to follower count when a post is shared.
-
-        changes_to_follower_on_flag_mean (float): Mean of changes to follower count when a post is flagged.
-        changes_to_follower_on_flag_std_deviation (float): Standard deviation of changes to follower count
-        when a post is flagged.
-        changes_to_follower_on_flag_skewShape (int): Skew shape of changes to follower count distribution
-        when a post is flagged.
-        changes_to_follower_on_flag_min (int): Minimum changes to follower count when a post is flagged.
-        changes_to_follower_on_flag_max (int): Maximum changes to follower count when a post is flagged.
-
-        changes_to_credibility_on_like_mean (float): Mean of changes to credibility score when a post is liked.
-        changes_to_credibility_on_like_std_deviation (float): Standard deviation of changes to credibility score
-        when a post is liked.
-        changes_to_credibility_on_like_skewShape (int): Skew shape of changes to credibility score distribution
-        when a post is liked.
-        changes_to_credibility_on_like_min (int): Minimum changes to credibility score when a post is liked.
-        changes_to_credibility_on_like_max (int): Maximum changes to credibility score when a post is liked.
-
-        changes_to_credibility_on_dislike_mean (float): Mean of changes to credibility score when a post is disliked.
-        changes_to_credibility_on_dislike_std_deviation (float): Standard deviation of changes to credibility score
-        when a post is disliked.
-        changes_to_credibility_on_dislike_skewShape (int): Skew shape of changes to credibility score distribution
-        when a post is disliked.
-        changes_to_credibility_on_dislike_min (int): Minimum changes to credibility score when a post is disliked.
-        changes_to_credibility_on_dislike_max (int): Maximum changes to credibility score when a post is disliked.
-
-        changes_to_credibility_on_share_mean (float): Mean of changes to credibility score when a post is shared.
-        changes_to_credibility_on_share_std_deviation (float): Standard deviation of changes to credibility score
-        when a post is shared.
-        changes_to_credibility_on_share_skewShape (int): Skew shape of changes to credibility score distribution
-        when a post is shared.
-        changes_to_credibility_on_share_min (int): Minimum changes to credibility score when a post is shared.
-        changes_to_credibility_on_share_max (int): Maximum changes to credibility score when a post is shared.
-
-        changes_to_credibility_on_flag_mean (float): Mean of changes to credibility score when a post is flagged.
-        changes_to_credibility_on_flag_std_deviation (float): Standard deviation of changes to"""
+        follower_deltas (dict): The follower-change distributions per
+        reaction. One JSON object keyed by reaction name ("like",
+        "dislike", "share", "flag"), each holding the five stats of the
+        distribution ("mean", "std_deviation", "skew_shape", "min",
+        "max").
+        credibility_deltas (dict): The credibility-change distributions
+        per reaction, same shape as follower_deltas.
+
+        reaction_counts (dict): The initial-reaction-count
+        distributions per reaction, same shape as follower_deltas.
+
+    The three stat families used to span 60 individual columns
+    (changes_to_follower_on_* / changes_to_credibility_on_* /
+    number_of_reactions_on_*); every SELECT on posts carried all of them
+    even when only the content was needed. Collapsed into the three JSON
+    columns above, a post row ships three values instead of 60. The
+    legacy column names remain readable as properties (see the shim loop
+    below the class).
+    """
 
     __tablename__ = "posts"
 
+    # headline/content are free text read on every feed scan; the
+    # COMPRESSED row format cuts the pages InnoDB has to pull for them.
+    __table_args__ = {"mysql_row_format": "COMPRESSED"}
+
     fk_linked_study: Mapped[str] = mapped_column(
-        String(primary_key_size), ForeignKey("{}.id".format(Study.__tablename__))
+        String(primary_key_size),
+        ForeignKey(Study.id, ondelete="CASCADE"),
+        index=True,
     )
     headline: Mapped[str] = mapped_column(Text)
     content: Mapped[str] = mapped_column(Text)
     is_true: Mapped[bool] = mapped_column(Boolean)
 
-    changes_to_follower_on_like_mean: Mapped[float] = mapped_column(Float, default=1.0)
-    changes_to_follower_on_like_std_deviation: Mapped[float] = mapped_column(
-        Float, default=0.5
-    )
-    changes_to_follower_on_like_skewShape: Mapped[int] = mapped_column(
-        Integer, default=0
-    )
-    changes_to_follower_on_like_min: Mapped[int] = mapped_column(
-        Integer, default=-100
-    )
-    changes_to_follower_on_like_max: Mapped[int] = mapped_column(
-        Integer, default=100
-    )
-
-    changes_to_follower_on_dislike_mean: Mapped[float] = mapped_column(
-        Float, default=-1
-    )
-    changes_to_follower_on_dislike_std_deviation: Mapped[float] = mapped_column(
-        Float, default=0.5
-    )
-    changes_to_follower_on_dislike_skewShape: Mapped[int] = mapped_column(
-        Integer, default=0
-    )
-    changes_to_follower_on_dislike_min: Mapped[int] = mapped_column(
-        Integer, default=-100
-    )
-    changes_to_follower_on_dislike_max: Mapped[int] = mapped_column(
-        Integer, default=100
-    )
-
-    changes_to_follower_on_share_mean: Mapped[float] = mapped_column(Float, default=5)
-    changes_to_follower_on_share_std_deviation: Mapped[float] = mapped_column(
-        Float, default=0.5
-    )
-    changes_to_follower_on_share_skewShape: Mapped[int] = mapped_column(
-        Integer, default=0
-    )
-    changes_to_follower_on_share_min: Mapped[int] = mapped_column(
-        Integer, default=-100
-    )
-    changes_to_follower_on_share_max: Mapped[int] = mapped_column(
-        Integer, default=100
-    )
-
-    changes_to_follower_on_flag_mean: Mapped[float] = mapped_column(Float, default=-5)
-    changes_to_follower_on_flag_std_deviation: Mapped[float] = mapped_column(
-        Float, default=0
-    )
-    changes_to_follower_on_flag_skewShape: Mapped[int] = mapped_column(
-        Integer, default=0
-    )
-    changes_to_follower_on_flag_min: Mapped[int] = mapped_column(
-        Integer, default=-100
-    )
-    changes_to_follower_on_flag_max: Mapped[int] = mapped_column(
-        Integer, default=100
-    )
-
-    changes_to_credibility_on_like_mean: Mapped[float] = mapped_column(
-        Float, default=1.0
-    )
-    changes_to_credibility_on_like_std_deviation: Mapped[float] = mapped_column(
-        Float, default=0.5
-    )
-    changes_to_credibility_on_like_skewShape: Mapped[int] = mapped_column(
-        Integer, default=0
-    )
-    changes_to_credibility_on_like_min: Mapped[int] = mapped_column(
-        Integer, default=-100
-    )
-    changes_to_credibility_on_like_max: Mapped[int] = mapped_column(
-        Integer, default=100
-    )
-
-    changes_to_credibility_on_dislike_mean: Mapped[float] = mapped_column(
-        Float, default=-1
-    )
-    changes_to_credibility_on_dislike_std_deviation: Mapped[float] = mapped_column(
-        Float, default=0.5
-    )
-    changes_to_credibility_on_dislike_skewShape: Mapped[int] = mapped_column(
-        Integer, default=0
-    )
-    changes_to_credibility_on_dislike_min: Mapped[int] = mapped_column(
-        Integer, default=-100
-    )
-    changes_to_credibility_on_dislike_max: Mapped[int] = mapped_column(
-        Integer, default=100
-    )
-
-    changes_to_credibility_on_share_mean: Mapped[float] = mapped_column(
-        Float, default=5
-    )
-    changes_to_credibility_on_share_std_deviation: Mapped[float] = mapped_column(
-        Float, default=0.5
-    )
-    changes_to_credibility_on_share_skewShape: Mapped[int] = mapped_column(
-        Integer, default=0
-    )
-    changes_to_credibility_on_share_min: Mapped[int] = mapped_column(
-        Integer, default=-100
-    )
-    changes_to_credibility_on_share_max: Mapped[int] = mapped_column(
-        Integer, default=100
-    )
-
-    changes_to_credibility_on_flag_mean: Mapped[float] = mapped_column(
-        Float, default=-5
-    )
-    changes_to_credibility_on_flag_std_deviation: Mapped[float] = mapped_column(
-        Float, default=0
-    )
-    changes_to_credibility_on_flag_skewShape: Mapped[int] = mapped_column(
-        Integer, default=0
-    )
-    changes_to_credibility_on_flag_min: Mapped[int] = mapped_column(
-        Integer, default=-100
-    )
-    changes_to_credibility_on_flag_max: Mapped[int] = mapped_column(
-        Integer, default=100
-    )
-    number_of_reactions_on_like_mean: Mapped[float] = mapped_column(
-        Float, default=1.0
-    )
-    number_of_reactions_on_like_std_deviation: Mapped[float] = mapped_column(
-        Float, default=0.5
-    )
-    number_of_reactions_on_like_skewShape: Mapped[int] = mapped_column(
-        Integer, default=0
-    )
-    number_of_reactions_on_like_min: Mapped[int] = mapped_column(
-        Integer, default=-1000
-    )
-    number_of_reactions_on_like_max: Mapped[int] = mapped_column(
-        Integer, default=1000
-    )
-    number_of_reactions_on_dislike_mean: Mapped[float] = mapped_column(
-        Float, default=-1
-    )
-    number_of_reactions_on_dislike_std_deviation: Mapped[float] = mapped_column(
-        Float, default=0.5
-    )
-    number_of_reactions_on_dislike_skewShape: Mapped[int] = mapped_column(
-        Integer, default=0
-    )
-    number_of_reactions_on_dislike_min: Mapped[int] = mapped_column(
-        Integer, default=-10000
-    )
-    number_of_reactions_on_dislike_max: Mapped[int] = mapped_column(
-        Integer, default=1000
-    )
-    number_of_reactions_on_share_mean: Mapped[float] = mapped_column(
-        Float, default=5
-    )
-    number_of_reactions_on_share_std_deviation: Mapped[float] = mapped_column(
-        Float, default=0.5
-    )
-    number_of_reactions_on_share_skewShape: Mapped[int] = mapped_column(
-        Integer, default=0
-    )
-    number_of_reactions_on_share_min: Mapped[int] = mapped_column(
-        Integer, default=-1000
-    )
-    number_of_reactions_on_share_max: Mapped[int] = mapped_column(
-        Integer, default=1000
-    )
-    number_of_reactions_on_flag_mean: Mapped[float] = mapped_column(
-        Float, default=-5
-    )
-    number_of_reactions_on_flag_std_deviation: Mapped[float] = mapped_column(
-        Float, default=0
-    )
-    number_of_reactions_on_flag_skewShape: Mapped[int] = mapped_column(
-        Integer, default=0
-    )
-    number_of_reactions_on_flag_min: Mapped[int] = mapped_column(
-        Integer, default=-1000
-    )
-    number_of_reactions_on_flag_max: Mapped[int] = mapped_column(
-        Integer, default=1000
-    )
-
-    linked_study = relationship(Study.__name__)
+    follower_deltas: Mapped[dict] = mapped_column(
+        JSON,
+        default=dict,
+        doc="Follower-change distribution per reaction, keyed by reaction "
+            "name with the five distribution stats per entry.",
+    )
+    credibility_deltas: Mapped[dict] = mapped_column(
+        JSON,
+        default=dict,
+        doc="Credibility-change distribution per reaction, same shape as "
+            "follower_deltas.",
+    )
+
+    reaction_counts: Mapped[dict] = mapped_column(
+        JSON,
+        default=dict,
+        doc="Initial-reaction-count distribution per reaction, same shape "
+            "as follower_deltas.",
+    )
+
+    linked_study = relationship(Study.__name__, back_populates="posts")
+    comments = relationship(
+        "Comment", back_populates="linked_post", passive_deletes=True
+    )
+
+
+def _delta_shim(column_name: str, reaction: str, stat_key: str) -> property:
+    """Read-only property exposing one stat of a delta JSON column under
+    its legacy flat-column name."""
+
+    def _get(self):
+        return getattr(self, column_name)[reaction][stat_key]
+
+    return property(_get)
+
+
+# Keep the 60 legacy stat attribute names readable so existing consumers
+# (exports, analysis scripts) don't need to know about the JSON layout.
+# Writes go through the JSON columns directly.
+for _column, _prefix in (
+        ("follower_deltas", "changes_to_follower_on"),
+        ("credibility_deltas", "changes_to_credibility_on"),
+        ("reaction_counts", "number_of_reactions_on"),
+):
+    for _reaction in ("like", "dislike", "share", "flag"):
+        for _suffix, _stat_key in (
+                ("mean", "mean"),
+                ("std_deviation", "std_deviation"),
+                ("skewShape", "skew_shape"),
+                ("min", "min"),
+                ("max", "max"),
+        ):
+            setattr(
+                Post,
+                f"{_prefix}_{_reaction}_{_suffix}",
+                _delta_shim(_column, _reaction, _stat_key),
+            )
 
 
 class Comment(DatabaseBaseClass):
@@ -819,74 +824,59 @@ class Comment(DatabaseBaseClass):
     Attributes:
         sourceName (Mapped[str]): The source name of the comment.
         message (Mapped[str]): The message of the comment.
-        number_of_reaction_like_mean (Mapped[float]): The mean number of likes for the comment.
-        number_of_reaction_like_std_deviation (Mapped[float]): The standard deviation of the number of likes.
-        number_of_reaction_like_skewShape (Mapped[int]): The skewness shape of the number of likes.
-        number_of_reaction_like_min (Mapped[int]): The minimum number of likes.
-        number_of_reaction_like_max (Mapped[int]): The maximum number of likes.
-        number_of_reaction_dislike_mean (Mapped[float]): The mean number of dislikes.
-        number_of_reaction_dislike_std_deviation (Mapped[float]): The standard deviation of the number of dislikes.
-        number_of_reaction_dislike_skew_shape (Mapped[int]): The skewness shape of the number of dislikes.
-        number_of_reaction_dislike_min (Mapped[int]): The minimum number of dislikes.
-        number_of_reaction_dislike_max (Mapped[int]): The maximum number of dislikes.
-        number_of_reaction_share_mean (Mapped[float]): The mean number of shares.
-        number_of_reaction_share_std_deviation (Mapped[float]): The standard deviation of the number of shares.
-        number_of_reaction_share_skew_shape (Mapped[int]): The skewness shape of the number of shares.
-        number_of_reaction_share_min (Mapped[int]): The minimum number of shares.
-        number_of_reaction_share_max (Mapped[int]): The maximum number of shares.
-        number_of_reaction_flags_mean (Mapped[float]): The mean number of flags.
-        number_of_reaction_flags_std_deviation (Mapped[float]): The standard deviation of the number of flags.
-        number_of_reaction_flags_skew_shape (Mapped[int]): The skewness shape of the number of flags.
-        number_of_reaction_flags_min (Mapped[int]): The minimum number of flags.
-        number_of_reaction_flags_max (Mapped[int]): The maximum number of flags.
+        reaction_counts (Mapped[dict]): The reaction-count distributions
+        per reaction, same shape as Post.follower_deltas.
         fk_linked_post (Mapped[str]): The foreign key of the linked post.
         linked_post: The linked post object associated with the comment.
 
+    The reaction stats used to span 20 individual number_of_reaction_*
+    columns (with naming quirks of their own: a "flags" family and a
+    camelCase like skew). They are collapsed into the one JSON column;
+    the legacy names remain readable as properties (see the shim loop
+    below the class).
     """
 
     __tablename__ = "comments"
 
     sourceName: Mapped[str] = mapped_column(Text)
     message: Mapped[str] = mapped_column(Text)
-    number_of_reaction_like_mean: Mapped[float] = mapped_column(Float, default=0)
-    number_of_reaction_like_std_deviation: Mapped[float] = mapped_column(
-        Float, default=0.5
-    )
-    number_of_reaction_like_skewShape: Mapped[int] = mapped_column(Integer, default=0)
-    number_of_reaction_like_min: Mapped[int] = mapped_column(Integer, default=0)
-    number_of_reaction_like_max: Mapped[int] = mapped_column(Integer, default=0)
-
-    number_of_reaction_dislike_mean: Mapped[float] = mapped_column(Float, default=0)
-    number_of_reaction_dislike_std_deviation: Mapped[float] = mapped_column(
-        Float, default=0.5
-    )
-    number_of_reaction_dislike_skew_shape: Mapped[int] = mapped_column(
-        Integer, default=0
-    )
-    number_of_reaction_dislike_min: Mapped[int] = mapped_column(Integer, default=0)
-    number_of_reaction_dislike_max: Mapped[int] = mapped_column(Integer, default=0)
-
-    number_of_reaction_share_mean: Mapped[float] = mapped_column(Float, default=0)
-    number_of_reaction_share_std_deviation: Mapped[float] = mapped_column(
-        Float, default=0.5
-    )
-    number_of_reaction_share_skew_shape: Mapped[int] = mapped_column(Integer, default=0)
-    number_of_reaction_share_min: Mapped[int] = mapped_column(Integer, default=0)
-    number_of_reaction_share_max: Mapped[int] = mapped_column(Integer, default=0)
 
-    number_of_reaction_flags_mean: Mapped[float] = mapped_column(Float, default=0)
-    number_of_reaction_flags_std_deviation: Mapped[float] = mapped_column(
-        Float, default=0.5
+    reaction_counts: Mapped[dict] = mapped_column(
+        JSON,
+        default=dict,
+        doc="Reaction-count distribution per reaction, keyed by reaction "
+            "name with the five distribution stats per entry.",
     )
-    number_of_reaction_flags_skew_shape: Mapped[int] = mapped_column(Integer, default=0)
-    number_of_reaction_flags_min: Mapped[int] = mapped_column(Integer, default=0)
-    number_of_reaction_flags_max: Mapped[int] = mapped_column(Integer, default=0)
 
     fk_linked_post: Mapped[str] = mapped_column(
-        String(primary_key_size), ForeignKey("{}.id".format(Post.__tablename__))
-    )
-
-    linked_post = relationship(Post.__name__)
+        String(primary_key_size),
+        ForeignKey(Post.id, ondelete="CASCADE"),
+    )
+
+    linked_post = relationship(Post.__name__, back_populates="comments")
+
+
+# Comment's legacy stat names don't follow one pattern (the flag family
+# is named "flags" and the like skew is camelCase), so the reaction spelling
+# is mapped explicitly instead of reusing the Post loop.
+for _reaction, _legacy in (
+        ("like", "like"),
+        ("dislike", "dislike"),
+        ("share", "share"),
+        ("flag", "flags"),
+):
+    for _suffix, _stat_key in (
+            ("mean", "mean"),
+            ("std_deviation", "std_deviation"),
+            ("skewShape" if _reaction == "like" else "skew_shape", "skew_shape"),
+            ("min", "min"),
+            ("max", "max"),
+    ):
+        setattr(
+            Comment,
+            f"number_of_reaction_{_legacy}_{_suffix}",
+            _delta_shim("reaction_counts", _reaction, _stat_key),
+        )
 
 
 # class PostInteraction(DatabaseBaseClass):
@@ -995,8 +985,20 @@ class StudyResultFile(DatabaseBaseClass):
 
     __tablename__ = "study_results_file"
 
+    # Result blobs run to hundreds of KB of JSON; as with posts, the
+    # COMPRESSED row format trades a little CPU for far fewer pages read.
+    # The composite index serves the "results of a study, newest first"
+    # listing as a single index range scan instead of a scan-and-sort over
+    # the whole table; the session index covers lookups by session ID.
+    __table_args__ = (
+        Index("ix_srf_study_start_desc", "fk_study_ID",
+              desc("study_start_time")),
+        Index("ix_srf_session", "session_ID"),
+        {"mysql_row_format": "COMPRESSED"},
+    )
+
     fk_study_ID: Mapped[str] = mapped_column(
-        String(primary_key_size), ForeignKey("{}.id".format(Study.__tablename__))
+        String(primary_key_size), ForeignKey(Study.id)
     )
     study_ID = relationship(Study.__name__)
     study_mod_time: Mapped[int] = mapped_column(Integer)
@@ -1004,4 +1006,28 @@ class StudyResultFile(DatabaseBaseClass):
     study_start_time: Mapped[int] = mapped_column(Integer)
     study_end_time: Mapped[int] = mapped_column(Integer)
 
-    data: Mapped[dict] = mapped_column(JSON)
+    # none_as_null makes a Python None bind as SQL NULL rather than the
+    # JSON literal 'null' — against this NOT NULL column that means a
+    # missing blob fails the insert loudly instead of storing a junk
+    # value. MySQL's JSON type is already kept pre-parsed in a binary
+    # format, so reads skip the text re-parse the column would pay as TEXT.
+    data: Mapped[dict] = mapped_column(JSON(none_as_null=True))
+
+
+# Built once at import so repeated Study.get_by_id calls reuse the same
+# statement (and its compiled-cache entry) instead of rebuilding the
+# select/joinedload tree per call; only the study_id parameter changes
+# between executions. Defined after all mapped classes so the joinedload
+# options do not trigger mapper configuration before Post/Source exist.
+_STUDY_BY_ID_STMT = (
+    select(Study)
+    .options(
+        joinedload(Study.basic_settings),
+        joinedload(Study.advanced_settings),
+        joinedload(Study.ui_settings),
+        joinedload(Study.pages_settings),
+        joinedload(Study.post_selection_methods),
+        joinedload(Study.created_by),
+    )
+    .where(Study.id == bindparam("study_id"))
+)
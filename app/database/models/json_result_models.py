@@ -1,9 +1,18 @@
-from typing import List, Optional, Union
- 
-from pydantic import BaseModel
- 
- 
+from typing import Annotated, List, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Discriminator, Tag
+ 
+ 
+# Shared validation config for every result model: unknown keys are
+# dropped instead of collected, and instances are frozen — a result is
+# parsed once on upload and never mutated afterwards, so pydantic can skip
+# the assignment-validation machinery entirely.
+_RESULT_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
+
 class NumberOfReactionsModel(BaseModel):
+    model_config = _RESULT_CONFIG
+
     like: int
     dislike: int
     share: int
@@ -11,6 +20,8 @@ class NumberOfReactionsModel(BaseModel):
  
  
 class CurrentSourceModel(BaseModel):
+    model_config = _RESULT_CONFIG
+
     sourceID: str
     credibility: float
     followers: float
@@ -18,15 +29,21 @@ class CurrentSourceModel(BaseModel):
  
  
 class NumberOfReactionsCommentModel(BaseModel):
+    model_config = _RESULT_CONFIG
+
     like: int
     dislike: int
  
  
 class CommentsModel(BaseModel):
+    model_config = _RESULT_CONFIG
+
     numberOfReactions: NumberOfReactionsCommentModel
  
  
 class CurrentPostModel(BaseModel):
+    model_config = _RESULT_CONFIG
+
     postID: str
     numberOfReactions: NumberOfReactionsModel
     comments: List[CommentsModel]
@@ -34,11 +51,15 @@ class CurrentPostModel(BaseModel):
  
  
 class StatesModel(BaseModel):
+    model_config = _RESULT_CONFIG
+
     currentSource: CurrentSourceModel
     currentPost: CurrentPostModel
  
  
 class TimerModel(BaseModel):
+    model_config = _RESULT_CONFIG
+
     firstShowTime: int
     lastShowTime: Optional[int]
     lastHideTime: Optional[int]
@@ -48,25 +69,51 @@ class TimerModel(BaseModel):
  
  
 class PostReactionsModel(BaseModel):
+    model_config = _RESULT_CONFIG
+
     postID: Optional[int]
     reactions: List[str]
     timer: Optional[TimerModel]
  
  
 class CommentReactionsModel(BaseModel):
+    model_config = _RESULT_CONFIG
+
     commentID: int
     reactions: List[str]
     timer: TimerModel
  
  
+def _post_reaction_tag(value) -> str:
+    """Dispatch a post reaction entry by its shape: the front end sends either
+    a full object or a bare reaction name such as "like". Tagging on the input
+    type picks the right union member directly, so a string entry is never
+    trial-validated as a PostReactionsModel and a malformed object reports only
+    the model's own errors instead of both union branches."""
+    return "skipped" if isinstance(value, str) else "reacted"
+
+
+PostReactionEntry = Annotated[
+    Union[
+        Annotated[PostReactionsModel, Tag("reacted")],
+        Annotated[str, Tag("skipped")],
+    ],
+    Discriminator(_post_reaction_tag),
+]
+
+
 class InteractionsModel(BaseModel):
-    postReactions: List[Union[PostReactionsModel, str]]
+    model_config = _RESULT_CONFIG
+
+    postReactions: List[PostReactionEntry]
     commentReactions: List[CommentReactionsModel]
     comment: Optional[str]
     timer: TimerModel
  
  
 class ParticipantModel(BaseModel):
+    model_config = _RESULT_CONFIG
+
     participantID: str
     credibility: float
     followers: float
@@ -76,6 +123,8 @@ class ParticipantModel(BaseModel):
  
  
 class JSONResultModel(BaseModel):
+    model_config = _RESULT_CONFIG
+
     studyID: str
     studyModTime: int
     sessionID: str
@@ -84,4 +133,12 @@ class JSONResultModel(BaseModel):
     states: List[StatesModel]
     participant: ParticipantModel
     completionCode: str
-    savedResults: bool
\ No newline at end of file
+    savedResults: bool
+
+
+# Build the pydantic core schema at import time and keep a handle on the
+# compiled validator, mirroring json_study_models, so upload hot paths can
+# validate payloads without re-entering the BaseModel constructor.
+JSONResultModel.model_rebuild()
+
+RESULT_VALIDATOR = JSONResultModel.__pydantic_validator__
\ No newline at end of file
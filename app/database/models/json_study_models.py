@@ -19,6 +19,62 @@ class ReactionFullModel(BaseModel):
     max: Optional[int] = Field(default=1000)
 
 
+class ReactionSetModel(BaseModel):
+    """
+    One distribution per reaction. The follower changes, credibility changes
+    and reaction counts of a post all share this exact shape, so the single
+    class stands in for all three and pydantic compiles its validator once.
+
+    Attributes:
+        like (ReactionFullModel)
+        dislike (ReactionFullModel)
+        share (ReactionFullModel)
+        flag (ReactionFullModel)
+    """
+
+    like: ReactionFullModel
+    dislike: ReactionFullModel
+    share: ReactionFullModel
+    flag: ReactionFullModel
+
+
+class ContentModel(BaseModel):
+    """
+    Attributes:
+        type (Optional[str]): Defaults to None.
+    """
+
+    type: Optional[str] = None
+
+
+class NumberOfReactionsLightModel(BaseModel):
+    """
+    Attributes:
+        like (ReactionFullModel)
+        dislike (ReactionFullModel)
+        flag (Optional[ReactionFullModel]): Defaults to None
+        share (Optional[ReactionFullModel]):  Defaults to None
+    """
+
+    like: ReactionFullModel
+    dislike: ReactionFullModel
+    flag: Optional[ReactionFullModel] = None
+    share: Optional[ReactionFullModel] = None
+
+
+class CommentModel(BaseModel):
+    """
+    Attributes:
+        sourceName (str)
+        message (str)
+        numberOfReactions (NumberOfReactionsLightModel)
+    """
+
+    sourceName: str
+    message: str
+    numberOfReactions: NumberOfReactionsLightModel
+
+
 class PostModel(BaseModel):
     """
     Attributes:
@@ -27,100 +83,36 @@ class PostModel(BaseModel):
         content (str or ContentModel, optional):
             It can be a string or a ContentModel object. Defaults to None.
         isTrue (bool)
-        changesToFollowers (ChangesToFollowersModel)
-        changesToCredibility (ChangesToCredibilityModel)
-        numberOfReactions (NumberOfReactionsModel)
+        changesToFollowers (ReactionSetModel)
+        changesToCredibility (ReactionSetModel)
+        numberOfReactions (ReactionSetModel)
         comments (list of CommentModel, optional): Defaults to None
     """
 
-    class ContentModel(BaseModel):
-        """
-        Attributes:
-            type (Optional[str]): Defaults to None.
-        """
-
-        type: Optional[str] = None
-
-    class CommentModel(BaseModel):
-        """
-        Attributes:
-            sourceName (str)
-            message (str)
-            numberOfReactions (NumberOfReactionsLightModel)
-        """
-
-        class NumberOfReactionsLightModel(BaseModel):
-            """
-            Attributes:
-                like (ReactionFullModel)
-                dislike (ReactionFullModel)
-                flag (Optional[ReactionFullModel]): Defaults to None
-                share (Optional[ReactionFullModel]):  Defaults to None
-            """
-
-            like: ReactionFullModel
-            dislike: ReactionFullModel
-            flag: Optional[ReactionFullModel] = None
-            share: Optional[ReactionFullModel] = None
-
-        sourceName: str
-        message: str
-        numberOfReactions: NumberOfReactionsLightModel
-
-    # ___ end CommentModel ___
-
-    class NumberOfReactionsModel(BaseModel):
-        """
-        Attributes:
-            like (ReactionFullModel)
-            dislike (ReactionFullModel)
-            share (ReactionFullModel)
-            flag (ReactionFullModel)
-        """
-
-        like: ReactionFullModel
-        dislike: ReactionFullModel
-        share: ReactionFullModel
-        flag: ReactionFullModel
-
-    class ChangesToCredibilityModel(BaseModel):
-        """
-        Attributes:
-            like (ReactionFullModel)
-            dislike (ReactionFullModel)
-            share (ReactionFullModel)
-            flag (ReactionFullModel)
-        """
-
-        like: ReactionFullModel
-        dislike: ReactionFullModel
-        share: ReactionFullModel
-        flag: ReactionFullModel
-
-    class ChangesToFollowersModel(BaseModel):
-        """
-        Attributes:
-            like (ReactionFullModel)
-            dislike (ReactionFullModel)
-            share (ReactionFullModel)
-            flag (ReactionFullModel)
-        """
-
-        like: ReactionFullModel
-        dislike: ReactionFullModel
-        share: ReactionFullModel
-        flag: ReactionFullModel
-
     id: str
     headline: Optional[str]
     content: Optional[Union[str, ContentModel]]
     isTrue: bool
-    changesToFollowers: ChangesToFollowersModel
-    changesToCredibility: ChangesToCredibilityModel
-    numberOfReactions: NumberOfReactionsModel
+    changesToFollowers: ReactionSetModel
+    changesToCredibility: ReactionSetModel
+    numberOfReactions: ReactionSetModel
     comments: Optional[List[CommentModel]] = None
 
 
+class LinearRelationshipModel(BaseModel):
+    """
+    Represents a linear relationship between two variables.
+    The model is defined by its slope and intercept.
+
+    Attributes:
+        slope (float)
+        intercept (int)
+    """
+
+    slope: float
+    intercept: int
+
+
 class SourcePostSelectionMethodModel(BaseModel):
     """
     Attributes:
@@ -128,21 +120,60 @@ class SourcePostSelectionMethodModel(BaseModel):
         linearRelationship (LinearRelationshipModel)
     """
 
-    class LinearRelationshipModel(BaseModel):
-        """
-        Represents a linear relationship between two variables.
-        The model is defined by its slope and intercept.
+    type: str
+    linearRelationship: LinearRelationshipModel
 
-        Attributes:
-            slope (float)
-            intercept (int)
-        """
 
-        slope: float
-        intercept: int
+class AvatarModel(BaseModel):
+    """
+    Attributes:
+        type (str)
+    """
 
     type: str
-    linearRelationship: LinearRelationshipModel
+
+
+class StyleModel(BaseModel):
+    """
+    Attributes:
+        backgroundColor (str)
+    """
+
+    backgroundColor: str
+
+
+class FollowersModel(BaseModel):
+    """
+    Attributes:
+        mean (int)
+        stdDeviation (int)
+        skewShape (int)
+        min (int)
+        max (int)
+    """
+
+    mean: int
+    stdDeviation: int
+    skewShape: int
+    min: int
+    max: int
+
+
+class CredibilityModel(BaseModel):
+    """
+    Attributes:
+        mean (int)
+        stdDeviation (int)
+        skewShape (int)
+        min (int)
+        max (int)
+    """
+
+    mean: int
+    stdDeviation: int
+    skewShape: int
+    min: int
+    max: int
 
 
 class SourcesModel(BaseModel):
@@ -160,54 +191,6 @@ class SourcesModel(BaseModel):
         truePostPercentage (int)
     """
 
-    class AvatarModel(BaseModel):
-        """
-        Attributes:
-            type (str)
-        """
-
-        type: str
-
-    class StyleModel(BaseModel):
-        """
-        Attributes:
-            backgroundColor (str)
-        """
-
-        backgroundColor: str
-
-    class FollowersModel(BaseModel):
-        """
-        Attributes:
-            mean (int)
-            stdDeviation (int)
-            skewShape (int)
-            min (int)
-            max (int)
-        """
-
-        mean: int
-        stdDeviation: int
-        skewShape: int
-        min: int
-        max: int
-
-    class CredibilityModel(BaseModel):
-        """
-        Attributes:
-            mean (int)
-            stdDeviation (int)
-            skewShape (int)
-            min (int)
-            max (int)
-        """
-
-        mean: int
-        stdDeviation: int
-        skewShape: int
-        min: int
-        max: int
-
     id: str
     linked_study_id: Optional[str] = None
     file_name: Optional[str] = None
@@ -262,6 +245,32 @@ class AdvancedSettingsModel(BaseModel):
     genRandomDefaultAvatars: bool
 
 
+class CommentEnabledReactionsModel(BaseModel):
+    """
+    Attributes:
+        like (bool)
+        dislike (bool)
+    """
+    like: bool
+    dislike: bool
+
+
+class PostEnabledReactionsModel(BaseModel):
+    """
+     Attributes:
+         like (bool)
+         dislike (bool)
+         share (bool)
+         flag (bool)
+         skip (bool)
+     """
+    like: bool
+    dislike: bool
+    share: bool
+    flag: bool
+    skip: bool
+
+
 class UiSettingsModel(BaseModel):
     """
     Attributes:
@@ -276,30 +285,6 @@ class UiSettingsModel(BaseModel):
 
     """
 
-    class CommentEnabledReactionsModel(BaseModel):
-        """
-        Attributes:
-            like (bool)
-            dislike (bool)
-        """
-        like: bool
-        dislike: bool
-
-    class PostEnabledReactionsModel(BaseModel):
-        """
-         Attributes:
-             like (bool)
-             dislike (bool)
-             share (bool)
-             flag (bool)
-             skip (bool)
-         """
-        like: bool
-        dislike: bool
-        share: bool
-        flag: bool
-        skip: bool
-
     displayPostsInFeed: bool
     displayFollowers: bool
     displayCredibility: bool
@@ -384,3 +369,13 @@ class JSONStudyLightModel(BaseModel):
     advancedSettings: AdvancedSettingsModel
     pagesSettings: PagesSettingsModel
     sourcePostSelectionMethod: SourcePostSelectionMethodModel
+
+
+# Force the pydantic core-schema build once at import time, so the first
+# request does not pay for it, and expose the compiled validator for hot
+# paths that want to validate a payload without going through the BaseModel
+# constructor machinery.
+JSONStudyModel.model_rebuild()
+JSONStudyLightModel.model_rebuild()
+
+STUDY_VALIDATOR = JSONStudyModel.__pydantic_validator__
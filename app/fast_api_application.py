@@ -1,14 +1,46 @@
 from __future__ import annotations
 
 import os
-from typing import Type, ForwardRef
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Type, ForwardRef
 
 from dotenv import load_dotenv
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
-from api.routers.router_base import RouterBase
-from database.blob_storage import BlobStorage
-from database.database import Database
+# Only needed for annotations (resolved lazily via the __future__ import
+# above). The real imports happen inside init_app: Database drags in the
+# whole SQLAlchemy model graph and BlobStorage the Azure SDK, and neither
+# should be paid for by merely importing this module.
+if TYPE_CHECKING:
+    from api.routers.router_base import RouterBase
+    from database.blob_storage import BlobStorage
+    from database.database import Database
+
+
+@lru_cache(maxsize=1)
+def _load_env_once() -> str:
+    """
+    Locate and load the .env file exactly once per process.
+
+    find_dotenv walks the filesystem upwards and load_dotenv re-parses the
+    file; neither needs to run again for subsequent wrapper constructions,
+    so the resolved path is cached and returned.
+
+    :return: The path of the loaded .env file.
+    :raise FileNotFoundError: If no .env file could be located.
+    """
+    from dotenv import find_dotenv
+
+    dotenv_path = find_dotenv()
+    if not dotenv_path:
+        raise FileNotFoundError(
+            ".env file not found. Create a .env in the root directory."
+        )
+
+    load_dotenv(dotenv_path)
+    return dotenv_path
 
 
 class FastAPIWrapper:
@@ -22,7 +54,6 @@ class FastAPIWrapper:
         database (Database): The database instance.
         logger (logging.Logger): The general logger instance.
         blob_storage (BlobStorage): The blob storage instance.
-        app_instance (FastAPI): The FastAPI application instance stored as a Class variable.
         _development_mode (bool): Indicates if the application is in development mode.
 
     Methods:
@@ -33,17 +64,15 @@ class FastAPIWrapper:
         get_db_url() -> str: Retrieves the database URL based on the current development mode.
         get_db_url_remote() -> str: Returns the database URL for a remote database connection.
         get_db_url_dev() -> str: Returns the development local database URL.
-        get_app() -> FastAPI: Returns the FastAPI application instance.
         register_new_router(router_class: Type[RouterBase], tags: [], prefix="/"): Registers a new router.
         configure_routes() -> None: Configures routes for all routers.
         mount_routers() -> None: Mounts the routers on the FastAPI instance.
-        run(host: str, port: int) -> None: Configures the routes, mounts the routers, and starts the server.
+        run(host: str, port: int) -> None: Starts the server.
     """
     fast_api: FastAPI
     database: Database
     logger: ForwardRef("logging.Logger")
     blob_storage: BlobStorage = None
-    app_instance: FastAPI = None
     # cloud_resources_accessor: CloudResourcesAccessor = None
     _development_mode: bool = True
 
@@ -55,13 +84,9 @@ class FastAPIWrapper:
         )
 
         try:
-            from dotenv import find_dotenv
-            dotenv_path = find_dotenv()
-            if not dotenv_path:
-                raise FileNotFoundError(".env file not found. Create a .env in the root directory.")
-
-            # Load the .env file
-            load_dotenv(dotenv_path)
+            # Cached: the filesystem walk and the parse only happen on the
+            # first construction in the process.
+            _load_env_once()
 
         except FileNotFoundError as e:
             self.logger.error(".env file not found.")
@@ -74,27 +99,93 @@ class FastAPIWrapper:
             raise e
 
         FastAPIWrapper._development_mode = development_mode
-        self.routers = {}
+        # Registration order is what mounting iterates; the set only backs
+        # the duplicate-class check, so each name is hashed exactly once.
+        self.routers = []
+        self._registered_router_names = set()
 
         self.init_app(development_mode)
         self.build_routers()
+        # Routes and middleware are wired here, exactly once: run() only
+        # starts Uvicorn, so calling it again cannot duplicate the
+        # middleware stack or re-mount every router.
+        self.configure_routes()
+        self.mount_routers()
+
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        """
+        Acquire and release the application's external resources.
 
-        assert (
-                FastAPIWrapper.app_instance is None
-        ), "Trying to create a second FastAPI application."
-        FastAPIWrapper.app_instance = self
+        Runs when the server actually starts serving, not when the wrapper
+        is constructed: building the app for tooling or tests touches
+        neither the database nor the blob store, and a clean shutdown
+        returns the pooled connections.
+        """
+        from database.database import Database
 
-    def init_app(self, development_mode: bool = False) -> None:
         self.database = Database(self.get_db_url())
 
-        if self._development_mode:
+        # Seeding issues synchronous SQL writes, so it stays out of every
+        # dev reload unless explicitly requested; set SEED_DEV_USER=1 the
+        # first time a fresh database needs the debug account.
+        if self._development_mode and os.getenv("SEED_DEV_USER") == "1":
             self.database.generate_debug_test_user()
 
-        blob_connection_string = os.getenv("BLOB_CONNECTION_STRING")
+        from database.blob_storage import BlobStorage
+
+        self.blob_storage = BlobStorage(os.getenv("BLOB_CONNECTION_STRING"))
 
-        self.blob_storage = BlobStorage(blob_connection_string)
+        yield
+
+        await self.blob_storage.aclose()
+        self.database.engine.dispose()
+
+    def init_app(self, development_mode: bool = False) -> None:
+        # orjson serializes faster than the stdlib json encoder, so every
+        # route that returns plain dicts or models benefits without changes.
+        # The database and blob storage are acquired by the lifespan hook
+        # at server startup rather than here.
+        self.fast_api = FastAPI(
+            default_response_class=ORJSONResponse, lifespan=self._lifespan
+        )
+        # Route handlers reach the wrapper through request.app.state, so no
+        # process-global is needed and several wrappers can coexist (one
+        # per test, for instance).
+        self.fast_api.state.wrapper = self
+
+        # Database errors propagate out of the query methods instead of
+        # being swallowed into empty results, so a single handler here
+        # turns them into a 503 the client can retry on.
+        from sqlalchemy.exc import SQLAlchemyError
+
+        @self.fast_api.exception_handler(SQLAlchemyError)
+        async def handle_sqlalchemy_error(request, exc: SQLAlchemyError):
+            self.logger.error(
+                "Database error while handling %s: %s", request.url.path, exc
+            )
+            return ORJSONResponse(
+                status_code=503, content={"detail": "Database unavailable"}
+            )
+
+        from fastapi.middleware.cors import CORSMiddleware
 
-        self.fast_api = FastAPI()
+        # Origins come from the environment (comma-separated), falling back
+        # to the previous wide-open default, so production can lock the list
+        # down without a code change.
+        # @todo the middleware should be secured!
+        allow_origins = [
+            origin.strip()
+            for origin in os.getenv("CORS_ALLOW_ORIGINS", "*").split(",")
+        ]
+        # noinspection PyTypeChecker
+        self.fast_api.add_middleware(
+            CORSMiddleware,
+            allow_origins=allow_origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
 
         # @todo start using the key vault + a debug mode that try to access without it
         # key_vault_url = "https://___.vault.azure.net/"
@@ -127,6 +218,7 @@ class FastAPIWrapper:
         self.register_new_router(ResultRouter, "results", "/result")
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_db_url() -> str:
         """
         Retrieve the database URL based on the current development mode.
@@ -141,6 +233,7 @@ class FastAPIWrapper:
         )
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_db_url_remote() -> str:
         """
         Return the database URL for a remote database connection.
@@ -157,6 +250,7 @@ class FastAPIWrapper:
         return f"mysql+mysqlconnector://{username}:{password}@{host}:{port}/{db_name}"
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_db_url_dev() -> str:
         """
         Returns the development local database URL.
@@ -172,87 +266,70 @@ class FastAPIWrapper:
 
         return f"mysql+mysqlconnector://{username}:{password}@{host}:{port}/{db_name}"
 
-    @staticmethod
-    def get_app() -> FastAPI:
-        return FastAPIWrapper.app_instance
-
     def register_new_router(self, router_class: Type[RouterBase], tags: [], prefix="/"):
         """
-        Register router by inserting them in the routers dictionary.
-        The created key for the dict is the name of the class, avoiding class duplicate.
+        Register a router by appending it to the routers list.
+        The class name guards against duplicate registration.
 
-        :param router_class: The class of the router to be registered. Used as key for the Dict.
+        :param router_class: The class of the router to be registered.
         @todo Verify that the tags are passed correctly to the router.
         :param tags: The list of tags associated with the router.
         :param prefix: The prefix URL for the router.
         :return: The newly registered router object.
 
         """
+        name = router_class.__name__
         try:
             # Check if the router already exists.
-            if self.routers.get(router_class.__name__) is not None:
+            if name in self._registered_router_names:
                 raise KeyError(
-                    "The key {key} for inserting the router has already been registered for the router "
-                    "{existing_router}.".format(
-                        key=router_class.__name__,
-                        existing_router=self.routers.get(
-                            router_class.__name__
-                        ).__class__.__name__,
-                    )
+                    f"The key {name} for inserting the router has already been registered."
                 )
             else:
                 # If it doesn't already exist, create it and insert it.
-                self.routers[router_class.__name__] = router_class(self, tags, prefix)
+                router = router_class(self, tags, prefix)
+                self._registered_router_names.add(name)
+                self.routers.append(router)
         except KeyError as e:
-            self.logger.error(
-                f"Router {router_class.__name__} is already registered - {e}"
+            self.logger.error(f"Router {name} is already registered - {e}")
+            router = next(
+                r for r in self.routers if r.__class__.__name__ == name
             )
         else:
-            self.logger.info(f"Registering new router: {router_class.__name__}")
+            self.logger.info(f"Registering new router: {name}")
 
-        return self.routers[router_class.__name__]
+        return router
 
     def configure_routes(self) -> None:
         """
-        Configure routes for all routers in the self.routers dictionary.
+        Configure routes for all registered routers.
 
         :return: None
         """
-        for router in self.routers.values():
+        for router in self.routers:
             router.configure_routes()
 
     def mount_routers(self) -> None:
         """
-        Mounts the routers from the self.routers dictionary on the FastAPI instance.
+        Mounts the registered routers on the FastAPI instance.
 
         :return: None
         """
-        for router in self.routers.values():
-            self.fast_api.include_router(
-                router.api_router, prefix=router.prefix, tags=[router.prefix]
-            )
+        # Each sub-router already carries its prefix and tags (set when the
+        # APIRouter was built), so its routes are complete APIRoute objects.
+        # Splicing them in directly skips include_router, which would
+        # otherwise re-construct every route and re-run the response-model
+        # introspection per route — the dominant startup cost after imports.
+        for router in self.routers:
+            self.fast_api.router.routes.extend(router.api_router.routes)
 
     def run(self, host: str, port: int) -> None:
         """
-        Configures the routes, mounts the routers, and starts the server using Uvicorn.
+        Starts the server using Uvicorn. The routes and middleware were
+        already wired during construction.
 
         :return: None
         """
-
-        from fastapi.middleware.cors import CORSMiddleware
-
-        # @todo the middleware should be secured!
-        # noinspection PyTypeChecker
-        self.fast_api.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
-
-        self.configure_routes()
-        self.mount_routers()
         import uvicorn
 
         try:
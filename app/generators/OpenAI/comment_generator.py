@@ -1,34 +1,48 @@
+import json
 from random import randint
 
 
-def generate_comment_ai(open_ai_client, post_headline, post_content) -> dict[str, str]:
+async def generate_comments_ai(
+        open_ai_client, post_headline, post_content, count: int
+) -> list[str]:
     """
-    Generate a comment using an AI model.
+    Generate several comments on one post with a single AI request.
 
-    :param open_ai_client: The OpenAI client for making API calls.
+    Asking for all of a post's comments at once in JSON mode costs one
+    round-trip and one copy of the post in the prompt, instead of one
+    request (and one prompt's worth of tokens) per comment.
+
+    :param open_ai_client: The async OpenAI client for making API calls.
     :param post_headline: The title of the social media post.
     :param post_content: The content of the social media post.
-    :return: A dictionary containing the generated comment as the value of the "message" key.
+    :param count: How many comments to generate.
+    :return: A list of generated comment messages.
     """
 
     ai_instruction = (
-        f"Write a short comment (1 sentence, maximum 280 characters) on this social media post "
+        f"Write {count} short comments (1 sentence, maximum 280 characters each) on this "
+        f"social media post "
         f"of title {post_headline} "
         f"and content {post_content}."
-        f"Make sure the comment seems realistic and related to the post."
-        f"On a scale of 1 to 100, you are {randint(0, 100)} agree with what that particular post say."
+        f"Make sure each comment seems realistic and related to the post, and that the "
+        f"comments come from different users with different opinions."
+        f"On a scale of 1 to 100, the average commenter is {randint(0, 100)} agree with "
+        f"what that particular post say."
     )
-    completion = open_ai_client.chat.completions.create(
+    completion = await open_ai_client.chat.completions.create(
         model="gpt-4o",  # "gpt-3.5-turbo",
         messages=[
             {
                 "role": "system",
-                "content": "You are a young social media user scrolling content for enjoyment.",
+                "content": "You are simulating young social media users scrolling content "
+                           "for enjoyment. Return JSON with a key 'comments' holding a "
+                           "list of comment strings.",
             },
             {"role": "user", "content": ai_instruction},
         ],
+        response_format={"type": "json_object"},
         timeout=60,
-        max_tokens=256,
+        max_tokens=128 * count,
     )
 
-    return {"message": completion.choices[0].message.content}
+    return json.loads(completion.choices[0].message.content)["comments"][:count]
@@ -1,26 +1,61 @@
+import asyncio
 import json
 import os
 import random
 import uuid
-from time import sleep
+from functools import lru_cache
 
-from openai import OpenAI
+import orjson
 
-from database.models.json_study_models import (JSONStudyModel, PostModel,
-                                               ReactionFullModel)
+from openai import AsyncOpenAI
+
+from database.models.json_study_models import (CommentModel,
+                                               JSONStudyModel,
+                                               NumberOfReactionsLightModel,
+                                               PostModel,
+                                               ReactionFullModel,
+                                               ReactionSetModel)
 from generators.OpenAI.post_generator import PostDetails, generate_post_ai
 
+# Upper bound on simultaneous OpenAI requests. Generation throughput is
+# limited by the provider's rate limits, not by the event loop; bounding
+# the in-flight calls keeps a burst of posts and comments inside them
+# without the old one-second sleep between sequential requests.
+MAX_CONCURRENT_REQUESTS = 8
+
+# One client for the whole process. Constructing AsyncOpenAI reads the
+# environment and builds an httpx client with its connection pool; sharing
+# it lets successive generation requests reuse warm TLS connections
+# instead of handshaking from scratch each time.
+_client: AsyncOpenAI | None = None
+
+
+def _get_client() -> AsyncOpenAI:
+    global _client
+    if _client is None:
+        _client = AsyncOpenAI()
+    return _client
+
 
+@lru_cache(maxsize=8)
 def load_json_template(file_name: str):
     """
     Load a JSON file and return its contents as a dictionary.
 
+    The parsed result is cached per file name: the template is static, so
+    repeated generation requests skip the disk read and the JSON parse.
+    The caller only feeds it into Pydantic validation, which builds its
+    own structures, so the cached dictionary is never mutated.
+
     :param file_name: The name of the JSON file to load.
     :return: A dictionary representing the JSON contents.
     """
     try:
-        with open(file_name, "r", encoding='utf-8') as f:
-            return json.load(f)
+        # orjson parses UTF-8 bytes directly, so the file is read in
+        # binary; its JSONDecodeError subclasses the stdlib one, keeping
+        # the handler below valid.
+        with open(file_name, "rb") as f:
+            return orjson.loads(f.read())
     except json.JSONDecodeError as e:
         print(f"JSONDecodeError: An error occurred while decoding JSON from the file '{file_name}': {e}")
     except FileNotFoundError as e:
@@ -33,26 +68,28 @@ def load_json_template(file_name: str):
     return {}
 
 
-def create_new_post(open_ai_client: OpenAI):
+async def create_new_post(open_ai_client: AsyncOpenAI, limiter: asyncio.Semaphore):
     """
-    :param open_ai_client: The client object of the OpenAI API.
+    :param open_ai_client: The async client object of the OpenAI API.
+    :param limiter: Semaphore bounding the number of in-flight OpenAI calls.
     :return: A new post created using the OpenAI API.
 
     This method takes in an instance of the OpenAI client and generates a new post using the generate_post_ai method.
     The generated post is then used to create a PostModel object with various properties such as ID, source name,
     content, headline, and reactions. The PostModel object is returned as the result of the method.
     """
-    generated_post = generate_post_ai(
-        open_ai_client,
-        PostDetails(
-            is_true_percentage=65,
-            no_hashtag=False,
-            min_char=50,
-            max_char=350,
-            specific_theme=None,
-        ),
-        verbose=False,
-    )
+    async with limiter:
+        generated_post = await generate_post_ai(
+            open_ai_client,
+            PostDetails(
+                is_true_percentage=65,
+                no_hashtag=False,
+                min_char=50,
+                max_char=350,
+                specific_theme=None,
+            ),
+            verbose=False,
+        )
     reactions_model = ReactionFullModel(
         mean=0.5, stdDeviation=0.5, skewShape=1, min=-1000, max=1000
     )
@@ -62,19 +99,19 @@ def create_new_post(open_ai_client: OpenAI):
         content=generated_post["content"],
         headline=generated_post["headline"],
         isTrue=generated_post["is_true"],
-        changesToFollowers=PostModel.ChangesToFollowersModel(
+        changesToFollowers=ReactionSetModel(
             like=reactions_model,
             dislike=reactions_model,
             share=reactions_model,
             flag=reactions_model,
         ),
-        changesToCredibility=PostModel.ChangesToCredibilityModel(
+        changesToCredibility=ReactionSetModel(
             like=reactions_model,
             dislike=reactions_model,
             share=reactions_model,
             flag=reactions_model,
         ),
-        numberOfReactions=PostModel.NumberOfReactionsModel(
+        numberOfReactions=ReactionSetModel(
             like=reactions_model,
             dislike=reactions_model,
             share=reactions_model,
@@ -84,46 +121,51 @@ def create_new_post(open_ai_client: OpenAI):
     )
 
 
-def create_new_comment(open_ai_client: OpenAI, generated_post: PostModel):
+async def create_post_comments(
+        open_ai_client: AsyncOpenAI,
+        generated_post: PostModel,
+        count: int,
+        limiter: asyncio.Semaphore,
+):
     """
-    :param open_ai_client: the OpenAI client object used for communication with the OpenAI API
+    :param open_ai_client: the async OpenAI client object used for communication with the OpenAI API
     :param generated_post: the PostModel object representing the generated post
+    :param count: how many comments to generate for the post
+    :param limiter: Semaphore bounding the number of in-flight OpenAI calls
 
     :return: None
 
-    This method creates a new comment for the given generated post.
-
-    The comment is generated using the OpenAI client and the content of the generated post. The comment message is obtained by calling the `generate_comment_ai` method from the `comment_generator` module in the OpenAI package.
+    Generate every comment of the given post with one OpenAI request.
 
-    The comment is then constructed using the following information:
-    - id: a unique identifier generated using the `uuid.uuid4()` function
-    - sourceName: a string representing the source of the comment
-    - message: the generated comment message obtained from the OpenAI API
-    - numberOfReactions: an object representing the number of reactions the comment has, including like, dislike, flag, and share. However, only the like and dislike reactions are set in this method.
-
-    The constructed comment is then appended to the comments list of the generated post.
+    All messages come back from a single `generate_comments_ai` call — one
+    round-trip and one copy of the post in the prompt regardless of how
+    many comments the post gets. Each message is then wrapped in a
+    CommentModel (uuid id, source name, like/dislike reactions only) and
+    appended to the post's comments list.
     """
-    from generators.OpenAI.comment_generator import generate_comment_ai
+    from generators.OpenAI.comment_generator import generate_comments_ai
 
-    comment_values = generate_comment_ai(
-        open_ai_client, generated_post.headline, generated_post.content
-    )
+    async with limiter:
+        messages = await generate_comments_ai(
+            open_ai_client, generated_post.headline, generated_post.content, count
+        )
 
     reactions_model = ReactionFullModel(
         mean=0.5, stdDeviation=0.5, skewShape=1, min=-1000, max=1000
     )
-    comment = PostModel.CommentModel(
-        id=str(uuid.uuid4()),
-        sourceName="S1",
-        message=comment_values["message"],
-        numberOfReactions=PostModel.CommentModel.NumberOfReactionsLightModel(
-            like=reactions_model,
-            dislike=reactions_model,
-            # flag=reactions_model,
-            # share=reactions_model
-        ),
-    )
-    generated_post.comments.append(comment)
+    for message in messages:
+        comment = CommentModel(
+            id=str(uuid.uuid4()),
+            sourceName="S1",
+            message=message,
+            numberOfReactions=NumberOfReactionsLightModel(
+                like=reactions_model,
+                dislike=reactions_model,
+                # flag=reactions_model,
+                # share=reactions_model
+            ),
+        )
+        generated_post.comments.append(comment)
 
 
 def save_json_to_file(json_study: JSONStudyModel, output_dir: str, file_name: str):
@@ -137,18 +179,23 @@ def save_json_to_file(json_study: JSONStudyModel, output_dir: str, file_name: st
     """
     os.makedirs(output_dir, exist_ok=True)
     file_path = os.path.join(output_dir, file_name)
+    # One serialization pass straight from the model; the previous
+    # json() -> loads() -> dumps() chain walked the same tree three times.
     with open(file_path, "w") as json_file:
-        json_string = json_study.json()
-        json_object = json.loads(json_string)
-        json_file.write(json.dumps(json_object, indent=4))
+        json_file.write(json_study.model_dump_json(indent=4))
 
 
-def generate_study() -> JSONStudyModel:
+async def generate_study() -> JSONStudyModel:
     """
     :return: The generated JSONStudyModel object representing the study.
 
     Generate a synthetic study using AI for test purposes.
     Save the generated study as a JSON file name <result.json> in the <./output> directory.
+
+    All post generations run concurrently, then a second concurrent wave
+    generates each post's comments with one batched request per post; the
+    semaphore keeps the number of in-flight OpenAI requests bounded, which
+    replaces the old fixed one-second sleep between sequential calls.
     """
     config = {
         "min_post": 4,
@@ -172,7 +219,8 @@ def generate_study() -> JSONStudyModel:
     result_json_study.posts = []
 
     # OpenAI also requires an API key in environment variables.
-    client = OpenAI()
+    client = _get_client()
+    limiter = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
     number_of_posts = random.randint(config["min_post"], config["max_post"])
 
@@ -181,18 +229,30 @@ def generate_study() -> JSONStudyModel:
         number_of_posts if (number_of_posts == 1) else (number_of_posts - 1)
     )
 
-    for _ in range(number_of_posts):
-        new_post = create_new_post(client)
-        result_json_study.posts.append(new_post)
-        sleep(1)  # Ensure we don't get timeout by sending to many requests
+    # First wave: every post generates concurrently.
+    result_json_study.posts = list(
+        await asyncio.gather(
+            *(create_new_post(client, limiter) for _ in range(number_of_posts))
+        )
+    )
 
-        # Generate a range up to a random number between 0 and 6
-        for _ in range(random.randint(config["min_comment"], config["max_comment"])):
-            create_new_comment(client, new_post)
-            sleep(1)
+    # Second wave: one batched request per post generates all of its
+    # comments, and the posts run concurrently. Each task appends to its
+    # own post, so the gather needs no return values.
+    comment_tasks = [
+        create_post_comments(client, post, count, limiter)
+        for post in result_json_study.posts
+        if (count := random.randint(config["min_comment"], config["max_comment"])) > 0
+    ]
+    if comment_tasks:
+        await asyncio.gather(*comment_tasks)
 
     save_json_to_file(result_json_study, "output", "result.json")
     return result_json_study
 
 
-generate_study()
+if __name__ == "__main__":
+    # Development smoke test only. Importing this module must stay free of
+    # side effects: generation is triggered per request through the AI
+    # router's /new_study endpoint, never at import time.
+    asyncio.run(generate_study())